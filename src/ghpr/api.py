@@ -1,31 +1,45 @@
 """GitHub API helpers for fetching PR/Issue data."""
 
+from functools import lru_cache
+
 from utz import proc, err
 
+from .cache import load_etag, save_etag
+from .ghclient import GhClient
+
+
+def _normalize_item_data(data: dict) -> dict:
+    """Normalize line endings in `body`."""
+    # Normalize line endings from GitHub (convert \r\n to \n)
+    if data.get('body'):
+        data['body'] = data['body'].replace('\r\n', '\n')
+    return data
+
 
-def get_item_metadata(owner: str, repo: str, number: str, item_type: str | None = None) -> tuple[dict | None, str]:
+def get_item_metadata(
+    owner: str,
+    repo: str,
+    number: str,
+    item_type: str | None = None,
+) -> tuple[dict | None, str]:
     """Get PR or Issue metadata from GitHub.
 
     Returns:
         Tuple of (metadata dict, item_type) where item_type is 'pr' or 'issue'
     """
+    fields = 'title,body,number,url'
     # Try to detect type if not specified
     if not item_type:
         # Try PR first (use err_ok to suppress GraphQL errors for issues)
         try:
             from subprocess import DEVNULL
-            data = proc.json('gh', 'pr', 'view', number, '-R', f'{owner}/{repo}', '--json', 'title,body,number,url', log=False, stderr=DEVNULL)
-            # Normalize line endings from GitHub (convert \r\n to \n)
-            if data.get('body'):
-                data['body'] = data['body'].replace('\r\n', '\n')
-            return data, 'pr'
+            data = proc.json('gh', 'pr', 'view', number, '-R', f'{owner}/{repo}', '--json', fields, log=False, stderr=DEVNULL)
+            return _normalize_item_data(data), 'pr'
         except Exception:
             # Try issue
             try:
-                data = proc.json('gh', 'issue', 'view', number, '-R', f'{owner}/{repo}', '--json', 'title,body,number,url', log=False)
-                if data.get('body'):
-                    data['body'] = data['body'].replace('\r\n', '\n')
-                return data, 'issue'
+                data = proc.json('gh', 'issue', 'view', number, '-R', f'{owner}/{repo}', '--json', fields, log=False)
+                return _normalize_item_data(data), 'issue'
             except Exception as e:
                 err(f"Error fetching PR/Issue metadata: {e}")
                 return None, item_type or 'pr'
@@ -33,11 +47,8 @@ def get_item_metadata(owner: str, repo: str, number: str, item_type: str | None
     # Use specified type
     cmd = 'pr' if item_type == 'pr' else 'issue'
     try:
-        data = proc.json('gh', cmd, 'view', number, '-R', f'{owner}/{repo}', '--json', 'title,body,number,url', log=False)
-        # Normalize line endings from GitHub (convert \r\n to \n)
-        if data.get('body'):
-            data['body'] = data['body'].replace('\r\n', '\n')
-        return data, item_type
+        data = proc.json('gh', cmd, 'view', number, '-R', f'{owner}/{repo}', '--json', fields, log=False)
+        return _normalize_item_data(data), item_type
     except Exception as e:
         err(f"Error fetching {item_type} metadata: {e}")
         return None, item_type
@@ -49,8 +60,9 @@ def get_pr_metadata(owner: str, repo: str, pr_number: str) -> dict | None:
     return data
 
 
+@lru_cache(maxsize=None)
 def get_current_github_user() -> str | None:
-    """Get the currently authenticated GitHub user."""
+    """Get the currently authenticated GitHub user (memoized; it can't change mid-process)."""
     from utz.git.gist import get_github_user
     return get_github_user()
 
@@ -58,14 +70,24 @@ def get_current_github_user() -> str | None:
 def get_item_comments(owner: str, repo: str, number: str, item_type: str) -> list[dict]:
     """Fetch all comments for a PR or Issue from GitHub.
 
+    PRs and issues share the issue-comments endpoint. The request is
+    conditional on the ETag from the previous fetch (persisted across runs),
+    so an unchanged comment list costs a 304 and no rate-limit quota. (This is
+    the REST path, used by `ghpr diff`; `pull` and `clone` fetch comments with
+    their metadata via GraphQL, `get_item_bundle`, which has no ETags.)
+
     Returns:
-        List of comment dicts with keys: id, user.login, created_at, updated_at, body
+        List of comment dicts with keys: id, html_url, user.login, created_at, updated_at, body
     """
+    path = f'/repos/{owner}/{repo}/issues/{number}/comments?per_page=100'
     try:
-        if item_type == 'pr':
-            comments = proc.json('gh', 'api', f'repos/{owner}/{repo}/issues/{number}/comments', log=False)
-        else:
-            comments = proc.json('gh', 'api', f'repos/{owner}/{repo}/issues/{number}/comments', log=False)
+        cached = load_etag(path)
+        with GhClient() as client:
+            comments = client.get(path, conditional=True, cached=cached)
+            etag = client.etag(path)
+        # Persist only a new ETag (a 200); on a 304 the stored body is already current
+        if etag and (not cached or etag[0] != cached[0]):
+            save_etag(path, *etag)
 
         # Normalize line endings in comment bodies
         for comment in comments:
@@ -78,6 +100,98 @@ def get_item_comments(owner: str, repo: str, number: str, item_type: str) -> lis
         return []
 
 
+# GraphQL query for an issue or PR's metadata plus a page of its top-level
+# comments (and the viewer's login), so `pull` and `push` get them all (and the
+# item type) in one round-trip.
+_ITEM_FIELDS = '''
+        title
+        body
+        number
+        url
+        comments(first: 100, after: $after) {
+          pageInfo { hasNextPage endCursor }
+          nodes { databaseId url author { login } createdAt updatedAt body }
+        }
+'''
+_ITEM_BUNDLE_QUERY = f'''
+query($owner: String!, $repo: String!, $num: Int!, $after: String) {{
+  viewer {{ login }}
+  repository(owner: $owner, name: $repo) {{
+    issueOrPullRequest(number: $num) {{
+      __typename
+      ... on PullRequest {{{_ITEM_FIELDS}      }}
+      ... on Issue {{{_ITEM_FIELDS}      }}
+    }}
+  }}
+}}
+'''
+
+
+def get_item_bundle(owner: str, repo: str, number: str) -> tuple[dict | None, str | None, list[dict]]:
+    """Fetch PR/Issue metadata, type, and all top-level comments via GraphQL.
+
+    One request covers the metadata and the first 100 comments; further
+    comment pages are only requested when there are more.
+
+    Returns:
+        (metadata dict, item_type, comments) in the same shapes as
+        `get_item_metadata` and `get_item_comments`; (None, None, []) on error
+    """
+    return get_push_context(owner, repo, number)[:3]
+
+
+def get_push_context(owner: str, repo: str, number: str) -> tuple[dict | None, str | None, list[dict], str | None]:
+    """Like `get_item_bundle`, plus the authenticated user's login, from the same request.
+
+    Returns:
+        (metadata dict, item_type, comments, viewer login); (None, None, [], None) on error
+    """
+    data = None
+    viewer = None
+    comments = []
+    after = None
+    while True:
+        args = ['-f', f'after={after}'] if after else []
+        try:
+            result = proc.json(
+                'gh', 'api', 'graphql',
+                '-f', f'query={_ITEM_BUNDLE_QUERY}',
+                '-f', f'owner={owner}',
+                '-f', f'repo={repo}',
+                '-F', f'num={number}',
+                *args,
+                log=False,
+            )
+            item = result['data']['repository']['issueOrPullRequest']
+        except Exception as e:
+            err(f"Error fetching PR/Issue: {e}")
+            return None, None, [], None
+        if not item:
+            err(f"Error fetching PR/Issue: {owner}/{repo}#{number} not found")
+            return None, None, [], None
+
+        page = item.pop('comments')
+        if data is None:
+            data = item
+            viewer = (result['data'].get('viewer') or {}).get('login')
+        for node in page['nodes']:
+            comments.append({
+                'id': node['databaseId'],
+                'html_url': node['url'],
+                # Deleted accounts come back with a null author
+                'user': {'login': (node['author'] or {}).get('login', 'ghost')},
+                'created_at': node['createdAt'],
+                'updated_at': node['updatedAt'],
+                'body': (node['body'] or '').replace('\r\n', '\n'),
+            })
+        if not page['pageInfo']['hasNextPage']:
+            break
+        after = page['pageInfo']['endCursor']
+
+    item_type = 'pr' if data.pop('__typename') == 'PullRequest' else 'issue'
+    return _normalize_item_data(data), item_type, comments, viewer
+
+
 def list_review_comments(owner: str, repo: str, number: str) -> list[dict]:
     """Fetch all PR review (inline) comments from GitHub, paginated.
 
@@ -0,0 +1,96 @@
+"""Caching for `gh repo view` lookups.
+
+Results are memoized per-process, and persisted under
+`$XDG_CACHE_HOME/ghpr/repo_view/` for `$GHPR_CACHE_TTL` seconds (default 10
+minutes; `0` disables the on-disk cache), so e.g. `ghpr init` followed by
+`ghpr create` only queries GitHub once.
+
+ETags (and the bodies they validate) for conditional API requests are kept
+per clone, under `<git-dir>/ghpr/etags/` (owner-only permissions, since the
+bodies may come from private repos), with no TTL (a 304 proves them current;
+`GHPR_CACHE_TTL=0` still disables them). Outside a clone they aren't persisted.
+"""
+
+import json
+from functools import lru_cache
+from hashlib import sha1
+from os import O_CREAT, O_TRUNC, O_WRONLY, environ, open as os_open
+from pathlib import Path
+from time import time
+
+from utz import proc
+
+from .gitcfg import find_git_dir
+
+DEFAULT_CACHE_TTL = 600
+REPO_VIEW_FIELDS = 'owner,name,defaultBranchRef'
+
+
+def _cache_ttl() -> float:
+    try:
+        return float(environ.get('GHPR_CACHE_TTL', DEFAULT_CACHE_TTL))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def _cache_path(repo_path: str, kind: str = 'repo_view') -> Path:
+    cache_home = environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'ghpr' / kind / f'{sha1(repo_path.encode()).hexdigest()}.json'
+
+
+@lru_cache(maxsize=None)
+def gh_repo_view(repo_path: str) -> dict:
+    """Return `gh repo view --json owner,name,defaultBranchRef`, run in `repo_path`.
+
+    Raises if `gh` fails (failures are not cached).
+    """
+    ttl = _cache_ttl()
+    cache_file = _cache_path(repo_path)
+    if ttl > 0:
+        try:
+            if time() - cache_file.stat().st_mtime < ttl:
+                return json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            pass
+
+    repo_data = proc.json('gh', 'repo', 'view', '--json', REPO_VIEW_FIELDS, cwd=repo_path, log=None)
+    if ttl > 0:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(repo_data))
+        except OSError:
+            pass
+    return repo_data
+
+
+def _etag_path(key: str) -> Path | None:
+    git_dir = find_git_dir(Path('.'))
+    if not git_dir:
+        return None
+    return git_dir / 'ghpr' / 'etags' / f'{sha1(key.encode()).hexdigest()}.json'
+
+
+def load_etag(key: str) -> tuple[str, object] | None:
+    """Return the (ETag, body) this clone last stored for API path `key`, if any."""
+    cache_file = _etag_path(key)
+    if _cache_ttl() <= 0 or not cache_file:
+        return None
+    try:
+        etag, data = json.loads(cache_file.read_text())
+        return etag, data
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_etag(key: str, etag: str, data: object) -> None:
+    """Store an (ETag, body) pair for API path `key` in this clone; best-effort."""
+    cache_file = _etag_path(key)
+    if _cache_ttl() <= 0 or not cache_file:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os_open(cache_file, O_WRONLY | O_CREAT | O_TRUNC, 0o600)
+        with open(fd, 'w') as f:
+            f.write(json.dumps([etag, data]))
+    except OSError:
+        pass
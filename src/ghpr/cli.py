@@ -2,14 +2,12 @@
 
 import re
 import sys
-import difflib
 from functools import partial
 from glob import glob
 from os import chdir, environ, unlink
 from os.path import abspath, dirname, exists, join
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
-import webbrowser
 import subprocess
 
 from click import Choice, Context, group
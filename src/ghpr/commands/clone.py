@@ -1,21 +1,31 @@
 """Clone command - clone PR/Issue to local directory."""
 
-import re
-import webbrowser
-from os import chdir, unlink, environ
-from os.path import exists
+from concurrent.futures import ThreadPoolExecutor
+from os import environ
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from click import Context
 from utz import proc, err, cd
 from utz.cli import opt, flag, arg
 
-from ..api import get_item_metadata, get_item_comments
+from ..api import get_item_bundle, get_item_metadata
 from ..comments import write_comment_file
-from ..config import get_pr_info_from_path
+from ..config import get_pr_info_from_path, set_pr_config
 from ..files import get_expected_description_filename, write_description_with_link_ref
-from ..gist import extract_gist_footer, add_gist_footer, create_gist, DEFAULT_GIST_REMOTE, find_gist_remote
-from ..patterns import parse_pr_spec, GIST_ID_PATTERN, GITHUB_ITEM_URL_PATTERN
+from ..gist import extract_gist_footer, add_gist_footer, create_gist, DEFAULT_GIST_REMOTE
+from ..patterns import parse_pr_spec, GIST_ID_PATTERN, GITHUB_ITEM_URL_PATTERN, USER_ATTACHMENT_REF_PATTERN
+
+
+# `proc` wrappers with command logging off (clone reports progress via `err`)
+def _run(*args, **kwargs):
+    return proc.run(*args, log=None, **kwargs)
+
+
+def _json(*args, **kwargs):
+    return proc.json(*args, log=None, **kwargs)
+
+
+def _output(*args, **kwargs):
+    return proc.output(*args, log=None, **kwargs)
 
 
 def _detect_current_branch_pr() -> tuple[str | None, str | None, str | None, str | None]:
@@ -28,9 +38,9 @@ def _detect_current_branch_pr() -> tuple[str | None, str | None, str | None, str
     """
     from subprocess import DEVNULL
     try:
-        data = proc.json(
+        data = _json(
             'gh', 'pr', 'view', '--json', 'number,url',
-            log=None, err_ok=True, stderr=DEVNULL,
+            err_ok=True, stderr=DEVNULL,
         )
         if data and data.get('number'):
             url = data.get('url', '')
@@ -39,7 +49,7 @@ def _detect_current_branch_pr() -> tuple[str | None, str | None, str | None, str
                 owner, repo, _, number = match.groups()
                 return owner, repo, number, 'pr'
             # Fallback: use repo view for owner/repo
-            repo_data = proc.json('gh', 'repo', 'view', '--json', 'owner,name', log=None)
+            repo_data = _json('gh', 'repo', 'view', '--json', 'owner,name')
             return repo_data['owner']['login'], repo_data['name'], str(data['number']), 'pr'
     except Exception:
         pass
@@ -69,7 +79,7 @@ def clone(
         if number and not owner:
             # Get owner/repo from current directory
             try:
-                repo_data = proc.json('gh', 'repo', 'view', '--json', 'owner,name', log=None)
+                repo_data = _json('gh', 'repo', 'view', '--json', 'owner,name')
                 owner = repo_data['owner']['login']
                 repo = repo_data['name']
             except Exception as e:
@@ -89,9 +99,14 @@ def clone(
         err("Usage: ghpr clone [NUMBER | owner/repo#NUMBER | URL]")
         exit(1)
 
-    # Get metadata and detect type
+    # Get metadata and detect type, plus (unless skipped) all top-level comments,
+    # in one GraphQL request
     err(f"Fetching {owner}/{repo}#{number}...")
-    item_data, detected_type = get_item_metadata(owner, repo, number, item_type)
+    if no_comments:
+        item_data, detected_type = get_item_metadata(owner, repo, number, item_type)
+        comments = []
+    else:
+        item_data, detected_type, comments = get_item_bundle(owner, repo, number)
     if not item_data:
         exit(1)
 
@@ -111,8 +126,10 @@ def clone(
 
     target_path = Path(directory)
 
-    # Check if directory already exists
-    if exists(target_path):
+    # Create directory (fails if it already exists)
+    try:
+        target_path.mkdir(parents=True, exist_ok=False)
+    except FileExistsError:
         err(f"Error: Directory {directory} already exists")
         exit(1)
 
@@ -120,15 +137,16 @@ def clone(
     item_label = 'issue' if detected_type == 'issue' else 'PR'
     err(f"Found {item_label}: {item_data.get('title', 'No title')}")
 
-    # Create directory and initialize git repo
-    target_path.mkdir(parents=True)
-    chdir(target_path)
-
-    proc.run('git', 'init', '-q', log=None)
+    # Initialize git repo (all git ops below target the clone via `-C`, without chdir).
+    # The path is absolute: background gist pushes may run while the main thread
+    # is `cd`'d into the clone (for `reviews.pull`), where a relative one would miss
+    target_dir = str(target_path.resolve())
+    GIT = ('git', '-C', target_dir)
+    _run(*GIT, 'init', '-q')
 
     # Create item-specific filename
     new_filename = get_expected_description_filename(owner, repo, number)
-    desc_file = Path(new_filename)
+    desc_file = target_path / new_filename
     title = item_data['title']
     body = item_data['body'] or ''
     url = item_data['url']
@@ -139,20 +157,23 @@ def clone(
     # Write using helper to avoid duplicate link definitions
     write_description_with_link_ref(desc_file, owner, repo, number, title, body_without_footer, url)
 
+    # Check for user-attachments in reference-style links (the helper only adds
+    # the item's own link def, so the in-memory body is all we need to scan)
+    has_attachments = bool(USER_ATTACHMENT_REF_PATTERN.search(body_without_footer or ''))
+
     # Store metadata in git config
-    proc.run('git', 'config', 'pr.owner', owner, log=None)
-    proc.run('git', 'config', 'pr.repo', repo, log=None)
-    proc.run('git', 'config', 'pr.number', str(number), log=None)
-    proc.run('git', 'config', 'pr.url', item_data['url'], log=None)
-    proc.run('git', 'config', 'pr.type', detected_type, log=None)
+    set_pr_config(
+        cwd=target_dir, owner=owner, repo=repo, number=number, url=item_data['url'], type=detected_type,
+    )
 
     # Initial commit
     item_label = 'issue' if detected_type == 'issue' else 'PR'
-    proc.run('git', 'add', new_filename, log=None)
-    proc.run('git', 'commit', '-m', f'Initial clone of {item_label} {owner}/{repo}#{number}', log=None)
+    _run(*GIT, 'add', new_filename)
+    _run(*GIT, 'commit', '-m', f'Initial clone of {item_label} {owner}/{repo}#{number}')
 
     # Create or use existing gist unless --no-gist was specified
     gist_url = None
+    gist_remote = None
     if not no_gist:
         gist_id = None
 
@@ -166,15 +187,15 @@ def clone(
                 err(f"Found existing gist in {item_label} description: {gist_url}")
 
                 # Store gist ID
-                proc.run('git', 'config', 'pr.gist', gist_id, log=None)
+                _run(*GIT, 'config', 'pr.gist', gist_id)
 
                 # Add gist as remote
-                proc.run('git', 'remote', 'add', DEFAULT_GIST_REMOTE, f'git@gist.github.com:{gist_id}.git', log=None)
-                proc.run('git', 'config', 'pr.gist-remote', DEFAULT_GIST_REMOTE, log=None)
+                _run(*GIT, 'remote', 'add', DEFAULT_GIST_REMOTE, f'git@gist.github.com:{gist_id}.git')
+                _run(*GIT, 'config', 'pr.gist-remote', DEFAULT_GIST_REMOTE)
 
-                # Fetch and push our version
-                proc.run('git', 'fetch', DEFAULT_GIST_REMOTE, log=None)
-                proc.run('git', 'push', '--set-upstream', DEFAULT_GIST_REMOTE, 'main', '--force', log=None)
+                # Force-push our version (overwrites the gist's main, so no fetch needed)
+                _run(*GIT, 'push', '--set-upstream', DEFAULT_GIST_REMOTE, 'refs/heads/main:refs/heads/main', '--force')
+                gist_remote = DEFAULT_GIST_REMOTE
                 err("Pushed to existing gist")
 
         # Create new gist if none exists
@@ -183,7 +204,7 @@ def clone(
 
             # Get repository visibility to determine gist visibility
             try:
-                is_private = proc.json('gh', 'api', f'repos/{owner}/{repo}', '--jq', '.private', log=None)
+                is_private = _json('gh', 'api', f'repos/{owner}/{repo}', '--jq', '.private')
                 gist_private = is_private if isinstance(is_private, bool) else True
             except Exception as e:
                 err(f"Error: Could not determine repo visibility: {e}")
@@ -192,15 +213,17 @@ def clone(
             # Create the gist
             item_label_lower = item_label.lower()
             description = f'{owner}/{repo}#{number} ({item_label_lower}) - 2-way sync via ghpr (https://github.com/runsascoded/ghpr)'
-            gist_id = create_gist(desc_file, description, is_public=not gist_private)
+            gist_id = create_gist(desc_file, description, is_public=not gist_private, store_id=False)
+            _run(*GIT, 'config', 'pr.gist', gist_id)
 
             # Add gist as remote
-            proc.run('git', 'remote', 'add', DEFAULT_GIST_REMOTE, f'git@gist.github.com:{gist_id}.git', log=None)
-            proc.run('git', 'config', 'pr.gist-remote', DEFAULT_GIST_REMOTE, log=None)
+            _run(*GIT, 'remote', 'add', DEFAULT_GIST_REMOTE, f'git@gist.github.com:{gist_id}.git')
+            _run(*GIT, 'config', 'pr.gist-remote', DEFAULT_GIST_REMOTE)
 
             # Fetch and push
-            proc.run('git', 'fetch', DEFAULT_GIST_REMOTE, log=None)
-            proc.run('git', 'push', '--set-upstream', DEFAULT_GIST_REMOTE, 'main', '--force', log=None)
+            _run(*GIT, 'fetch', DEFAULT_GIST_REMOTE)
+            _run(*GIT, 'push', '--set-upstream', DEFAULT_GIST_REMOTE, 'main', '--force')
+            gist_remote = DEFAULT_GIST_REMOTE
             err("Pushed to gist")
 
             # Construct gist URL
@@ -216,18 +239,11 @@ def clone(
                     err(f"Adding gist footer to {item_label}...")
                     body_with_footer = add_gist_footer(body, gist_url, visible=False)
 
-                    # Update item with footer
-                    with NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-                        f.write(body_with_footer)
-                        temp_file = f.name
-
-                    try:
-                        gh_cmd = 'pr' if detected_type == 'pr' else 'issue'
-                        proc.run('gh', gh_cmd, 'edit', str(number), '-R', f'{owner}/{repo}',
-                                '--body-file', temp_file, log=None)
-                        err(f"Added gist footer to {item_label}")
-                    finally:
-                        unlink(temp_file)
+                    # Update item with footer (body streamed via stdin, no temp file)
+                    gh_cmd = 'pr' if detected_type == 'pr' else 'issue'
+                    _output('gh', gh_cmd, 'edit', str(number), '-R', f'{owner}/{repo}',
+                            '--body-file', '-', input=body_with_footer.encode())
+                    err(f"Added gist footer to {item_label}")
                 else:
                     err(f"Skipping gist footer (not the {item_label} author)")
                     err(f"Gist URL: {gist_url}")
@@ -241,33 +257,45 @@ def clone(
     # Output directory path to stdout for shell integration (with marker for reliable parsing)
     print(f"GHPR_DIR:{target_path}")
 
+    # Gist pushes run in the background (serialized, one worker) while clone
+    # continues fetching/writing; they're awaited before attachment ingestion.
+    push_executor = ThreadPoolExecutor(max_workers=1)
+    pending_pushes = []
+
+    def push_to_gist_async(what: str) -> None:
+        future = push_executor.submit(_run, *GIT, 'push', gist_remote, 'main', '--force')
+        pending_pushes.append((future, what))
+
     # Fetch and store comments (default enabled, skip if --no-comments)
     if not no_comments:
-        err(f"Fetching comments for {item_label}...")
-        comments = get_item_comments(owner, repo, number, detected_type)
         if comments:
             err(f"Found {len(comments)} comment(s)")
-            for comment in comments:
-                comment_id = str(comment['id'])
-                author = comment['user']['login']
-                created_at = comment['created_at']
-                updated_at = comment.get('updated_at')
-                body = comment.get('body', '')
-
-                # Write comment file
-                comment_file = write_comment_file(comment_id, author, created_at, updated_at, body)
-                proc.run('git', 'add', str(comment_file), log=None)
-
-            # Commit all comments
-            proc.run('git', 'commit', '-m', f'Add {len(comments)} comment(s)', log=None)
+            comment_records = [
+                (
+                    str(comment['id']),
+                    comment['user']['login'],
+                    comment['created_at'],
+                    comment.get('updated_at'),
+                    comment.get('body', ''),
+                )
+                for comment in comments
+            ]
+
+            # Write comment files concurrently (independent small files)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                comment_paths = [
+                    path.name
+                    for path in executor.map(lambda c: write_comment_file(*c, directory=target_path), comment_records)
+                ]
+
+            # Stage and commit all comments (one `git add` for all files)
+            _run(*GIT, 'add', '--', *comment_paths)
+            _run(*GIT, 'commit', '-m', f'Add {len(comments)} comment(s)')
             err(f"Committed {len(comments)} comment(s)")
 
-            # Push comments to gist if one was created
-            if gist_url:
-                gist_remote = find_gist_remote()
-                if gist_remote:
-                    proc.run('git', 'push', gist_remote, 'main', '--force', log=None)
-                    err("Pushed comments to gist")
+            # Push comments to gist if one was set up above
+            if gist_remote:
+                push_to_gist_async('comments')
         else:
             # Inline review threads (if any) are fetched separately, just below.
             err("No top-level comments found" if detected_type == 'pr' else "No comments found")
@@ -276,39 +304,34 @@ def clone(
     if not no_comments and detected_type == 'pr':
         from .. import reviews
         err("Fetching review threads...")
-        n_threads, r_new, r_updated = reviews.pull(owner, repo, str(number))
+        with cd(target_path):
+            n_threads, r_new, r_updated = reviews.pull(owner, repo, str(number))
         if r_new or r_updated:
-            proc.run('git', 'commit', '-m',
-                     f'Add {n_threads} review thread(s), {r_new} comment(s)', log=None)
+            _run(*GIT, 'commit', '-m',
+                 f'Add {n_threads} review thread(s), {r_new} comment(s)')
             err(f"Committed {n_threads} review thread(s)")
-            if gist_url:
-                gist_remote = find_gist_remote()
-                if gist_remote:
-                    proc.run('git', 'push', gist_remote, 'main', '--force', log=None)
-                    err("Pushed review threads to gist")
+            if gist_remote:
+                push_to_gist_async('review threads')
+
+    # Wait for background gist pushes (re-raising any failure)
+    push_executor.shutdown(wait=True)
+    for future, what in pending_pushes:
+        future.result()
+        err(f"Pushed {what} to gist")
 
     # Check if we should ingest user-attachments
     should_ingest = environ.get('GHPR_INGEST_ATTACHMENTS', '1') != '0'
 
-    if should_ingest and gist_url:
-        # Check for user-attachments in the cloned description
-        desc_file = target_path / new_filename
-        if desc_file.exists():
-            with open(desc_file, 'r') as f:
-                content = f.read()
-
-            # Check for user-attachments in reference-style links
-            ref_link_pattern = re.compile(r'^\[([^\]]+)\]:\s+(https://github\.com/user-attachments/assets/[a-f0-9-]+)\s*$', re.MULTILINE)
-            if ref_link_pattern.search(content):
-                err("Found user-attachments, ingesting...")
-                # Change to the clone directory and run ingest
-                with cd(target_path):
-                    # Import here to avoid circular dependency
-                    from . import ingest_attachments as ingest_module
-                    # Call the ingest function directly
-                    ctx = Context(ingest_module.ingest_attachments)
-                    # Use None for branch to let it fall back to env var or default
-                    ctx.invoke(ingest_module.ingest_attachments, branch=None, no_ingest=False, dry_run=False)
+    if should_ingest and gist_url and has_attachments:
+        err("Found user-attachments, ingesting...")
+        # Change to the clone directory and run ingest
+        with cd(target_path):
+            # Import here to avoid circular dependency
+            from . import ingest_attachments as ingest_module
+            # Call the ingest function directly
+            ctx = Context(ingest_module.ingest_attachments)
+            # Use None for branch to let it fall back to env var or default
+            ctx.invoke(ingest_module.ingest_attachments, branch=None, no_ingest=False, dry_run=False)
 
 
 def register(cli):
@@ -1,13 +1,25 @@
 """Create and Init commands - initialize and create PR/Issue."""
 
-import re
-from os.path import exists, join
+import os
+import select
+import sys
+from functools import lru_cache
+from http.client import HTTPException
 from pathlib import Path
+from subprocess import DEVNULL, STDOUT
 from utz import proc, err, cd
 from utz.cli import opt, flag, arg
 
+from ..cache import gh_repo_view
+from ..config import chained, load_pr_config, set_pr_config
+from ..fs import rename_noreplace
+from ..gist import create_gist
 from ..files import read_description_file, write_description_with_link_ref
-from ..patterns import GIST_ID_PATTERN
+from ..ghclient import GhApiError, GhClient
+from ..gitcfg import find_gist_remote_fast, read_config, remote_urls
+from ..patterns import GITHUB_REPO_URL_PATTERN, ISSUE_URL_NUMBER_PATTERN, PR_URL_NUMBER_PATTERN
+
+DESCRIPTION_TEMPLATE = "# Title\n\nDescription of the PR...\n"
 
 
 def _resolve_draft_path(path: str | None) -> Path:
@@ -45,22 +57,50 @@ def _ensure_nested_git_repo(
     if toplevel == cwd:
         return
     proc.run('git', 'init', '-q', log=None)
-    proc.run('git', 'config', 'pr.owner', owner, log=None)
-    proc.run('git', 'config', 'pr.repo', repo, log=None)
-    proc.run('git', 'config', 'pr.number', str(number), log=None)
-    proc.run('git', 'config', 'pr.url', url, log=None)
-    proc.run('git', 'config', 'pr.type', item_type, log=None)
+    set_pr_config(owner=owner, repo=repo, number=number, url=url, type=item_type)
     err(f"Initialized nested git repo at {cwd}")
 
-# Import resolve_remote_ref from utz
+@lru_cache(maxsize=None)
+def _find_git_root(start: str) -> Path | None:
+    """Return the nearest directory at or above `start` containing `.git` (dir or file).
+
+    One `stat` per ancestor, no `git rev-parse` spawn; cached per `start`.
+    """
+    start_dir = Path(start)
+    for check_dir in [start_dir, *start_dir.parents]:
+        try:
+            os.stat(check_dir / '.git')
+        except OSError:  # FileNotFoundError, NotADirectoryError, PermissionError
+            continue
+        return check_dir
+    return None
+
+
+@lru_cache(maxsize=None)
+def _resolve_parent_repo(start: str) -> tuple[Path, str, str] | None:
+    """Find the nearest git repo at or above `start` that `gh` maps to a GitHub repo.
+
+    Cached per `start`, so the owner/repo and base-branch lookups within one
+    command share a single walk (and `gh repo view` call).
+
+    Returns:
+        (repo_root, owner, name), or None if no such repo is found
+    """
+    repo_root = _find_git_root(start)
+    while repo_root:
+        try:
+            repo_data = gh_repo_view(str(repo_root))
+            return repo_root, repo_data['owner']['login'], repo_data['name']
+        except Exception:
+            repo_root = _find_git_root(str(repo_root.parent)) if repo_root.parent != repo_root else None
+    return None
+
+
+# Import resolve_remote_ref from utz; None if this utz predates it (checked before head detection)
 try:
     from utz.git.branch import resolve_remote_ref
 except ImportError:
-    # Fallback: define a stub that raises an informative error
-    def resolve_remote_ref(verbose=False):
-        raise ImportError(
-            "utz.git.branch.resolve_remote_ref not available. Update utz or specify --head explicitly."
-        )
+    resolve_remote_ref = None
 
 
 def get_owner_repo(repo_arg: str | None = None) -> tuple[str, str]:
@@ -77,7 +117,15 @@ def get_owner_repo(repo_arg: str | None = None) -> tuple[str, str]:
 
     Raises:
         SystemExit: If repository cannot be determined
+
+    Results are cached per (repo_arg, cwd) for the life of the process.
     """
+    return _get_owner_repo(repo_arg, str(Path.cwd()))
+
+
+@lru_cache(maxsize=None)
+def _get_owner_repo(repo_arg: str | None, cwd: str) -> tuple[str, str]:
+    """Uncached `get_owner_repo`; `cwd` is only part of the cache key."""
     # 1. Try explicit argument
     if repo_arg:
         try:
@@ -88,51 +136,35 @@ def get_owner_repo(repo_arg: str | None = None) -> tuple[str, str]:
             exit(1)
 
     # 2. Try git config
-    owner = proc.line('git', 'config', 'pr.owner', err_ok=True, log=None)
-    repo = proc.line('git', 'config', 'pr.repo', err_ok=True, log=None)
+    pr_config = load_pr_config()
+    owner, repo = pr_config.get('owner'), pr_config.get('repo')
     if owner and repo:
         return owner, repo
 
-    # 3. Try parent directory
-    parent_dir = Path('..').resolve()
-    if exists(join(parent_dir, '.git')):
-        try:
-            with cd(parent_dir):
-                repo_data = proc.json('gh', 'repo', 'view', '--json', 'owner,name', log=None)
-                owner = repo_data['owner']['login']
-                repo = repo_data['name']
-                return owner, repo
-        except Exception:
-            pass
+    # 3. Try parent directory's repo
+    parent_repo = _resolve_parent_repo(str(Path.cwd().parent))
+    if parent_repo:
+        _, owner, repo = parent_repo
+        return owner, repo
 
-    # 4. Try current directory's git remotes
-    try:
-        remotes = proc.lines('git', 'remote', log=None)
-        # Try origin first
-        if 'origin' in remotes:
-            url = proc.line('git', 'remote', 'get-url', 'origin', log=None)
-            owner, repo = _parse_github_url(url)
-            if owner and repo:
-                return owner, repo
-
-        # Try any remote
-        for remote in remotes:
-            url = proc.line('git', 'remote', 'get-url', remote, log=None)
-            owner, repo = _parse_github_url(url)
-            if owner and repo:
-                return owner, repo
-    except Exception:
-        pass
+    # 4. Try current directory's git remotes (origin first), all read in one pass
+    remotes = remote_urls()
+    if 'origin' in remotes:
+        remotes = {'origin': remotes.pop('origin'), **remotes}
+    for url in remotes.values():
+        owner, repo = _parse_github_url(url)
+        if owner and repo:
+            return owner, repo
 
     err("Error: Could not determine repository. Configure with 'ghpr init -r owner/repo' or use -r/--repo")
     exit(1)
 
 
+@lru_cache(maxsize=None)
 def _parse_github_url(url: str) -> tuple[str | None, str | None]:
     """Parse owner and repo from a GitHub URL."""
-    import re
     # Match git@github.com:owner/repo.git or https://github.com/owner/repo
-    match = re.search(r'github\.com[:/]([^/]+)/([^/\.]+)', url)
+    match = GITHUB_REPO_URL_PATTERN.search(url)
     if match:
         return match.group(1), match.group(2)
     return None, None
@@ -144,7 +176,7 @@ def _read_and_parse_description() -> tuple[str, str]:
     Returns:
         (title, body) tuple
     """
-    if not exists('DESCRIPTION.md'):
+    if not Path('DESCRIPTION.md').exists():
         err("Error: DESCRIPTION.md not found. Run 'ghpr init' first")
         exit(1)
 
@@ -157,12 +189,102 @@ def _read_and_parse_description() -> tuple[str, str]:
     return title, body or ''
 
 
+def _store_gist_id_from_remotes() -> None:
+    """If a remote points at a gist, store its ID in `pr.gist` (read from `.git/config`, no `git remote` call)."""
+    cfg = read_config()
+    if not cfg:
+        return
+    _, gist_id = find_gist_remote_fast(cfg)
+    if gist_id:
+        set_pr_config(gist=gist_id)
+        err(f"Detected and stored gist ID: {gist_id}")
+
+
+def _find_pr_for_head(owner: str, repo: str, head: str) -> tuple[str, str] | None:
+    """Return (number, url) of the newest open PR from `head`, or None.
+
+    Queries the REST API directly (one HTTPS request, no `gh` spawn) for a
+    same-repo head; falls back to `gh pr list --head`, which also matches
+    branches on forks.
+    """
+    try:
+        with GhClient() as client:
+            prs = client.get(f'/repos/{owner}/{repo}/pulls', params={'head': f'{owner}:{head}', 'state': 'open'})
+        if prs:
+            return str(prs[0]['number']), prs[0]['html_url']
+    except Exception:
+        pass
+    prs = proc.json('gh', 'pr', 'list', '-R', f'{owner}/{repo}', '--head', head, '--json', 'number,url', log=None)
+    if prs:
+        return str(prs[0]['number']), prs[0]['url']
+    return None
+
+
+PR_POLL_INTERVAL = 3  # seconds between checks for a web-created PR
+
+
+def _wait_for_web_pr(owner: str, repo: str, head: str) -> tuple[str, str] | None:
+    """Wait for the user to submit a PR opened in the web editor.
+
+    Polls for an open PR from `head` every `PR_POLL_INTERVAL` seconds (with
+    ETag-conditional requests, so unchanged polls are cheap 304s) and returns
+    its (number, url) as soon as it appears. Pressing Enter stops waiting and
+    returns None (the caller then looks the PR up itself); Ctrl-C stops
+    polling and falls back to waiting for Enter. Without a selectable TTY
+    stdin, or an API token, this just waits for Enter.
+    """
+    try:
+        if not sys.stdin.isatty() or sys.platform == 'win32':
+            raise OSError("stdin not pollable")
+        client = GhClient()
+        # Resolve the (otherwise lazy) token now, so a missing one means waiting
+        # for Enter, rather than a failed `gh auth token` on every poll
+        if not client.token:
+            raise ValueError("no GitHub token")
+    except Exception:
+        input()
+        return None
+
+    path = f'/repos/{owner}/{repo}/pulls'
+    params = {'head': f'{owner}:{head}', 'state': 'open', 'sort': 'created', 'direction': 'desc'}
+    try:
+        with client:
+            while True:
+                ready, _, _ = select.select([sys.stdin], [], [], PR_POLL_INTERVAL)
+                if ready:
+                    sys.stdin.readline()
+                    return None
+                try:
+                    prs = client.get(path, params=params, conditional=True)
+                except (OSError, HTTPException, GhApiError):
+                    continue  # Transient network/API error; keep polling
+                if prs:
+                    return str(prs[0]['number']), prs[0]['html_url']
+    except KeyboardInterrupt:
+        err("")
+        err("Stopped polling. Press Enter when you've finished creating the PR in the browser...")
+        input()
+        return None
+
+
+def _run_chained(*cmds: tuple[str, ...], **kwargs) -> None:
+    """Run fixed-order, non-interactive commands, `chained` (one `sh -c`, when available).
+
+    Their stdout (e.g. `git commit`'s summary) is discarded; stderr still reaches
+    the user unless overridden via `kwargs` (passed to `proc.run`).
+    """
+    for cmd in chained(*cmds):
+        proc.run(*cmd, log=None, stdout=DEVNULL, **kwargs)
+
+
 def _finalize_created_item(
     owner: str,
     repo: str,
     number: str,
     url: str,
     item_type: str,
+    title: str,
+    body: str,
 ) -> None:
     """Finalize after creating PR/issue: rename file, commit, rename directory.
 
@@ -172,25 +294,21 @@ def _finalize_created_item(
         number: PR/issue number
         url: GitHub URL
         item_type: 'pr' or 'issue'
+        title: Title, as already parsed from DESCRIPTION.md
+        body: Body, as already parsed from DESCRIPTION.md
     """
     old_file = Path('DESCRIPTION.md')
     new_filename = f'{repo}#{number}.md'
     new_file = Path(new_filename)
 
-    # Read title and body from DESCRIPTION.md (plain format)
-    title, body = read_description_file(expect_plain=True)
-    if not title:
-        err("Warning: Could not parse title from DESCRIPTION.md")
-        return
-
-    # Write using helper with link-reference format
+    # Write link-reference format in place; it's renamed to `new_filename` below
     write_description_with_link_ref(
-        new_file,
+        old_file,
         owner,
         repo,
         number,
         title,
-        body or '',
+        body,
         url
     )
 
@@ -198,19 +316,24 @@ def _finalize_created_item(
     # gitignored `gh/` in the parent project doesn't break add/commit.
     _ensure_nested_git_repo(owner, repo, number, url, item_type)
 
-    # Remove old file from index (if tracked) and from disk.
-    # --ignore-unmatch handles the case where it was never tracked
-    # (e.g. fresh nested git repo we just initialized, or gitignored).
-    if old_file != new_file:
-        proc.run('git', 'rm', '-q', '--ignore-unmatch', 'DESCRIPTION.md', log=None)
-        if old_file.exists():
-            old_file.unlink()
-        err(f"Renamed DESCRIPTION.md to {new_filename}")
-
     # Git operations
-    proc.run('git', 'add', new_filename, log=None)
     item_label = 'PR' if item_type == 'pr' else 'issue'
-    proc.run('git', 'commit', '-m', f'Rename to {new_filename} and add {item_label} #{number} link', log=None)
+    add_and_commit = [
+        ('git', 'add', new_filename),
+        ('git', 'commit', '-m', f'Rename to {new_filename} and add {item_label} #{number} link'),
+    ]
+    if old_file != new_file:
+        if proc.check('git', 'ls-files', '--error-unmatch', 'DESCRIPTION.md', log=None):
+            # Normally tracked (`init` commits it), so `git mv` renames it on
+            # disk and in the index in one step
+            _run_chained(('git', 'mv', 'DESCRIPTION.md', new_filename), *add_and_commit)
+        else:
+            # Never tracked (e.g. fresh nested git repo we just initialized, or gitignored)
+            os.replace(old_file, new_file)
+            _run_chained(*add_and_commit)
+        err(f"Renamed DESCRIPTION.md to {new_filename}")
+    else:
+        _run_chained(*add_and_commit)
     err(f"Updated {new_filename} with {item_label} link")
 
     # Push updates to GitHub (link-def and footer)
@@ -229,8 +352,8 @@ def _finalize_created_item(
     )
 
     # Push to gist remote if it exists
-    from ..gist import find_gist_remote
-    gist_remote = find_gist_remote()
+    cfg = read_config()
+    gist_remote, _ = find_gist_remote_fast(cfg) if cfg else (None, None)
     if gist_remote:
         try:
             proc.run('git', 'push', gist_remote, 'main', log=None)
@@ -251,14 +374,15 @@ def _finalize_created_item(
     )
     if gh_ancestor and current_name != number:
         new_dir = gh_ancestor / number
-        if not new_dir.exists():
+        old_rel = current_dir.relative_to(gh_ancestor.parent)
+        try:
             # Note: After this, our cwd will be invalid, but we're done anyway
-            import os
-            old_rel = current_dir.relative_to(gh_ancestor.parent)
-            os.rename(str(current_dir), str(new_dir))
+            rename_noreplace(current_dir, new_dir)
             err(f"Renamed directory: {old_rel} → gh/{number}")
-        else:
+        except FileExistsError:
             err(f"Warning: Directory gh/{number} already exists, not renaming")
+        except OSError as e:
+            err(f"Warning: Could not rename {old_rel} → gh/{number}: {e}")
 
 
 def init(
@@ -290,53 +414,44 @@ def init(
         # Try to auto-detect from current directory or parent's git repo
         owner = None
         repo_name = None
-        current = Path.cwd()
 
         # Walk up to find a git repo (starting from current dir)
-        for check_dir in [current] + list(current.parents):
-            if (check_dir / '.git').exists():
-                try:
-                    with cd(check_dir):
-                        repo_data = proc.json('gh', 'repo', 'view', '--json', 'owner,name', log=None, err_ok=True)
-                        if repo_data:
-                            owner = repo_data['owner']['login']
-                            repo_name = repo_data['name']
-                            err(f"Auto-detected repository: {owner}/{repo_name}")
-                            break
-                except Exception:
-                    pass
+        parent_repo = _resolve_parent_repo(str(Path.cwd()))
+        if parent_repo:
+            _, owner, repo_name = parent_repo
+            err(f"Auto-detected repository: {owner}/{repo_name}")
 
     # Work inside gh/new/
     with cd(new_dir):
         # Initialize git repo if needed
-        if not exists('.git'):
+        if not Path('.git').exists():
             proc.run('git', 'init', '-q', log=None)
             err("Initialized git repository")
 
+        pr_config = {}
         if owner and repo_name:
-            proc.run('git', 'config', 'pr.owner', owner, log=None)
-            proc.run('git', 'config', 'pr.repo', repo_name, log=None)
-            if repo:
-                err(f"Configured for {owner}/{repo_name}")
-
+            pr_config.update(owner=owner, repo=repo_name)
+        if base:
+            pr_config['base'] = base
+        set_pr_config(**pr_config)
+        if owner and repo_name and repo:
+            err(f"Configured for {owner}/{repo_name}")
         if base:
-            proc.run('git', 'config', 'pr.base', base, log=None)
             err(f"Base branch: {base}")
 
         # Create initial DESCRIPTION.md (plain format - link-reference added after PR creation)
-        with open('DESCRIPTION.md', 'w') as f:
-            f.write("# Title\n\n")
-            f.write("Description of the PR...\n")
+        Path('DESCRIPTION.md').write_text(DESCRIPTION_TEMPLATE, encoding='utf-8')
 
         err("Created DESCRIPTION.md template")
 
         # Create initial commit
-        proc.run('git', 'add', 'DESCRIPTION.md', log=None)
-        proc.run('git', 'commit', '-m', 'Initial PR draft', log=None)
+        _run_chained(
+            ('git', 'add', 'DESCRIPTION.md'),
+            ('git', 'commit', '-m', 'Initial PR draft'),
+        )
         err("Created initial commit")
 
         # Create and configure gist mirror
-        from ..gist import create_gist
         try:
             # Create gist (public by default, matching typical repo visibility)
             description = f'Draft PR for {owner}/{repo_name}' if owner and repo_name else 'Draft PR'
@@ -344,25 +459,28 @@ def init(
                 file_path='DESCRIPTION.md',
                 description=description,
                 is_public=True,
-                store_id=True  # Automatically stores in git config pr.gist
+                store_id=False,  # Stored below, batched with the remote setup
             )
 
             if gist_id:
-                # Add gist as remote
+                # Store gist ID and add gist as remote. These all write
+                # .git/config (and would contend for its lock if run
+                # concurrently), so run them in sequence instead.
                 gist_url = f'git@gist.github.com:{gist_id}.git'
-                proc.run('git', 'remote', 'add', 'g', gist_url, log=None)
-                proc.run('git', 'config', 'pr.gist-remote', 'g', log=None)
+                _run_chained(
+                    ('git', 'config', 'pr.gist', gist_id),
+                    ('git', 'remote', 'add', 'g', gist_url),
+                    ('git', 'config', 'pr.gist-remote', 'g'),
+                )
                 err(f"Created gist: https://gist.github.com/{gist_id}")
                 err("Added remote 'g' for gist mirror")
 
-                # Fetch and set up tracking
-                proc.run('git', 'fetch', 'g', log=None)
-                proc.run('git', 'branch', '--set-upstream-to=g/main', 'main', log=None)
-                err("Configured main branch to track g/main")
-
-                # Push initial commit to gist (with history)
-                proc.run('git', 'push', '-f', 'g', 'main', log=None)
+                # Push initial commit to gist (with history), and track g/main.
+                # `push -u` sets upstream itself, so no separate fetch is
+                # needed: one SSH connection instead of two.
+                proc.run('git', 'push', '-u', '-f', 'g', 'main', log=None)
                 err("Pushed initial commit to gist")
+                err("Configured main branch to track g/main")
         except Exception as e:
             err(f"Warning: Could not create gist mirror: {e}")
             err("You can add it later with 'ghpr push -g'")
@@ -421,6 +539,69 @@ def create(
         _do_create()
 
 
+def _detect_base_and_head(
+    start: str,
+    need_base: bool,
+    need_head: bool,
+) -> tuple[str | None, str | None]:
+    """Auto-detect the base and/or head branch from the repo containing `start`.
+
+    The base is the GitHub default branch of the nearest `gh`-resolvable repo
+    (cached `gh repo view`, falling back to 'main'); the head is the nearest
+    git repo's remote-tracking (or local) branch, detected inside a single
+    `cd`. Exits if the head is needed but can't be determined.
+    """
+    base = None
+    if need_base:
+        try:
+            parent_repo = _resolve_parent_repo(start)
+            if parent_repo:
+                # Same cached lookup as owner/repo
+                base = gh_repo_view(str(parent_repo[0]))['defaultBranchRef']['name']
+                err(f"Auto-detected base branch: {base}")
+            else:
+                base = 'main'  # Fallback to main
+        except Exception as e:
+            err(f"Error: Could not detect base branch: {e}")
+            raise
+
+    head = None
+    if need_head:
+        if resolve_remote_ref is None:
+            err("Error: utz.git.branch.resolve_remote_ref not available. Update utz or specify --head explicitly")
+            exit(1)
+        try:
+            repo_root = _find_git_root(start)
+            if not repo_root:
+                err("Error: Could not detect head branch. Specify --head explicitly")
+                exit(1)
+
+            with cd(repo_root):
+                # Use branch resolution to get remote tracking branch
+                ref_name, remote_ref = resolve_remote_ref(verbose=False)
+                if remote_ref:
+                    # Extract branch name from remote_ref (e.g., "m/rw/ws3" -> "rw/ws3")
+                    # GitHub expects just the branch name without the remote prefix
+                    head = remote_ref.split('/', 1)[1] if '/' in remote_ref else remote_ref
+                    err(f"Auto-detected head branch from remote: {head}")
+                elif ref_name:
+                    # Fallback to local branch name if no remote tracking
+                    head = ref_name
+                    err(f"Auto-detected head branch (local): {head}")
+                else:
+                    # Fallback to current branch
+                    head = proc.line('git', 'rev-parse', '--abbrev-ref', 'HEAD', log=None)
+                    if head == 'HEAD':
+                        err("Error: Parent repo is in detached HEAD state. Specify --head explicitly")
+                        exit(1)
+        except Exception as e:
+            err(f"Error detecting head branch: {e}")
+            err("Specify --head explicitly")
+            exit(1)
+
+    return base, head
+
+
 def create_new_pr(
     head: str | None,
     base: str | None,
@@ -439,84 +620,33 @@ def create_new_pr(
     # Read and parse DESCRIPTION.md
     title, body = _read_and_parse_description()
 
-    # Get repo info from config or parent directory
-    owner = proc.line('git', 'config', 'pr.owner', err_ok=True, log=None)
-    repo = proc.line('git', 'config', 'pr.repo', err_ok=True, log=None)
+    # Resolve only what wasn't given explicitly: git config is only read
+    # if -r/--repo or --base is missing
+    pr_config = {} if repo_arg and base else load_pr_config()
+    if repo_arg:
+        owner, repo = get_owner_repo(repo_arg)
+    else:
+        owner, repo = pr_config.get('owner'), pr_config.get('repo')
 
     if not owner or not repo:
-        # Try to get from parent directory
-        parent_dir = Path('..').resolve()
-        if exists(join(parent_dir, '.git')):
-            try:
-                with cd(parent_dir):
-                    repo_data = proc.json('gh', 'repo', 'view', '--json', 'owner,name', log=None)
-                    owner = repo_data['owner']['login']
-                    repo = repo_data['name']
-            except Exception as e:
-                err(f"Error: Could not determine repository: {e}")
-                err("Configure with 'ghpr init -r owner/repo'")
-                exit(1)
+        # Try to get from parent directory's repo
+        parent_repo = _resolve_parent_repo(str(Path.cwd().parent))
+        if parent_repo:
+            _, owner, repo = parent_repo
         else:
             err("Error: Could not determine repository. Configure with 'ghpr init -r owner/repo'")
             exit(1)
 
-    # Get base branch from config or default
-    if not base:
-        base = proc.line('git', 'config', 'pr.base', err_ok=True, log=None)
-        if not base:
-            # Try to get default branch from parent repo
-            try:
-                parent_dir = Path('..').resolve()
-                if exists(join(parent_dir, '.git')):
-                    with cd(parent_dir):
-                        # Get default branch from GitHub
-                        default_branch = proc.line('gh', 'repo', 'view', '--json', 'defaultBranchRef', '-q', '.defaultBranchRef.name', log=None)
-                        base = default_branch
-                    err(f"Auto-detected base branch: {base}")
-                else:
-                    base = 'main'  # Fallback to main
-            except Exception as e:
-                err(f"Error: Could not detect base branch: {e}")
-                raise
-
-    # Get head branch - try to auto-detect from parent repo
-    if not head:
-        # Go up one level (to get out of gh/new/) and find the git repo root
-        parent_dir = Path('..').resolve()
-        try:
-            with cd(parent_dir):
-                # Find the git repo root
-                repo_root = proc.line('git', 'rev-parse', '--show-toplevel', err_ok=True, log=None)
-                if not repo_root:
-                    err("Error: Could not detect head branch. Specify --head explicitly")
-                    exit(1)
-
-                with cd(repo_root):
-                    # Use branch resolution to get remote tracking branch
-                    ref_name, remote_ref = resolve_remote_ref(verbose=False)
-                    if remote_ref:
-                        # Extract branch name from remote_ref (e.g., "m/rw/ws3" -> "rw/ws3")
-                        # GitHub expects just the branch name without the remote prefix
-                        if '/' in remote_ref:
-                            head = '/'.join(remote_ref.split('/')[1:])
-                        else:
-                            head = remote_ref
-                        err(f"Auto-detected head branch from remote: {head}")
-                    elif ref_name:
-                        # Fallback to local branch name if no remote tracking
-                        head = ref_name
-                        err(f"Auto-detected head branch (local): {head}")
-
-                    if not head:
-                        # Fallback to current branch
-                        head = proc.line('git', 'rev-parse', '--abbrev-ref', 'HEAD', log=None)
-                        if head == 'HEAD':
-                            err("Error: Parent repo is in detached HEAD state. Specify --head explicitly")
-                            exit(1)
-        except Exception as e:
-            err(f"Error detecting head branch: {e}")
-            err("Specify --head explicitly")
-            exit(1)
+    # Auto-detect whatever's still missing from the parent repo, in one pass
+    base = base or pr_config.get('base')
+    if not base or not head:
+        detected_base, detected_head = _detect_base_and_head(
+            str(Path.cwd().parent),
+            need_base=not base,
+            need_head=not head,
+        )
+        base = base or detected_base
+        head = head or detected_head
 
     # Create the PR
     if dry_run:
@@ -551,44 +681,42 @@ def create_new_pr(
             cmd.append('--web')
 
         try:
-            output = proc.text(*cmd, log=None).strip()
+            if use_web_editor:
+                # Capture stderr too (and echo it), so a PR URL printed by `gh` can be used below
+                output = proc.text(*cmd, log=None, stderr=STDOUT).strip()
+                if output:
+                    err(output)
+            else:
+                output = proc.text(*cmd, log=None).strip()
 
             if use_web_editor:
                 # Web editor mode: wait for user to finish editing in browser
                 err("Opened PR in web editor")
-                err("Press Enter when you've finished creating the PR in the browser...")
-                input()
+                err("Waiting for the PR to be created in the browser (or press Enter when done)...")
+                pr = _wait_for_web_pr(owner, repo, head)
 
-                # Query GitHub to find the newly created PR
-                err("Fetching PR information...")
+                # If polling didn't find it, use the PR URL if `gh` printed one, else query GitHub
                 try:
-                    # List PRs for the head branch
-                    prs = proc.json('gh', 'pr', 'list', '-R', f'{owner}/{repo}', '--head', head, '--json', 'number,url', log=None)
-                    if prs and len(prs) > 0:
-                        pr_number = str(prs[0]['number'])
-                        pr_url = prs[0]['url']
+                    if not pr:
+                        match = PR_URL_NUMBER_PATTERN.search(output)
+                        if match:
+                            pr_number = match.group(1)
+                            pr = pr_number, f'https://github.com/{owner}/{repo}/pull/{pr_number}'
+                        else:
+                            err("Fetching PR information...")
+                            pr = _find_pr_for_head(owner, repo, head)
+                    if pr:
+                        pr_number, pr_url = pr
 
                         # Store PR info in git config
-                        proc.run('git', 'config', 'pr.number', pr_number, log=None)
-                        proc.run('git', 'config', 'pr.url', pr_url, log=None)
+                        set_pr_config(number=pr_number, url=pr_url)
                         err(f"Found PR #{pr_number}: {pr_url}")
 
                         # Check for gist remote and store its ID if found
-                        try:
-                            remotes = proc.lines('git', 'remote', '-v', log=None)
-                            for remote_line in remotes:
-                                if 'gist.github.com' in remote_line:
-                                    gist_match = GIST_ID_PATTERN.search(remote_line)
-                                    if gist_match:
-                                        gist_id = gist_match.group(1)
-                                        proc.run('git', 'config', 'pr.gist', gist_id, log=None)
-                                        err(f"Detected and stored gist ID: {gist_id}")
-                                        break
-                        except Exception:
-                            pass
+                        _store_gist_id_from_remotes()
 
                         # Finalize: rename file, commit, rename directory
-                        _finalize_created_item(owner, repo, pr_number, pr_url, 'pr')
+                        _finalize_created_item(owner, repo, pr_number, pr_url, 'pr', title, body)
                     else:
                         err("Warning: Could not find newly created PR")
                         err("You may need to run 'ghpr pull' to sync with GitHub")
@@ -598,12 +726,11 @@ def create_new_pr(
             else:
                 # API mode: PR number returned immediately
                 # Extract PR number from URL
-                match = re.search(r'/pull/(\d+)', output)
+                match = PR_URL_NUMBER_PATTERN.search(output)
                 if match:
                     pr_number = match.group(1)
                     # Store PR info in git config
-                    proc.run('git', 'config', 'pr.number', pr_number, log=None)
-                    proc.run('git', 'config', 'pr.url', output, log=None)
+                    set_pr_config(number=pr_number, url=output)
                     err(f"Created PR #{pr_number}: {output}")
                     err("PR info stored in git config")
 
@@ -612,23 +739,10 @@ def create_new_pr(
                         proc.run('gh', 'pr', 'view', pr_number, '--web', '-R', f'{owner}/{repo}', log=None)
 
                     # Check for gist remote and store its ID if found
-                    try:
-                        remotes = proc.lines('git', 'remote', '-v', log=None)
-                        for remote_line in remotes:
-                            if 'gist.github.com' in remote_line:
-                                # Extract gist ID from URL like git@gist.github.com:GIST_ID.git
-                                gist_match = GIST_ID_PATTERN.search(remote_line)
-                                if gist_match:
-                                    gist_id = gist_match.group(1)
-                                    proc.run('git', 'config', 'pr.gist', gist_id, log=None)
-                                    err(f"Detected and stored gist ID: {gist_id}")
-                                    break
-                    except Exception:
-                        # Gist detection is optional, silently continue
-                        pass
+                    _store_gist_id_from_remotes()
 
                     # Finalize: rename file, commit, rename directory
-                    _finalize_created_item(owner, repo, pr_number, output, 'pr')
+                    _finalize_created_item(owner, repo, pr_number, output, 'pr', title, body)
                 else:
                     err(f"Created PR: {output}")
         except Exception as e:
@@ -696,13 +810,11 @@ def create_new_issue(
                         issue_url = issues[0]['url']
 
                         # Store issue info in git config
-                        proc.run('git', 'config', 'pr.number', issue_number, log=None)
-                        proc.run('git', 'config', 'pr.type', 'issue', log=None)
-                        proc.run('git', 'config', 'pr.url', issue_url, log=None)
+                        set_pr_config(number=issue_number, type='issue', url=issue_url)
                         err(f"Found issue #{issue_number}: {issue_url}")
 
                         # Finalize: rename file, commit, rename directory
-                        _finalize_created_item(owner, repo, issue_number, issue_url, 'issue')
+                        _finalize_created_item(owner, repo, issue_number, issue_url, 'issue', title, body)
                     else:
                         err("Warning: Could not find newly created issue")
                         err("You may need to run 'ghpr pull' to sync with GitHub")
@@ -712,13 +824,11 @@ def create_new_issue(
             else:
                 # API mode: issue number returned immediately
                 # Extract issue number from URL
-                match = re.search(r'/issues/(\d+)', output)
+                match = ISSUE_URL_NUMBER_PATTERN.search(output)
                 if match:
                     issue_number = match.group(1)
                     # Store issue info in git config
-                    proc.run('git', 'config', 'pr.number', issue_number, log=None)
-                    proc.run('git', 'config', 'pr.type', 'issue', log=None)
-                    proc.run('git', 'config', 'pr.url', output, log=None)
+                    set_pr_config(number=issue_number, type='issue', url=output)
                     err(f"Created issue #{issue_number}: {output}")
                     err("Issue info stored in git config")
 
@@ -727,7 +837,7 @@ def create_new_issue(
                         proc.run('gh', 'issue', 'view', issue_number, '--web', '-R', f'{owner}/{repo}', log=None)
 
                     # Finalize: rename file, commit, rename directory
-                    _finalize_created_item(owner, repo, issue_number, output, 'issue')
+                    _finalize_created_item(owner, repo, issue_number, output, 'issue', title, body)
                 else:
                     err(f"Created issue: {output}")
         except Exception as e:
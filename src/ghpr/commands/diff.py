@@ -1,17 +1,31 @@
 """Diff command - show differences between local and remote."""
 
 import sys
+from types import SimpleNamespace
+
 from click import Choice
-from utz import proc, err
+from utz import err
 from utz.cli import opt, flag
 
 from ..api import get_item_metadata, get_current_github_user
-from ..config import get_pr_info_from_path
-from ..files import read_description_from_git
+from ..config import get_pr_info_from_path, load_pr_config
+from ..files import body_after_title, read_description_from_git
 from ..gist import extract_gist_footer
+from ..gitpipe import GitCatFile
 from ..patterns import extract_title_from_first_line
 from ..render import render_comment_diff, render_unified_diff
 
+# ANSI color codes, selected once per call by `use_color`
+_COLORS_ON = SimpleNamespace(
+    RED='\033[31m',
+    GREEN='\033[32m',
+    CYAN='\033[36m',
+    YELLOW='\033[33m',
+    RESET='\033[0m',
+    BOLD='\033[1m',
+)
+_COLORS_OFF = SimpleNamespace(**{name: '' for name in vars(_COLORS_ON)})
+
 
 def diff(
     color: str,
@@ -26,29 +40,22 @@ def diff(
     elif color == 'auto':
         use_color = sys.stdout.isatty()
 
-    # ANSI color codes
-    RED = '\033[31m' if use_color else ''
-    GREEN = '\033[32m' if use_color else ''
-    CYAN = '\033[36m' if use_color else ''
-    YELLOW = '\033[33m' if use_color else ''
-    RESET = '\033[0m' if use_color else ''
-    BOLD = '\033[1m' if use_color else ''
+    c = _COLORS_ON if use_color else _COLORS_OFF
+
+    # Read all pr.* git config once
+    pr_config = load_pr_config()
 
     # Get PR info from current directory
-    owner, repo, pr_number = get_pr_info_from_path()
+    owner, repo, pr_number = get_pr_info_from_path(pr_config=pr_config)
 
     if not all([owner, repo, pr_number]):
         # Try git config
-        try:
-            owner = proc.line('git', 'config', 'pr.owner', err_ok=True, log=None) or ''
-            repo = proc.line('git', 'config', 'pr.repo', err_ok=True, log=None) or ''
-            pr_number = proc.line('git', 'config', 'pr.number', err_ok=True, log=None) or ''
-        except Exception as e:
-            err(f"Error: Could not determine PR from directory or git config: {e}")
-            exit(1)
+        owner = pr_config.get('owner', '')
+        repo = pr_config.get('repo', '')
+        pr_number = pr_config.get('number', '')
 
-    # Get item type
-    item_type = proc.line('git', 'config', 'pr.type', err_ok=True, log=None)
+    # Get item type (if not configured, `get_item_metadata` detects it)
+    item_type = pr_config.get('type')
 
     # Get remote PR/Issue data
     item_label = 'issue' if item_type == 'issue' else 'PR'
@@ -57,72 +64,65 @@ def diff(
     if not pr_data:
         exit(1)
 
-    # Read local description from git
-    desc_content, desc_file = read_description_from_git('HEAD')
-    if not desc_content or not desc_file:
-        err("Error: Could not read description file from HEAD")
-        err("Make sure you've committed your changes")
-        exit(1)
-
-    # Parse local file to get title and body
-    lines = desc_content.split('\n')
-    if not lines:
-        err("Error: DESCRIPTION.md is empty")
-        exit(1)
+    # Read local description and draft comments from HEAD over one `git cat-file` process
+    with GitCatFile() as blobs:
+        desc_content, desc_file = read_description_from_git('HEAD', blobs=blobs)
+        if not desc_content or not desc_file:
+            err("Error: Could not read description file from HEAD\nMake sure you've committed your changes")
+            exit(1)
 
-    first_line = lines[0].strip()
-    local_title = extract_title_from_first_line(first_line)
-
-    body_lines = lines[1:]
-    while body_lines and not body_lines[0].strip():
-        body_lines = body_lines[1:]
-    local_body = '\n'.join(body_lines).rstrip()
-
-    # Strip footer from local body for comparison
-    local_body_without_footer, _ = extract_gist_footer(local_body)
-
-    # Get remote title and body (already normalized in get_pr_metadata)
-    remote_title = pr_data['title']
-    remote_body = (pr_data['body'] or '').rstrip()
-
-    # Strip footer from remote body for comparison
-    remote_body_without_footer, _ = extract_gist_footer(remote_body)
-
-    # Compare titles
-    if local_title != remote_title:
-        err(f"\n{BOLD}{YELLOW}=== Title Differences ==={RESET}")
-        err(f"{GREEN}Local: {RESET} {local_title}")
-        err(f"{RED}Remote:{RESET} {remote_title}")
-    else:
-        err(f"\n{BOLD}{CYAN}=== Title: No differences ==={RESET}")
-
-    # Compare bodies (without footers)
-    if local_body_without_footer != remote_body_without_footer:
-        err(f"\n{BOLD}{YELLOW}=== Body Differences ==={RESET}")
-        render_unified_diff(
-            remote_body_without_footer,
-            local_body_without_footer,
-            fromfile='Remote PR',
-            tofile=f'Local {desc_file.name}',
-            use_color=use_color,
-            log=print
-        )
-    else:
-        err(f"\n{BOLD}{CYAN}=== Body: No differences ==={RESET}")
-
-    # Handle comment diffing (default enabled, skip if --no-comments)
-    if not no_comments:
-        # Get item type
-        item_type = proc.line('git', 'config', 'pr.type', err_ok=True, log=None)
-        if not item_type:
-            _, item_type = get_item_metadata(owner, repo, pr_number)
-
-        current_user = get_current_github_user()
-        render_comment_diff(owner, repo, pr_number, item_type, use_color=use_color, current_user=current_user)
-
-        if item_type == 'pr':
-            from .. import reviews
-            reviews.diff(owner, repo, pr_number, use_color=use_color, current_user=current_user)
+        # Parse local file to get title and body
+        first_line, _, rest = desc_content.partition('\n')
+        local_title = extract_title_from_first_line(first_line.strip())
+        local_body = body_after_title(rest)
+
+        # Strip footer from local body for comparison
+        local_body_without_footer, _ = extract_gist_footer(local_body)
+
+        # Get remote title and body (already normalized in get_pr_metadata)
+        remote_title = pr_data['title']
+        remote_body = (pr_data['body'] or '').rstrip()
+
+        # Strip footer from remote body for comparison
+        remote_body_without_footer, _ = extract_gist_footer(remote_body)
+
+        # Compare titles
+        if local_title != remote_title:
+            # One write for the whole section, rather than one per line
+            err('\n'.join([
+                f"\n{c.BOLD}{c.YELLOW}=== Title Differences ==={c.RESET}",
+                f"{c.GREEN}Local: {c.RESET} {local_title}",
+                f"{c.RED}Remote:{c.RESET} {remote_title}",
+            ]))
+        else:
+            err(f"\n{c.BOLD}{c.CYAN}=== Title: No differences ==={c.RESET}")
+
+        # Compare bodies (without footers)
+        if local_body_without_footer != remote_body_without_footer:
+            err(f"\n{c.BOLD}{c.YELLOW}=== Body Differences ==={c.RESET}")
+            render_unified_diff(
+                remote_body_without_footer,
+                local_body_without_footer,
+                fromfile='Remote PR',
+                tofile=f'Local {desc_file.name}',
+                use_color=use_color,
+                log=print
+            )
+        else:
+            err(f"\n{c.BOLD}{c.CYAN}=== Body: No differences ==={c.RESET}")
+
+        # Handle comment diffing (default enabled, skip if --no-comments)
+        if not no_comments:
+            # `item_type` was already resolved by the metadata fetch above
+            current_user = get_current_github_user()
+            render_comment_diff(
+                owner, repo, pr_number, item_type,
+                use_color=use_color, current_user=current_user, blobs=blobs,
+            )
+
+            if item_type == 'pr':
+                from .. import reviews
+                reviews.diff(owner, repo, pr_number, use_color=use_color, current_user=current_user)
 
 
 def register(cli):
@@ -1,12 +1,59 @@
 """Ingest attachments command - download user-attachments and convert to gist permalinks."""
 
 import re
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from os import environ
+from pathlib import Path
+from threading import local
 from utz import proc, err
 from utz.cli import opt, flag
 
+from ..config import load_pr_config
 from ..files import find_description_file
+from ..ghclient import GhApiError, GhClient, gh_token
+from ..patterns import USER_ATTACHMENT_REF_PATTERN
+
+# (magic-byte prefix, file extension) for attachment types we recognize
+MAGIC_EXTENSIONS = (
+    (b'\x89PNG', '.png'),
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'GIF8', '.gif'),
+    (b'%PDF', '.pdf'),
+    (b'PK\x03\x04', '.zip'),
+)
+# Bytes of a file needed to match any of `MAGIC_EXTENSIONS`
+MAGIC_HEAD_SIZE = max(len(magic) for magic, _ in MAGIC_EXTENSIONS)
+
+
+def _download_all(downloads: list[tuple[str, str]], token: str) -> list[Exception | None]:
+    """Download `(url, path)` pairs concurrently, returning each one's exception (or None), in order.
+
+    Bodies are streamed straight to `path`, not held in memory. `GhClient`
+    isn't thread-safe, so each worker thread keeps its own (and reuses its
+    connections across the downloads it handles).
+    """
+    thread_local = local()
+    clients = []
+
+    def download(url_path: tuple[str, str]) -> Exception | None:
+        url, path = url_path
+        client = getattr(thread_local, 'client', None)
+        if not client:
+            client = thread_local.client = GhClient(token=token)
+            clients.append(client)
+        try:
+            with open(path, 'wb') as f:
+                client.download(url, out=f)
+        except Exception as e:
+            Path(path).unlink(missing_ok=True)
+            return e
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(download, downloads))
+    finally:
+        for client in clients:
+            client.close()
 
 
 def ingest_attachments(
@@ -18,7 +65,7 @@ def ingest_attachments(
 
     This command:
     1. Finds reference-style links with user-attachments URLs in DESCRIPTION.md
-    2. Downloads the attachments via gh api
+    2. Downloads the attachments (concurrently) via the GitHub API
     3. Commits them to a dedicated branch on the gist
     4. Replaces URLs with gist permalinks in the main branch
     """
@@ -37,10 +84,11 @@ def ingest_attachments(
         return
 
     # Get PR info from current directory
-    owner = proc.line('git', 'config', 'pr.owner', err_ok=True, log=None)
-    repo = proc.line('git', 'config', 'pr.repo', err_ok=True, log=None)
-    pr_number = proc.line('git', 'config', 'pr.number', err_ok=True, log=None)
-    gist_id = proc.line('git', 'config', 'pr.gist', err_ok=True, log=None)
+    pr_config = load_pr_config()
+    owner = pr_config.get('owner')
+    repo = pr_config.get('repo')
+    pr_number = pr_config.get('number')
+    gist_id = pr_config.get('gist')
 
     if not all([owner, repo, pr_number]):
         err("Error: Not in a PR clone directory (missing pr.* git config)")
@@ -60,22 +108,23 @@ def ingest_attachments(
     with open(desc_file, 'r') as f:
         content = f.read()
 
-    # Pattern for reference-style links: [name]: url
-    ref_link_pattern = re.compile(r'^\[([^\]]+)\]:\s+(https://github\.com/user-attachments/assets/[a-f0-9-]+)\s*$', re.MULTILINE)
-
-    matches = ref_link_pattern.findall(content)
+    # Reference-style links: [name]: url
+    matches = USER_ATTACHMENT_REF_PATTERN.findall(content)
     if not matches:
         err("No user-attachments found in reference-style links")
         return
 
     err(f"Found {len(matches)} user-attachment(s) to process")
 
-    # Store current branch
-    current_branch = proc.line('git', 'rev-parse', '--abbrev-ref', 'HEAD', log=None)
+    # Store current branch, to switch back to after committing attachments. This
+    # must precede the checkout below; dry runs never switch, so skip the lookup
+    current_branch = None if dry_run else proc.line('git', 'rev-parse', '--abbrev-ref', 'HEAD', log=None)
 
-    # Check if attachments branch exists
-    branches = proc.lines('git', 'branch', '-a', log=None) or []
-    branch_exists = any(b.strip().endswith(branch) for b in branches)
+    # Check if attachments branch exists, locally or (for `checkout` to track) on a remote
+    branch_exists = (
+        proc.check('git', 'show-ref', '--verify', '--quiet', f'refs/heads/{branch}', log=None)
+        or bool(proc.text('git', 'for-each-ref', '--count=1', '--format=%(refname)', f'refs/remotes/*/{branch}', log=None))
+    )
 
     if not branch_exists:
         if dry_run:
@@ -97,79 +146,78 @@ def ingest_attachments(
         else:
             proc.run('git', 'checkout', branch, log=None)
 
-    # Process each attachment
+    # Look up the gist owner and download attachments up front (network-bound);
+    # git steps below stay sequential
+    saved = []  # (name, url, filename)
     replacements = []
-    for name, url in matches:
+    downloads = [None] * len(matches)  # Per-attachment download error, if any
+    if not dry_run:
+        token = gh_token()
+
+        # Get GitHub username from gist metadata (same for every attachment)
+        github_username = None
+        try:
+            with GhClient(token=token) as client:
+                github_username = client.get(f'/gists/{gist_id}')['owner']['login']
+        except Exception as e:
+            err(f"Warning: Could not get gist owner: {e}")
+
+        if not github_username:
+            err(f"Error: Could not determine GitHub username for gist {gist_id}")
+            err("The gist permalink requires the owner's username")
+            exit(1)
+
+        for name, url in matches:
+            err(f"Downloading: {name} from {url}")
+        # Each attachment lands in `<asset_id>.part`, renamed once its type is known
+        downloads = _download_all([(url, f"{url.split('/')[-1]}.part") for _, url in matches], token)
+
+    for (name, url), download_error in zip(matches, downloads):
         # Extract asset ID from URL
         asset_id = url.split('/')[-1]
 
         if dry_run:
             err(f"[DRY-RUN] Would download: {name} from {url}")
         else:
-            err(f"Downloading: {name} from {url}")
+            if isinstance(download_error, GhApiError):
+                err(f"Failed to download {url}")
+                continue
+            if download_error:
+                err(f"Error downloading {url}: {download_error}")
+                continue
+            part_path = f"{asset_id}.part"
 
-            # Download via gh api
             try:
-                # gh api returns binary data for these URLs
-                result = subprocess.run(['gh', 'api', url, '--method', 'GET'],
-                                       capture_output=True, check=False)
-                if result.returncode != 0:
-                    err(f"Failed to download {url}")
-                    continue
-
-                data = result.stdout
-
-                # Try to determine file extension from content
-                # Common magic bytes
-                ext = '.bin'
-                if data.startswith(b'\x89PNG'):
-                    ext = '.png'
-                elif data.startswith(b'\xff\xd8\xff'):
-                    ext = '.jpg'
-                elif data.startswith(b'GIF8'):
-                    ext = '.gif'
-                elif data.startswith(b'%PDF'):
-                    ext = '.pdf'
-                elif data.startswith(b'PK\x03\x04'):
-                    ext = '.zip'
+                # Determine file extension from the content's magic bytes
+                with open(part_path, 'rb') as f:
+                    head = f.read(MAGIC_HEAD_SIZE)
+                ext = next((ext for magic, ext in MAGIC_EXTENSIONS if head.startswith(magic)), '.bin')
 
                 # Use asset_id as filename with detected extension
                 filename = f"{asset_id}{ext}"
-
-                # Write file
-                with open(filename, 'wb') as f:
-                    f.write(data)
-
-                # Add and commit
-                proc.run('git', 'add', filename, log=None)
-                proc.run('git', 'commit', '-m', f'Add {name}: {filename}', log=None)
+                Path(part_path).replace(filename)
 
                 err(f"Saved as: {filename}")
-
-                # Get the blob SHA for permalink
-                blob_sha = proc.line('git', 'rev-parse', f'HEAD:{filename}', log=None)
-
-                # Get GitHub username from gist metadata via gh api
-                github_username = None
-                try:
-                    github_username = proc.line('gh', 'api', f'/gists/{gist_id}', '--jq', '.owner.login', log=None)
-                except Exception as e:
-                    err(f"Warning: Could not get gist owner: {e}")
-
-                if not github_username:
-                    err(f"Error: Could not determine GitHub username for gist {gist_id}")
-                    err("The gist permalink requires the owner's username")
-                    exit(1)
-
-                # Build gist permalink with username for githubusercontent.com format
-                gist_url = f"https://gist.githubusercontent.com/{github_username}/{gist_id}/raw/{blob_sha}/{filename}"
-
-                replacements.append((name, url, gist_url))
+                saved.append((name, url, filename))
 
             except Exception as e:
-                err(f"Error downloading {url}: {e}")
+                err(f"Error saving {url}: {e}")
                 continue
 
+    if saved:
+        # Blob SHAs (for permalinks) come straight from `hash-object`, which also
+        # writes the blobs; then all files are staged and committed together
+        filenames = [filename for _, _, filename in saved]
+        blob_shas = proc.lines('git', 'hash-object', '-w', '--', *filenames, log=None)
+        proc.run('git', 'add', '--', *filenames, log=None)
+        commit_lines = '\n'.join(f'- {name}: {filename}' for name, _, filename in saved)
+        proc.run('git', 'commit', '-m', f'Add {len(saved)} attachment(s)\n\n{commit_lines}', log=None)
+
+        for (name, url, filename), blob_sha in zip(saved, blob_shas):
+            # Build gist permalink with username for githubusercontent.com format
+            gist_url = f"https://gist.githubusercontent.com/{github_username}/{gist_id}/raw/{blob_sha}/{filename}"
+            replacements.append((name, url, gist_url))
+
     if not dry_run and replacements:
         # Push attachments branch
         err(f"Pushing {branch} branch to gist...")
@@ -178,12 +226,10 @@ def ingest_attachments(
         # Switch back to main branch
         proc.run('git', 'checkout', current_branch, log=None)
 
-        # Update description file with new URLs
-        new_content = content
-        for name, old_url, new_url in replacements:
-            pattern = f"[{name}]: {old_url}"
-            replacement = f"[{name}]: {new_url}"
-            new_content = new_content.replace(pattern, replacement)
+        # Update description file with new URLs, in one pass over the content
+        ref_map = {f"[{name}]: {old_url}": f"[{name}]: {new_url}" for name, old_url, new_url in replacements}
+        ref_pattern = re.compile('|'.join(re.escape(ref) for ref in ref_map))
+        new_content = ref_pattern.sub(lambda m: ref_map[m.group(0)], content)
 
         # Write updated content
         with open(desc_file, 'w') as f:
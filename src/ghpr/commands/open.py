@@ -1,25 +1,64 @@
 """Open command - open PR or gist in web browser."""
 
-import webbrowser
+import shlex
+import sys
+from functools import lru_cache
+from os import environ
+from shutil import which
+from subprocess import DEVNULL, Popen
+
 from utz import proc, err
 from utz.cli import flag
 
-from ..config import get_pr_info_from_path
+from ..config import get_pr_info_from_path, load_pr_config
 from ..files import find_description_file
 from ..gist import find_gist_remote
+from ..gitcfg import find_gist_remote_fast, read_config
 from ..patterns import GIST_ID_PATTERN, PR_FILENAME_PATTERN
 
 
+@lru_cache(maxsize=None)
+def _opener() -> tuple[str, ...] | None:
+    """Command that opens a URL: first `$BROWSER` entry, else `open` (macOS) / `xdg-open`."""
+    browser = environ.get('BROWSER', '').split(':')[0]
+    if browser:
+        return tuple(shlex.split(browser))
+    cmd = which('open') if sys.platform == 'darwin' else which('xdg-open')
+    return (cmd,) if cmd else None
+
+
+def open_url(url: str) -> None:
+    """Open `url` in a browser without waiting on it.
+
+    Spawns the opener detached, which skips `webbrowser`'s browser probing;
+    falls back to `webbrowser.open` where no opener is found (e.g. Windows).
+    """
+    opener = _opener()
+    if not opener:
+        import webbrowser
+        webbrowser.open(url)
+        return
+    if any('%s' in arg for arg in opener):
+        cmd = [arg.replace('%s', url) for arg in opener]
+    else:
+        cmd = [*opener, url]
+    Popen(cmd, stdin=DEVNULL, stdout=DEVNULL, stderr=DEVNULL, start_new_session=True)
+
+
 def open_pr(gist: bool) -> None:
     """Open PR or gist in web browser."""
+
+    # Read all pr.* git config once
+    pr_config = load_pr_config()
+
     # Get PR info
-    owner, repo, pr_number = get_pr_info_from_path()
+    owner, repo, pr_number = get_pr_info_from_path(pr_config=pr_config)
 
     if not all([owner, repo, pr_number]):
         # Try from git config
-        owner = proc.line('git', 'config', 'pr.owner', err_ok=True, log=None) or ''
-        repo = proc.line('git', 'config', 'pr.repo', err_ok=True, log=None) or ''
-        pr_number = proc.line('git', 'config', 'pr.number', err_ok=True, log=None) or ''
+        owner = pr_config.get('owner', '')
+        repo = pr_config.get('repo', '')
+        pr_number = pr_config.get('number', '')
 
     if not all([owner, repo, pr_number]):
         # Check for PR-specific files
@@ -31,26 +70,26 @@ def open_pr(gist: bool) -> None:
                 repo = match.group(1)
                 pr_number = match.group(2)
                 # Try to get owner from git config
-                owner = proc.line('git', 'config', 'pr.owner', err_ok=True, log=None) or ''
+                owner = pr_config.get('owner', '')
 
     if gist:
         # Open gist
-        gist_id = proc.line('git', 'config', 'pr.gist', err_ok=True, log=None)
+        gist_id = pr_config.get('gist')
         if not gist_id:
-            # Try to find from remote
-            gist_remote = find_gist_remote()
-            if gist_remote:
-                remotes = proc.lines('git', 'remote', '-v', log=None)
-                for remote_line in remotes:
-                    if remote_line.startswith(f"{gist_remote}\t") and 'gist.github.com' in remote_line:
-                        match = GIST_ID_PATTERN.search(remote_line)
-                        if match:
-                            gist_id = match.group(1)
-                            break
+            # Try to find from remote: read from `.git/config` at a repo root, else ask git
+            cfg = read_config()
+            if cfg:
+                _, gist_id = find_gist_remote_fast(cfg)
+            else:
+                gist_remote = find_gist_remote()
+                if gist_remote:
+                    url = proc.line('git', 'remote', 'get-url', gist_remote, err_ok=True, log=None)
+                    match = GIST_ID_PATTERN.search(url or '')
+                    gist_id = match.group(1) if match else None
 
         if gist_id:
             gist_url = f"https://gist.github.com/{gist_id}"
-            webbrowser.open(gist_url)
+            open_url(gist_url)
             err(f"Opened: {gist_url}")
         else:
             err("No gist found for this PR")
@@ -59,7 +98,7 @@ def open_pr(gist: bool) -> None:
         # Open PR
         if all([owner, repo, pr_number]):
             pr_url = f"https://github.com/{owner}/{repo}/pull/{pr_number}"
-            webbrowser.open(pr_url)
+            open_url(pr_url)
             err(f"Opened: {pr_url}")
         else:
             err("Error: No PR found in current directory")
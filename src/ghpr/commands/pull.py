@@ -1,15 +1,28 @@
 """Pull command - pull latest from GitHub PR/Issue."""
 
-from glob import glob
+from concurrent.futures import ThreadPoolExecutor
+from os import scandir
 from pathlib import Path
 from utz import proc, err
 from utz.cli import flag, opt
 
-from ..api import get_pr_metadata, get_item_metadata, get_item_comments
-from ..comments import write_comment_file, read_comment_file, get_comment_id_from_filename
-from ..config import get_pr_info_from_path
+from ..api import get_pr_metadata, get_item_bundle, get_item_metadata
+from ..comments import write_comment_file, read_comment_file
+from ..config import get_pr_info_from_path, load_pr_config
 from ..files import write_description_with_link_ref
 from ..gist import extract_gist_footer
+from ..patterns import COMMENT_FILENAME_PATTERN
+from . import push as push_module
+
+
+def _has_drafts() -> bool:
+    """Whether there are unposted comment or review-reply drafts (`new*.md`, `z-<id>-new*.md`)."""
+    from ..reviews import DRAFT_RE
+    with scandir() as entries:
+        return any(
+            (entry.name.startswith('new') and entry.name.endswith('.md')) or DRAFT_RE.match(entry.name)
+            for entry in entries
+        )
 
 
 def pull(
@@ -21,26 +34,32 @@ def pull(
     no_comments: bool,
 ) -> None:
     """Pull latest description and comments from GitHub PR/Issue."""
-    # Import push here to avoid circular dependency
-    from . import push as push_module
-
     # First pull
     err("Pulling latest from GitHub...")
 
+    # Read all pr.* git config once
+    pr_config = load_pr_config()
+
     # Get PR/Issue info
-    owner, repo, pr_number = get_pr_info_from_path()
+    owner, repo, pr_number = get_pr_info_from_path(pr_config=pr_config)
 
     if not all([owner, repo, pr_number]):
-        owner = proc.line('git', 'config', 'pr.owner', err_ok=True, log=None) or ''
-        repo = proc.line('git', 'config', 'pr.repo', err_ok=True, log=None) or ''
-        pr_number = proc.line('git', 'config', 'pr.number', err_ok=True, log=None) or ''
+        owner = pr_config.get('owner', '')
+        repo = pr_config.get('repo', '')
+        pr_number = pr_config.get('number', '')
 
         if not all([owner, repo, pr_number]):
             err("Error: Could not determine PR/Issue")
             exit(1)
 
-    # Get latest PR/Issue data
-    item_data, item_type = get_item_metadata(owner, repo, pr_number)
+    # Get latest PR/Issue data, and (unless skipped) its comments in the same GraphQL
+    # request, which also tells us the item type
+    if no_comments:
+        # If the type isn't configured, `get_item_metadata` detects it
+        item_data, item_type = get_item_metadata(owner, repo, pr_number, pr_config.get('type'))
+        remote_comments = []
+    else:
+        item_data, item_type, remote_comments = get_item_bundle(owner, repo, pr_number)
     if not item_data:
         exit(1)
 
@@ -53,64 +72,75 @@ def pull(
     url = item_data['url']
 
     # Strip any gist footer from the body before saving locally
-    body_without_footer, _ = extract_gist_footer(body)
+    body_without_footer, remote_gist_url = extract_gist_footer(body)
 
     # Write using helper to avoid duplicate link definitions
     write_description_with_link_ref(desc_file, owner, repo, pr_number, title, body_without_footer, url)
 
-    # Check if there are changes to description
     item_label = 'issue' if item_type == 'issue' else 'PR'
-    desc_changed = not proc.check('git', 'diff', '--exit-code', desc_filename, log=None)
-    if desc_changed:
-        proc.run('git', 'add', desc_filename, log=None)
-        err(f"Description updated from {item_label}")
+    # Comment paths to stage (or unstage and delete); checked for changes, along
+    # with the description, in one `git status` below
+    to_add = []
+    to_rm = []
 
     # Sync comments (default enabled, skip if --no-comments)
     new_comments = 0
     updated_comments = 0
     if not no_comments:
         err("Syncing comments from remote...")
-        # Get item type
-        item_type = proc.line('git', 'config', 'pr.type', err_ok=True, log=None)
-        if not item_type:
-            _, item_type = get_item_metadata(owner, repo, pr_number)
-
-        remote_comments = get_item_comments(owner, repo, pr_number, item_type)
         if remote_comments:
-            existing_files = glob('z[0-9]*.md')
-            # Map comment ID to filename
-            existing_id_to_file = {get_comment_id_from_filename(f): f for f in existing_files if get_comment_id_from_filename(f)}
-
-            for comment in remote_comments:
-                comment_id = str(comment['id'])
-                author = comment['user']['login']
-                created_at = comment['created_at']
-                updated_at = comment.get('updated_at')
+            # Map comment ID to filename, in one directory scan and one regex match per entry
+            with scandir() as entries:
+                existing_id_to_file = {
+                    match.group(1): entry.name
+                    for entry in entries
+                    if (match := COMMENT_FILENAME_PATTERN.match(entry.name))
+                }
+
+            # Partition remote comments into already-synced and new, up front
+            remote_by_id = {str(comment['id']): comment for comment in remote_comments}
+            synced_ids = remote_by_id.keys() & existing_id_to_file.keys()
+            new_ids = remote_by_id.keys() - synced_ids
+
+            # Read the local copies of already-synced comments concurrently (independent small files)
+            # (iterating `remote_by_id` keeps output in remote order)
+            update_ids = [comment_id for comment_id in remote_by_id if comment_id in synced_ids]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                local_bodies = list(executor.map(
+                    lambda comment_id: read_comment_file(Path(existing_id_to_file[comment_id]))[3],
+                    update_ids,
+                ))
+
+            for comment_id, local_body in zip(update_ids, local_bodies):
+                comment = remote_by_id[comment_id]
                 body = comment.get('body', '')
-
-                if comment_id in existing_id_to_file:
-                    # Use the actual filename (which includes author)
+                if local_body == body:
+                    continue
+                if dry_run:
+                    err(f"[DRY-RUN] Would update comment {comment_id}")
+                else:
+                    # Write will create z{id}-{author}.md (the existing filename may lack the author)
                     existing_file = existing_id_to_file[comment_id]
-                    comment_file = Path(existing_file)
-                    _, _, _, local_body = read_comment_file(comment_file)
-                    if local_body != body:
-                        if dry_run:
-                            err(f"[DRY-RUN] Would update comment {comment_id}")
-                        else:
-                            # Write will create z{id}-{author}.md
-                            new_file = write_comment_file(comment_id, author, created_at, updated_at, body)
-                            # If filename changed (legacy z{id}.md → z{id}-{author}.md), remove old
-                            if str(new_file) != existing_file:
-                                proc.run('git', 'rm', existing_file, log=None)
-                            proc.run('git', 'add', str(new_file), log=None)
-                            updated_comments += 1
+                    new_file = str(write_comment_file(
+                        comment_id, comment['user']['login'], comment['created_at'], comment.get('updated_at'), body,
+                    ))
+                    # If filename changed (legacy z{id}.md → z{id}-{author}.md), remove old
+                    if new_file != existing_file:
+                        to_rm.append(existing_file)
+                    to_add.append(new_file)
+                    updated_comments += 1
+
+            for comment_id in (comment_id for comment_id in remote_by_id if comment_id in new_ids):
+                comment = remote_by_id[comment_id]
+                author = comment['user']['login']
+                if dry_run:
+                    err(f"[DRY-RUN] Would add comment {comment_id} by {author}")
                 else:
-                    if dry_run:
-                        err(f"[DRY-RUN] Would add comment {comment_id} by {author}")
-                    else:
-                        comment_file = write_comment_file(comment_id, author, created_at, updated_at, body)
-                        proc.run('git', 'add', str(comment_file), log=None)
-                        new_comments += 1
+                    comment_file = write_comment_file(
+                        comment_id, author, comment['created_at'], comment.get('updated_at'), comment.get('body', ''),
+                    )
+                    to_add.append(str(comment_file))
+                    new_comments += 1
 
             if new_comments > 0:
                 err(f"Found {new_comments} new comment(s)")
@@ -121,6 +151,24 @@ def pull(
         else:
             err("No comments found remotely")
 
+    # One `git status` covers the description and every written/removed comment file
+    for path in to_rm:
+        Path(path).unlink(missing_ok=True)
+    status = proc.text('git', '--literal-pathspecs', 'status', '--porcelain', '-z', '--', desc_filename, *to_add, *to_rm, log=None) or ''
+    # `-z` entries are "XY <path>" (NUL-terminated; renames aren't detected for pathspecs like these)
+    changed = {entry[3:] for entry in status.split('\0') if entry}
+    desc_changed = desc_filename in changed
+    if desc_changed:
+        err(f"Description updated from {item_label}")
+
+    # Stage everything through one `git update-index`, paths streamed over stdin
+    paths = [path for path in [desc_filename, *to_add, *to_rm] if path in changed]
+    if paths:
+        proc.output(
+            'git', 'update-index', '--add', '--remove', '-z', '--stdin',
+            input=''.join(f'{path}\0' for path in paths).encode(), log=None,
+        )
+
     # Sync review threads (PR-only, default enabled, skip if --no-comments)
     review_threads = review_new = review_updated = 0
     if not no_comments and item_type == 'pr':
@@ -152,11 +200,22 @@ def pull(
     else:
         err(f"No changes from {item_label}")
 
+    # Nothing changed, and nothing local is waiting to go out: pushing would just
+    # re-send what was pulled (a gist footer, if configured, is already on the remote)
+    pulled_changes = desc_changed or new_comments > 0 or updated_comments > 0 or review_changed
+    if (
+        not pulled_changes and not gist and not footer and not open_browser
+        and (remote_gist_url or not pr_config.get('gist'))
+        and not _has_drafts()
+    ):
+        err("Nothing to push")
+        return
+
     # Now push our version back
     err(f"Pushing to {item_label}...")
     # Convert pull's footer boolean to push's footer count
     footer_count = 1 if footer else 0 if footer is False else 0
-    push_module.push(gist, dry_run, footer_count, no_footer=False, open_browser=open_browser, images=False, gist_private=gist_private, no_comments=no_comments, force_others=False)
+    push_module.push(gist, dry_run, footer_count, no_footer=False, open_browser=open_browser, images=False, gist_private=gist_private, no_comments=no_comments, force_others=False, item_type=item_type)
 
 
 def register(cli):
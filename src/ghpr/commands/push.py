@@ -1,23 +1,66 @@
 """Push command - push local description and comments to GitHub PR/Issue."""
 
 import sys
-import webbrowser
-from glob import glob
-from os import unlink
-from os.path import exists
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from tempfile import NamedTemporaryFile, TemporaryDirectory
+from tempfile import TemporaryDirectory
+from threading import local
 from click import Context
 from utz import proc, err
 from utz.cli import opt, flag
 
-from ..api import get_item_metadata, get_item_comments, get_current_github_user
-from ..comments import read_comment_file, write_comment_file, get_comment_id_from_filename
-from ..config import get_pr_info_from_path
+from ..api import get_current_github_user, get_push_context
+from ..comments import read_comment_file, write_comment_file, get_comment_id_from_filename, list_comment_files
+from ..config import get_pr_info_from_path, load_pr_config
 from ..files import read_description_from_git, get_expected_description_filename, process_images_in_description
+from ..ghclient import GhApiError, GhClient
+from ..gitcfg import find_gist_remote_fast, read_config
+from ..gitpipe import GitCatFile
 from ..gist import add_gist_footer, create_gist, GIST_URL_WITH_USER_PATTERN, DEFAULT_GIST_REMOTE, find_gist_remote
 from ..patterns import extract_title_from_first_line
 from ..render import render_comment_diff, render_unified_diff
+from .open import open_url
+
+
+def _patch_comments(
+    owner: str,
+    repo: str,
+    updates: list[tuple[str, str]],
+    client: GhClient,
+) -> list[Exception | None]:
+    """PATCH `(comment_id, body)` updates concurrently, returning each one's exception (or None), in order.
+
+    `GhClient` isn't thread-safe, so with more than one update each worker
+    thread opens its own (sharing `client`'s token); a single update just uses `client`.
+    """
+    def patch(update: tuple[str, str], client: GhClient) -> Exception | None:
+        comment_id, body = update
+        try:
+            client.request('PATCH', f'/repos/{owner}/{repo}/issues/comments/{comment_id}', {'body': body})
+        except Exception as e:
+            return e
+
+    if len(updates) <= 1:
+        return [patch(update, client) for update in updates]
+
+    token = client.token
+    thread_local = local()
+    clients = []
+
+    def patch_in_thread(update: tuple[str, str]) -> Exception | None:
+        thread_client = getattr(thread_local, 'client', None)
+        if not thread_client:
+            thread_client = thread_local.client = GhClient(token=token)
+            clients.append(thread_client)
+        return patch(update, thread_client)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(patch_in_thread, updates))
+    finally:
+        for thread_client in clients:
+            thread_client.close()
 
 
 def push(
@@ -30,389 +73,378 @@ def push(
     gist_private: bool | None,
     no_comments: bool,
     force_others: bool,
+    item_type: str | None = None,
 ) -> None:
-    """Push local description and comments to the PR/Issue."""
+    """Push local description and comments to the PR/Issue.
 
-    # Get item info from current directory
-    owner, repo, number = get_pr_info_from_path()
-    item_type = None
+    Args:
+        item_type: 'pr' or 'issue', if the caller already knows it (e.g. `pull`, which
+            just fetched the item); otherwise read from `pr.type`, or detected via the API
+    """
 
-    if not all([owner, repo, number]):
-        # Try git config
-        try:
-            owner = proc.line('git', 'config', 'pr.owner', err_ok=True, log=None) or ''
-            repo = proc.line('git', 'config', 'pr.repo', err_ok=True, log=None) or ''
-            number = proc.line('git', 'config', 'pr.number', err_ok=True, log=None) or ''
-            item_type = proc.line('git', 'config', 'pr.type', err_ok=True, log=None)
-        except Exception as e:
-            err(f"Error: Could not determine PR/Issue from directory or git config: {e}")
+    # Read all pr.* git config once
+    pr_config = load_pr_config()
+    # REST calls below share one HTTPS connection (and token lookup), instead of a `gh api`
+    # spawn each; likewise, blobs from HEAD (description, draft comments) are read over one
+    # `git cat-file --batch`. Both are closed on every exit path (`exit`, exceptions), since
+    # `create` and `pull` call `push` in-process.
+    with GhClient() as client, GitCatFile() as blobs:
+        # Get item info from current directory
+        owner, repo, number = get_pr_info_from_path(pr_config=pr_config)
+        item_type = item_type or pr_config.get('type')
+
+        if not all([owner, repo, number]):
+            # Try git config
+            owner = pr_config.get('owner', '')
+            repo = pr_config.get('repo', '')
+            number = pr_config.get('number', '')
+
+        # One GraphQL request fetches the remote item (detecting its type, if not
+        # specified), its comments, and the current user, when anything below needs them
+        remote_data = None
+        remote_comments = []
+        current_user = None
+        if not item_type or dry_run or not no_comments:
+            remote_data, detected_type, remote_comments, current_user = get_push_context(owner, repo, number)
+            item_type = item_type or detected_type or 'pr'
+            if not no_comments and not current_user:
+                current_user = get_current_github_user()
+
+        item_label = 'issue' if item_type == 'issue' else 'PR'
+
+        # Read the current description file (from HEAD, not working directory)
+        desc_content, desc_file = read_description_from_git('HEAD', blobs=blobs)
+        if not desc_content:
+            expected_filename = get_expected_description_filename(owner, repo, number)
+            err(f"Error: Could not read {expected_filename} or DESCRIPTION.md from HEAD")
+            err("Make sure you've committed your changes")
             exit(1)
 
-    # Detect type if not specified
-    if not item_type:
-        # Try to detect by checking both PR and issue
-        _, item_type = get_item_metadata(owner, repo, number)
-
-    item_label = 'issue' if item_type == 'issue' else 'PR'
-
-    # Read the current description file (from HEAD, not working directory)
-    desc_content, desc_file = read_description_from_git('HEAD')
-    if not desc_content:
-        expected_filename = get_expected_description_filename(owner, repo, number)
-        err(f"Error: Could not read {expected_filename} or DESCRIPTION.md from HEAD")
-        err("Make sure you've committed your changes")
-        exit(1)
-
-    lines = desc_content.split('\n')
-    if not lines:
-        err("Error: Description file is empty")
-        exit(1)
-
-    # Parse the file
-    first_line = lines[0].strip()
-    # Remove the [owner/repo#num] or [owner/repo#num](url) prefix to get the title
-    title = extract_title_from_first_line(first_line)
-
-    # Get body (skip first line and any immediately following blank lines)
-    body_lines = lines[1:]
-    while body_lines and not body_lines[0].strip():
-        body_lines = body_lines[1:]
-    body = '\n'.join(body_lines).rstrip()
-
-    # Process images if requested
-    if images:
-        err("Processing images in description...")
-        body = process_images_in_description(body, owner, repo, dry_run)
-
-    # Check if we have an existing gist
-    try:
-        gist_id = proc.line('git', 'config', 'pr.gist', err_ok=True, log=None)
+        lines = desc_content.split('\n')
+        if not lines:
+            err("Error: Description file is empty")
+            exit(1)
+
+        # Parse the file
+        first_line = lines[0].strip()
+        # Remove the [owner/repo#num] or [owner/repo#num](url) prefix to get the title
+        title = extract_title_from_first_line(first_line)
+
+        # Get body (skip first line and any immediately following blank lines)
+        body_lines = lines[1:]
+        while body_lines and not body_lines[0].strip():
+            body_lines = body_lines[1:]
+        body = '\n'.join(body_lines).rstrip()
+
+        # Process images if requested
+        if images:
+            err("Processing images in description...")
+            body = process_images_in_description(body, owner, repo, dry_run)
+
+        # Check if we have an existing gist
+        gist_id = pr_config.get('gist')
         has_gist = bool(gist_id)
-    except Exception:
-        # Reading git config is optional, silently set to False
-        has_gist = False
-        gist_id = None
-
-    # Compatibility: support pr_number variable name for now
-    pr_number = number
-
-    # Determine footer behavior
-    if no_footer:
-        # -F flag: disable footer completely
-        should_add_footer = False
-        footer_visible = False
-    elif footer == 0:
-        # No -f flag: auto mode (add footer if gist exists)
-        should_add_footer = has_gist
-        footer_visible = False  # Default to hidden
-    elif footer == 1:
-        # -f: Hidden footer (HTML comment)
-        should_add_footer = True
-        footer_visible = False
-        gist = True  # Ensure we sync to gist if adding footer
-    elif footer >= 2:
-        # -ff: Visible footer (markdown)
-        should_add_footer = True
-        footer_visible = True
-        gist = True  # Ensure we sync to gist if adding footer
-    else:
-        should_add_footer = False
-        footer_visible = False
-
-    # Handle gist syncing first (to get URL for footer if needed)
-    gist_url = None
-    if gist or should_add_footer:
-        if dry_run:
-            err("[DRY-RUN] Would sync to gist")
-            # Try to get existing gist URL
-            if has_gist:
-                gist_url = f'https://gist.github.com/{gist_id}'
-            else:
-                gist_url = 'https://gist.github.com/NEW_GIST'
+
+        # Compatibility: support pr_number variable name for now
+        pr_number = number
+
+        # Determine footer behavior
+        if no_footer:
+            # -F flag: disable footer completely
+            should_add_footer = False
+            footer_visible = False
+        elif footer == 0:
+            # No -f flag: auto mode (add footer if gist exists)
+            should_add_footer = has_gist
+            footer_visible = False  # Default to hidden
+        elif footer == 1:
+            # -f: Hidden footer (HTML comment)
+            should_add_footer = True
+            footer_visible = False
+            gist = True  # Ensure we sync to gist if adding footer
+        elif footer >= 2:
+            # -ff: Visible footer (markdown)
+            should_add_footer = True
+            footer_visible = True
+            gist = True  # Ensure we sync to gist if adding footer
         else:
-            if gist or has_gist:  # Sync if explicitly requested or if gist exists
-                gist_url = sync_to_gist(owner, repo, pr_number, desc_content, return_url=True, gist_private=gist_private)
+            should_add_footer = False
+            footer_visible = False
+
+        # Handle gist syncing first (to get URL for footer if needed)
+        gist_url = None
+        if gist or should_add_footer:
+            if dry_run:
+                err("[DRY-RUN] Would sync to gist")
+                # Try to get existing gist URL
+                if has_gist:
+                    gist_url = f'https://gist.github.com/{gist_id}'
+                else:
+                    gist_url = 'https://gist.github.com/NEW_GIST'
+            else:
+                if gist or has_gist:  # Sync if explicitly requested or if gist exists
+                    gist_url = sync_to_gist(
+                        owner, repo, pr_number, desc_content,
+                        return_url=True, gist_private=gist_private, pr_config=pr_config, client=client,
+                    )
+
+        # Add footer if we should
+        if should_add_footer and gist_url:
+            body = add_gist_footer(body, gist_url, visible=footer_visible)
+            if dry_run:
+                err(f"[DRY-RUN] Would add {'visible' if footer_visible else 'hidden'} footer with gist URL: {gist_url}")
+            else:
+                err(f"Added {'visible' if footer_visible else 'hidden'} footer with gist URL: {gist_url}")
+        elif should_add_footer and not gist_url:
+            err("Error: Should add footer but no gist URL available")
+            raise ValueError("Footer requires gist URL but none available")
 
-    # Add footer if we should
-    if should_add_footer and gist_url:
-        body = add_gist_footer(body, gist_url, visible=footer_visible)
+        # Update the PR/Issue
         if dry_run:
-            err(f"[DRY-RUN] Would add {'visible' if footer_visible else 'hidden'} footer with gist URL: {gist_url}")
+            # Determine if we should use color
+            use_color = sys.stderr.isatty()
+
+            # ANSI color codes
+            RED = '\033[31m' if use_color else ''
+            GREEN = '\033[32m' if use_color else ''
+            CYAN = '\033[36m' if use_color else ''
+            YELLOW = '\033[33m' if use_color else ''
+            RESET_COLOR = '\033[0m' if use_color else ''
+            BOLD = '\033[1m' if use_color else ''
+
+            # Show diff instead of preview
+            err(f"\n{BOLD}=== Preview of changes (dry-run) ==={RESET_COLOR}\n")
+
+            # Compare against the remote data fetched above
+            pr_data = remote_data
+            if pr_data:
+                remote_title = pr_data['title']
+                remote_body = (pr_data['body'] or '').rstrip()
+
+                # Strip footers for comparison
+                from ghpr.gist import extract_gist_footer
+                local_body_without_footer, _ = extract_gist_footer(body)
+                remote_body_without_footer, _ = extract_gist_footer(remote_body)
+
+                # Compare titles
+                if title != remote_title:
+                    err(f"{BOLD}{YELLOW}=== Title Changes ==={RESET_COLOR}")
+                    err(f"{RED}Remote:{RESET_COLOR} {remote_title}")
+                    err(f"{GREEN}Local: {RESET_COLOR} {title}\n")
+                else:
+                    err(f"{BOLD}{CYAN}=== Title: No changes ==={RESET_COLOR}\n")
+
+                # Compare bodies
+                if local_body_without_footer != remote_body_without_footer:
+                    err(f"{BOLD}{YELLOW}=== Body Changes ==={RESET_COLOR}")
+                    render_unified_diff(
+                        remote_body_without_footer,
+                        local_body_without_footer,
+                        fromfile='Remote',
+                        tofile='Local (will be pushed)',
+                        use_color=use_color
+                    )
+                    err("")  # blank line
+                else:
+                    err(f"{BOLD}{CYAN}=== Body: No changes ==={RESET_COLOR}\n")
+            else:
+                err(f"[DRY-RUN] Would update {item_label} {owner}/{repo}#{pr_number}")
+                err(f"  Title: {title}")
+                err(f"  Body: {len(body)} chars")
         else:
-            err(f"Added {'visible' if footer_visible else 'hidden'} footer with gist URL: {gist_url}")
-    elif should_add_footer and not gist_url:
-        err("Error: Should add footer but no gist URL available")
-        raise ValueError("Footer requires gist URL but none available")
-
-    # Update the PR/Issue
-    if dry_run:
-        # Determine if we should use color
-        use_color = sys.stderr.isatty()
+            err(f"Updating {item_label} {owner}/{repo}#{pr_number}...")
 
-        # Import difflib for comparison
-        import difflib
-
-        # ANSI color codes
-        RED = '\033[31m' if use_color else ''
-        GREEN = '\033[32m' if use_color else ''
-        CYAN = '\033[36m' if use_color else ''
-        YELLOW = '\033[33m' if use_color else ''
-        RESET_COLOR = '\033[0m' if use_color else ''
-        BOLD = '\033[1m' if use_color else ''
-
-        # Show diff instead of preview
-        err(f"\n{BOLD}=== Preview of changes (dry-run) ==={RESET_COLOR}\n")
-
-        # Get remote data for comparison
-        pr_data, _ = get_item_metadata(owner, repo, pr_number, item_type)
-        if pr_data:
-            remote_title = pr_data['title']
-            remote_body = (pr_data['body'] or '').rstrip()
-
-            # Strip footers for comparison
-            from ghpr.gist import extract_gist_footer
-            local_body_without_footer, _ = extract_gist_footer(body)
-            remote_body_without_footer, _ = extract_gist_footer(remote_body)
-
-            # Compare titles
-            if title != remote_title:
-                err(f"{BOLD}{YELLOW}=== Title Changes ==={RESET_COLOR}")
-                err(f"{RED}Remote:{RESET_COLOR} {remote_title}")
-                err(f"{GREEN}Local: {RESET_COLOR} {title}\n")
-            else:
-                err(f"{BOLD}{CYAN}=== Title: No changes ==={RESET_COLOR}\n")
-
-            # Compare bodies
-            if local_body_without_footer != remote_body_without_footer:
-                err(f"{BOLD}{YELLOW}=== Body Changes ==={RESET_COLOR}")
-                render_unified_diff(
-                    remote_body_without_footer,
-                    local_body_without_footer,
-                    fromfile='Remote',
-                    tofile='Local (will be pushed)',
-                    use_color=use_color
+            # Use appropriate command for PR vs issue
+            gh_cmd = 'pr' if item_type == 'pr' else 'issue'
+            cmd = ['gh', gh_cmd, 'edit', pr_number, '-R', f'{owner}/{repo}']
+
+            if title:
+                cmd.extend(['--title', title])
+
+            if body is not None:  # Allow empty body
+                # Stream the body over stdin (`--body-file -`), avoiding command line
+                # length issues and special character problems without a temp file
+                cmd.extend(['--body-file', '-'])
+
+            try:
+                proc.output(*cmd, input=(body or '').encode(), log=None)
+                err(f"Successfully updated {item_label}")
+
+                # Get item URL if we need to open it
+                if open_browser:
+                    item_url = pr_config.get('url')
+                    if not item_url:
+                        path_part = 'pull' if item_type == 'pr' else 'issues'
+                        item_url = f"https://github.com/{owner}/{repo}/{path_part}/{pr_number}"
+                    open_url(item_url)
+                    err(f"Opened: {item_url}")
+            except Exception as e:
+                err(f"Error updating {item_label}: {e}")
+                exit(1)
+
+        # Handle comment pushing (default enabled, skip if --no-comments)
+        new_comment_renames = []  # Track (old_name, new_name) for commit message
+        if not no_comments:
+            if dry_run:
+                # In dry-run mode, just show the diff
+                render_comment_diff(
+                    owner, repo, number, item_type, use_color=use_color, dry_run=True,
+                    current_user=current_user, remote_comments=remote_comments, blobs=blobs,
                 )
-                err("")  # blank line
             else:
-                err(f"{BOLD}{CYAN}=== Body: No changes ==={RESET_COLOR}\n")
-        else:
-            err(f"[DRY-RUN] Would update {item_label} {owner}/{repo}#{pr_number}")
-            err(f"  Title: {title}")
-            err(f"  Body: {len(body)} chars")
-    else:
-        err(f"Updating {item_label} {owner}/{repo}#{pr_number}...")
+                err("Checking for comment changes...")
 
-        # Use appropriate command for PR vs issue
-        gh_cmd = 'pr' if item_type == 'pr' else 'issue'
-        cmd = ['gh', gh_cmd, 'edit', pr_number, '-R', f'{owner}/{repo}']
+                # First, handle new draft comments (new*.md files from HEAD)
+                # Get list of files in HEAD
+                try:
+                    head_files = proc.lines('git', 'ls-tree', '--name-only', 'HEAD', log=False)
+                    draft_files = [f for f in head_files if f.startswith('new') and f.endswith('.md')]
+                except Exception:
+                    draft_files = []
 
-        if title:
-            cmd.extend(['--title', title])
+                if draft_files:
+                    err(f"Found {len(draft_files)} draft comment(s) to post: {', '.join(draft_files)}")
 
-        if body is not None:  # Allow empty body
-            # Use --body-file to avoid command line length issues and special character problems
-            with NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-                f.write(body)
-                body_file = f.name
+                    for draft_file in draft_files:
+                        # Read content from HEAD
+                        try:
+                            draft_content = blobs.read(f'HEAD:{draft_file}')
+                            if draft_content is None:
+                                raise FileNotFoundError(f'HEAD:{draft_file}')
+                        except Exception as e:
+                            err(f"Warning: Could not read {draft_file} from HEAD: {e}")
+                            continue
 
-            cmd.extend(['--body-file', body_file])
+                        if not draft_content.strip():
+                            err(f"Warning: Skipping empty draft file: {draft_file}")
+                            continue
 
-        try:
-            proc.run(*cmd, log=None)
-            if body is not None:
-                unlink(body_file)  # Clean up temp file
-            err(f"Successfully updated {item_label}")
-
-            # Get item URL if we need to open it
-            if open_browser:
-                item_url = proc.line('git', 'config', 'pr.url', err_ok=True, log=None)
-                if not item_url:
-                    path_part = 'pull' if item_type == 'pr' else 'issues'
-                    item_url = f"https://github.com/{owner}/{repo}/{path_part}/{pr_number}"
-
-                webbrowser.open(item_url)
-                err(f"Opened: {item_url}")
-        except Exception as e:
-            err(f"Error updating {item_label}: {e}")
-            exit(1)
+                        # Post as new comment
+                        err(f"Posting {draft_file} as new comment...")
+                        try:
+                            result = client.request(
+                                'POST', f'/repos/{owner}/{repo}/issues/{number}/comments', {'body': draft_content},
+                            )
+                            comment_id = str(result['id'])
+                            # Now on the remote; compared below like the rest
+                            remote_comments.append(result)
+                            created_at = result['created_at']
+                            updated_at = result.get('updated_at', created_at)
 
-    # Handle comment pushing (default enabled, skip if --no-comments)
-    new_comment_renames = []  # Track (old_name, new_name) for commit message
-    if not no_comments:
-        if dry_run:
-            # In dry-run mode, just show the diff
-            current_user = get_current_github_user()
-            render_comment_diff(owner, repo, number, item_type, use_color=use_color, dry_run=True, current_user=current_user)
-        else:
-            err("Checking for comment changes...")
-            current_user = get_current_github_user()
+                            # Get the body from the response (GitHub's canonical version)
+                            posted_body = result.get('body', '').replace('\r\n', '\n')
 
-            # First, handle new draft comments (new*.md files from HEAD)
-            # Get list of files in HEAD
-            try:
-                head_files = proc.lines('git', 'ls-tree', '--name-only', 'HEAD', log=False)
-                draft_files = [f for f in head_files if f.startswith('new') and f.endswith('.md')]
-            except Exception:
-                draft_files = []
-
-            if draft_files:
-                err(f"Found {len(draft_files)} draft comment(s) to post: {', '.join(draft_files)}")
-
-                for draft_file in draft_files:
-                    # Read content from HEAD
-                    try:
-                        draft_content = proc.text('git', 'show', f'HEAD:{draft_file}', log=False)
-                    except Exception as e:
-                        err(f"Warning: Could not read {draft_file} from HEAD: {e}")
-                        continue
+                            # Create the z{id}-{author}.md file with GitHub's version
+                            comment_file = write_comment_file(comment_id, current_user, created_at, updated_at, posted_body)
+                            new_filename = comment_file.name
 
-                    if not draft_content.strip():
-                        err(f"Warning: Skipping empty draft file: {draft_file}")
-                        continue
+                            err(f"Posted comment {comment_id}, created {new_filename}")
 
-                    # Post as new comment
-                    err(f"Posting {draft_file} as new comment...")
-                    with NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-                        f.write(draft_content)
-                        temp_file = f.name
-
-                    try:
-                        result = proc.json(
-                            'gh', 'api',
-                            '-X', 'POST',
-                            f'repos/{owner}/{repo}/issues/{number}/comments',
-                            '-F', f'body=@{temp_file}',
-                            log=False
-                        )
-                        comment_id = str(result['id'])
-                        created_at = result['created_at']
-                        updated_at = result.get('updated_at', created_at)
-
-                        # Get the body from the response (GitHub's canonical version)
-                        posted_body = result.get('body', '').replace('\r\n', '\n')
-
-                        # Create the z{id}-{author}.md file with GitHub's version
-                        comment_file = write_comment_file(comment_id, current_user, created_at, updated_at, posted_body)
-                        new_filename = comment_file.name
-
-                        err(f"Posted comment {comment_id}, created {new_filename}")
-
-                        # Track for commit
-                        new_comment_renames.append((draft_file, new_filename))
-
-                    except Exception as e:
-                        err(f"Error posting {draft_file}: {e}")
-                    finally:
-                        unlink(temp_file)
-
-            # Find all local comment files (z*.md)
-            comment_files = sorted(glob('z[0-9]*.md'))
-
-            if not comment_files:
-                err("No comment files found")
-            else:
-                err(f"Found {len(comment_files)} comment file(s)")
-
-                # Get remote comments to check which are new vs edited
-                remote_comments = get_item_comments(owner, repo, number, item_type)
-                remote_comment_ids = {str(c['id']) for c in remote_comments}
-                remote_comments_by_id = {str(c['id']): c for c in remote_comments}
-
-            comments_pushed = 0
-            comments_skipped = 0
-            others_skipped = 0
-
-            for comment_file_path in comment_files:
-                comment_id = get_comment_id_from_filename(comment_file_path)
-                if not comment_id:
-                    err(f"Warning: Skipping invalid filename: {comment_file_path}")
-                    continue
-
-                # Read local comment
-                author, created_at, updated_at, body = read_comment_file(Path(comment_file_path))
-
-                if not author:
-                    err(f"Warning: Skipping {comment_file_path} - no author metadata")
-                    continue
-
-                # Check if this is a new comment or an edit
-                if comment_id in remote_comment_ids:
-                    # Editing existing comment
-                    remote_comment = remote_comments_by_id[comment_id]
-                    remote_body = remote_comment.get('body', '').replace('\r\n', '\n')
-                    comment_url = remote_comment.get('html_url', f'Comment {comment_id}')
-
-                    if body == remote_body:
-                        comments_skipped += 1
+                            # Track for commit
+                            new_comment_renames.append((draft_file, new_filename))
+
+                        except Exception as e:
+                            err(f"Error posting {draft_file}: {e}")
+
+                # Find all local comment files (z*.md)
+                comment_files = list_comment_files()
+
+                if not comment_files:
+                    err("No comment files found")
+                else:
+                    err(f"Found {len(comment_files)} comment file(s)")
+
+                    # Remote comments (fetched above) tell which are new vs edited
+                    remote_comment_ids = {str(c['id']) for c in remote_comments}
+                    remote_comments_by_id = {str(c['id']): c for c in remote_comments}
+
+                comments_pushed = 0
+                comments_skipped = 0
+                others_skipped = 0
+                updates = []  # (comment_id, body), PATCHed together after the scan
+
+                for comment_file_path in comment_files:
+                    comment_id = get_comment_id_from_filename(comment_file_path)
+                    if not comment_id:
+                        err(f"Warning: Skipping invalid filename: {comment_file_path}")
                         continue
 
-                    # Check if we own this comment (only matters if there are changes)
-                    if author != current_user and not force_others:
-                        err(f"Skipping {comment_file_path} (author: {author}, not you)")
-                        others_skipped += 1
+                    # Read local comment
+                    author, created_at, updated_at, body = read_comment_file(Path(comment_file_path))
+
+                    if not author:
+                        err(f"Warning: Skipping {comment_file_path} - no author metadata")
                         continue
 
-                    if dry_run:
-                        # Show diff for this comment
-                        err(f"\n{BOLD}{YELLOW}=== Comment {comment_id} (by {author}) - Changes ==={RESET_COLOR}")
-                        render_unified_diff(
-                            remote_body,
-                            body,
-                            fromfile=comment_url,
-                            tofile=f'{comment_file_path} (will be pushed)',
-                            use_color=use_color
-                        )
-                        err("")  # blank line
+                    # Check if this is a new comment or an edit
+                    if comment_id in remote_comment_ids:
+                        # Editing existing comment
+                        remote_comment = remote_comments_by_id[comment_id]
+                        remote_body = remote_comment.get('body', '').replace('\r\n', '\n')
+                        comment_url = remote_comment.get('html_url', f'Comment {comment_id}')
+
+                        if body == remote_body:
+                            comments_skipped += 1
+                            continue
+
+                        # Check if we own this comment (only matters if there are changes)
+                        if author != current_user and not force_others:
+                            err(f"Skipping {comment_file_path} (author: {author}, not you)")
+                            others_skipped += 1
+                            continue
+
+                        if dry_run:
+                            # Show diff for this comment
+                            err(f"\n{BOLD}{YELLOW}=== Comment {comment_id} (by {author}) - Changes ==={RESET_COLOR}")
+                            render_unified_diff(
+                                remote_body,
+                                body,
+                                fromfile=comment_url,
+                                tofile=f'{comment_file_path} (will be pushed)',
+                                use_color=use_color
+                            )
+                            err("")  # blank line
+                        else:
+                            # Update existing comment (below)
+                            updates.append((comment_id, body))
                     else:
-                        # Update existing comment
-                        try:
-                            # Create temp file for body
-                            with NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-                                f.write(body)
-                                temp_file = f.name
-
-                            proc.run('gh', 'api', '-X', 'PATCH',
-                                    f'repos/{owner}/{repo}/issues/comments/{comment_id}',
-                                    '-F', f'body=@{temp_file}', log=None)
-                            unlink(temp_file)
-                            err(f"Updated comment {comment_id}")
-                            comments_pushed += 1
-                        except Exception as e:
-                            err(f"Error updating comment {comment_id}: {e}")
-                            if temp_file and exists(temp_file):
-                                unlink(temp_file)
+                        # New comment - but we can't create with specific ID
+                        err(f"Warning: {comment_file_path} is a new comment (ID not found remotely)")
+                        err("  Cannot push new comments yet (ID would change)")
+                        comments_skipped += 1
+
+                for (comment_id, _), error in zip(updates, _patch_comments(owner, repo, updates, client)):
+                    if error:
+                        err(f"Error updating comment {comment_id}: {error}")
+                    else:
+                        err(f"Updated comment {comment_id}")
+                        comments_pushed += 1
+
+                err(f"Comments: {comments_pushed} pushed, {comments_skipped} unchanged")
+                if others_skipped:
+                    err(f"⚠ {others_skipped} comment(s) with local changes skipped (not yours). Use `ghprp -C` to force.")
+
+            # Commit the new comment renames (new*.md → z{id}-{author}.md)
+            if new_comment_renames and not dry_run:
+                # Remove old draft files and add new comment files
+                for old_name, new_name in new_comment_renames:
+                    # Use -f to force removal even if there are local modifications
+                    proc.run('git', 'rm', '-f', old_name, log=False)
+                    proc.run('git', 'add', new_name, log=False)
+
+                # Create commit message
+                if len(new_comment_renames) == 1:
+                    old, new = new_comment_renames[0]
+                    commit_msg = f'Post new comment: {old} → {new}'
                 else:
-                    # New comment - but we can't create with specific ID
-                    err(f"Warning: {comment_file_path} is a new comment (ID not found remotely)")
-                    err("  Cannot push new comments yet (ID would change)")
-                    comments_skipped += 1
-
-            err(f"Comments: {comments_pushed} pushed, {comments_skipped} unchanged")
-            if others_skipped:
-                err(f"⚠ {others_skipped} comment(s) with local changes skipped (not yours). Use `ghprp -C` to force.")
-
-        # Commit the new comment renames (new*.md → z{id}-{author}.md)
-        if new_comment_renames and not dry_run:
-            # Remove old draft files and add new comment files
-            for old_name, new_name in new_comment_renames:
-                # Use -f to force removal even if there are local modifications
-                proc.run('git', 'rm', '-f', old_name, log=False)
-                proc.run('git', 'add', new_name, log=False)
-
-            # Create commit message
-            if len(new_comment_renames) == 1:
-                old, new = new_comment_renames[0]
-                commit_msg = f'Post new comment: {old} → {new}'
-            else:
-                commit_msg = f'Post {len(new_comment_renames)} new comments'
+                    commit_msg = f'Post {len(new_comment_renames)} new comments'
 
-            proc.run('git', 'commit', '-m', commit_msg, log=False)
-            err(f"Committed {len(new_comment_renames)} new comment(s)")
+                proc.run('git', 'commit', '-m', commit_msg, log=False)
+                err(f"Committed {len(new_comment_renames)} new comment(s)")
 
     # Push review-thread changes (PR-only, default enabled, skip if --no-comments)
     if not no_comments and item_type == 'pr':
         from .. import reviews
-        current_user = get_current_github_user()
         use_color = sys.stderr.isatty()
         if dry_run:
             reviews.diff(owner, repo, number, use_color=use_color, current_user=current_user)
@@ -428,6 +460,8 @@ def sync_to_gist(
     return_url: bool = False,
     add_remote: bool = True,
     gist_private: bool = None,
+    pr_config: dict[str, str] | None = None,
+    client: GhClient | None = None,
 ) -> str | None:
     """Sync PR description to a gist.
 
@@ -439,199 +473,213 @@ def sync_to_gist(
         return_url: If True, return the gist URL with revision instead of None
         add_remote: If True, add gist as a git remote
         gist_private: If True, create private gist; if False, create public; if None, match repo visibility
+        pr_config: `pr.*` git config, if the caller already loaded it (see `load_pr_config`)
+        client: GitHub REST client to reuse (and its connection); otherwise one is opened here
 
     Returns:
         None or gist URL with revision if return_url=True
     """
+    if pr_config is None:
+        pr_config = load_pr_config()
+    # A client opened here (rather than passed in) is closed on the way out
+    with (nullcontext(client) if client else GhClient()) as client:
+        # Check if we already have a gist ID stored
+        gist_id = pr_config.get('gist')
+
+        # Find the gist remote intelligently (an explicit `pr.gist-remote` wins), from
+        # `.git/config` directly where possible
+        cfg = read_config()
+        gist_remote = find_gist_remote_fast(cfg)[0] if cfg else find_gist_remote()
+        if not gist_remote:
+            # Only set a default if we're actually going to use it
+            if gist_id or add_remote:
+                gist_remote = DEFAULT_GIST_REMOTE
+                err(f"No gist remote found, will use '{gist_remote}'")
+
+        # Determine gist visibility
+        if gist_private is not None:
+            # Explicit visibility specified
+            is_public = not gist_private  # Invert: if private flag is True, public is False
+            err(f"Using explicit gist visibility: {'PUBLIC' if is_public else 'PRIVATE'}")
+        elif gist_id:
+            # An existing gist's visibility is already fixed; only a new gist needs it
+            is_public = None
+        else:
+            # Check repository visibility to determine gist visibility
+            try:
+                try:
+                    repo_data = client.get(f'/repos/{owner}/{repo}') or {}
+                except GhApiError:
+                    repo_data = {}
+                is_public = repo_data.get('visibility', 'PUBLIC').upper() == 'PUBLIC'
+                err(f"Repository visibility: {'PUBLIC' if is_public else 'PRIVATE'}, gist will match")
+            except Exception as e:
+                err(f"Error: Could not determine repository visibility: {e}")
+                raise
 
-    # Check if we already have a gist ID stored
-    gist_id = proc.line('git', 'config', 'pr.gist', err_ok=True, log=None)
-
-    # Find the gist remote intelligently
-    gist_remote = find_gist_remote()
-    if not gist_remote:
-        # Only set a default if we're actually going to use it
-        if gist_id or add_remote:
-            gist_remote = DEFAULT_GIST_REMOTE
-            err(f"No gist remote found, will use '{gist_remote}'")
-
-    # Determine gist visibility
-    if gist_private is not None:
-        # Explicit visibility specified
-        is_public = not gist_private  # Invert: if private flag is True, public is False
-        err(f"Using explicit gist visibility: {'PUBLIC' if is_public else 'PRIVATE'}")
-    else:
-        # Check repository visibility to determine gist visibility
-        try:
-            repo_data = proc.json('gh', 'repo', 'view', f'{owner}/{repo}', '--json', 'visibility', err_ok=True, log=None) or {}
-            is_public = repo_data.get('visibility', 'PUBLIC').upper() == 'PUBLIC'
-            err(f"Repository visibility: {'PUBLIC' if is_public else 'PRIVATE'}, gist will match")
-        except Exception as e:
-            err(f"Error: Could not determine repository visibility: {e}")
-            raise
-
-    # Use PR-specific filename for better gist organization
-    pr_filename = f'{repo}#{pr_number}.md'
-    local_filename = pr_filename  # Use same filename locally
-    description = f'{owner}/{repo}#{pr_number} - 2-way sync via ghpr (https://github.com/runsascoded/ghpr)'
-    gist_url = None
-
-    if gist_id:
-        # Update existing gist
-        err(f"Updating gist {gist_id}...")
+        # Use PR-specific filename for better gist organization
+        pr_filename = f'{repo}#{pr_number}.md'
+        local_filename = pr_filename  # Use same filename locally
+        description = f'{owner}/{repo}#{pr_number} - 2-way sync via ghpr (https://github.com/runsascoded/ghpr)'
+        gist_url = None
 
-        # Check if we need to rename the file in the gist
-        try:
-            gist_files = proc.json('gh', 'api', f'gists/{gist_id}', '--jq', '.files', log=None) or {}
-            old_filename = None
-
-            # Find the existing markdown file (could be DESCRIPTION.md or a PR-specific name)
-            for fname in gist_files.keys():
-                if fname.endswith('.md'):
-                    old_filename = fname
-                    break
-
-            # Update gist with new filename if needed
-            if old_filename and old_filename != pr_filename:
-                # Rename file by deleting old and adding new
-                proc.run('gh', 'api', f'gists/{gist_id}', '-X', 'PATCH',
-                           '-f', f'description={description}',
-                           '-f', f'files[{old_filename}][filename]={pr_filename}', log=None)
-                err(f"Renamed gist file from {old_filename} to {pr_filename}")
-            else:
-                # Just update description
-                proc.run('gh', 'api', f'gists/{gist_id}', '-X', 'PATCH',
-                           '-f', f'description={description}', log=None)
-        except Exception as e:
-            err(f"Error: Could not update gist metadata: {e}")
-            raise
-
-        # Check if remote exists and push to it
-        if add_remote:
-            # Commit the description only when it actually changed; committing
-            # unconditionally dumps git's "nothing to commit / Untracked files"
-            # status block into push output (cosmetic noise).
-            proc.run('git', 'add', local_filename, log=None)
-            if not proc.check('git', 'diff', '--cached', '--quiet', log=None):
-                proc.run('git', 'commit', '-q', '-m', f'Update PR description for {owner}/{repo}#{pr_number}', log=None)
+        if gist_id:
+            # Update existing gist
+            err(f"Updating gist {gist_id}...")
 
+            # Check if we need to rename the file in the gist
             try:
-                proc.run('git', 'push', gist_remote, 'main', '--force', log=None)
-                err(f"Pushed to gist remote '{gist_remote}'")
+                gist_files = client.get(f'/gists/{gist_id}').get('files') or {}
+                old_filename = None
+
+                # Find the existing markdown file (could be DESCRIPTION.md or a PR-specific name)
+                for fname in gist_files.keys():
+                    if fname.endswith('.md'):
+                        old_filename = fname
+                        break
+
+                # Update gist with new filename if needed
+                if old_filename and old_filename != pr_filename:
+                    # Rename file by deleting old and adding new
+                    client.request('PATCH', f'/gists/{gist_id}', {
+                        'description': description,
+                        'files': {old_filename: {'filename': pr_filename}},
+                    })
+                    err(f"Renamed gist file from {old_filename} to {pr_filename}")
+                else:
+                    # Just update description
+                    client.request('PATCH', f'/gists/{gist_id}', {'description': description})
             except Exception as e:
-                err(f"Error: Could not push to gist remote '{gist_remote}': {e}")
+                err(f"Error: Could not update gist metadata: {e}")
                 raise
 
-        # Get the latest revision SHA
-        try:
-            gist_info = proc.line('gh', 'api', f'gists/{gist_id}', '--jq', '.history[0].version', log=None)
-            revision = gist_info
-        except Exception as e:
-            err(f"Error: Could not get gist revision: {e}")
-            raise
+            # Check if remote exists and push to it
+            if add_remote:
+                # Commit the description only when it actually changed; committing
+                # unconditionally dumps git's "nothing to commit / Untracked files"
+                # status block into push output (cosmetic noise). One `git status`
+                # covers the (common) unchanged case, with no `add` or `diff` spawns.
+                if proc.text('git', 'status', '--porcelain', '--', local_filename, log=None):
+                    proc.run('git', 'add', local_filename, log=None)
+                    proc.run('git', 'commit', '-q', '-m', f'Update PR description for {owner}/{repo}#{pr_number}', log=None)
+
+                try:
+                    proc.run('git', 'push', gist_remote, 'main', '--force', log=None)
+                    err(f"Pushed to gist remote '{gist_remote}'")
+                except Exception as e:
+                    err(f"Error: Could not push to gist remote '{gist_remote}': {e}")
+                    raise
+
+            # Get the latest revision SHA
+            try:
+                gist_info = (client.get(f'/gists/{gist_id}').get('history') or [{}])[0].get('version')
+                revision = gist_info
+            except Exception as e:
+                err(f"Error: Could not get gist revision: {e}")
+                raise
 
-        if revision:
-            gist_url = f"https://gist.github.com/{gist_id}/{revision}"
+            if revision:
+                gist_url = f"https://gist.github.com/{gist_id}/{revision}"
+            else:
+                gist_url = f"https://gist.github.com/{gist_id}"
+            err(f"Updated gist: {gist_url}")
         else:
-            gist_url = f"https://gist.github.com/{gist_id}"
-        err(f"Updated gist: {gist_url}")
-    else:
-        # Create new gist
-        err(f"Creating new {'public' if is_public else 'secret'} gist...")
-
-        # Create a temporary file with the PR-specific name for gist creation
-        with TemporaryDirectory() as tmpdir:
-            # Create temp file with PR-specific name
-            temp_file = Path(tmpdir) / pr_filename
-            with open(temp_file, 'w') as f:
-                f.write(content)
-
-            # Also update local DESCRIPTION.md
-            desc_file = Path(local_filename)
-            with open(desc_file, 'w') as f:
-                f.write(content)
+            # Create new gist
+            err(f"Creating new {'public' if is_public else 'secret'} gist...")
+
+            # Create a temporary file with the PR-specific name for gist creation
+            with TemporaryDirectory() as tmpdir:
+                # Create temp file with PR-specific name
+                temp_file = Path(tmpdir) / pr_filename
+                with open(temp_file, 'w') as f:
+                    f.write(content)
+
+                # Also update local DESCRIPTION.md
+                desc_file = Path(local_filename)
+                with open(desc_file, 'w') as f:
+                    f.write(content)
+
+                try:
+                    # Create gist from PR-specific filename (visibility based on repo)
+                    output = None
+                    gist_id_from_creation = create_gist(temp_file, description, is_public=is_public, store_id=False)
+                    if gist_id_from_creation:
+                        output = f"https://gist.github.com/{gist_id_from_creation}"
+                    if not output:
+                        err("Error creating gist")
+                        return None
+                    output = output.strip()
+                    err(f"Gist create output: {output}")
+                    # Extract gist ID from URL (format: https://gist.github.com/username/gist_id or https://gist.github.com/gist_id)
+                    match = GIST_URL_WITH_USER_PATTERN.search(output)
+                    if match:
+                        gist_id = match.group(1)
+                        proc.run('git', 'config', 'pr.gist', gist_id, log=None)
+                        err(f"Stored gist ID: {gist_id}")
+
+                        # Add gist as a remote if requested
+                        if add_remote:
+                            gist_ssh_url = f"git@gist.github.com:{gist_id}.git"
+                            try:
+                                # Check if remote already exists
+                                existing_url = proc.line('git', 'remote', 'get-url', gist_remote, err_ok=True, log=None)
+                                if existing_url != gist_ssh_url:
+                                    # Update existing remote
+                                    proc.run('git', 'remote', 'set-url', gist_remote, gist_ssh_url, log=None)
+                                    err(f"Updated remote '{gist_remote}' to {gist_ssh_url}")
+                            except Exception:
+                                # Add new remote
+                                proc.run('git', 'remote', 'add', gist_remote, gist_ssh_url, log=None)
+                                err(f"Added remote '{gist_remote}': {gist_ssh_url}")
+
+                        # Fetch from the gist remote first
+                        try:
+                            proc.run('git', 'fetch', gist_remote, log=None)
+                        except Exception as e:
+                            # Fetch might fail if gist is empty, which is OK for new gists
+                            err(f"Note: Could not fetch from gist (may be empty): {e}")
 
-            try:
-                # Create gist from PR-specific filename (visibility based on repo)
-                output = None
-                gist_id_from_creation = create_gist(temp_file, description, is_public=is_public, store_id=False)
-                if gist_id_from_creation:
-                    output = f"https://gist.github.com/{gist_id_from_creation}"
-                if not output:
-                    err("Error creating gist")
-                    return None
-                output = output.strip()
-                err(f"Gist create output: {output}")
-                # Extract gist ID from URL (format: https://gist.github.com/username/gist_id or https://gist.github.com/gist_id)
-                match = GIST_URL_WITH_USER_PATTERN.search(output)
-                if match:
-                    gist_id = match.group(1)
-                    proc.run('git', 'config', 'pr.gist', gist_id, log=None)
-                    err(f"Stored gist ID: {gist_id}")
-
-                    # Add gist as a remote if requested
-                    if add_remote:
-                        gist_ssh_url = f"git@gist.github.com:{gist_id}.git"
+                        # Set up branch tracking
                         try:
-                            # Check if remote already exists
-                            existing_url = proc.line('git', 'remote', 'get-url', gist_remote, err_ok=True, log=None)
-                            if existing_url != gist_ssh_url:
-                                # Update existing remote
-                                proc.run('git', 'remote', 'set-url', gist_remote, gist_ssh_url, log=None)
-                                err(f"Updated remote '{gist_remote}' to {gist_ssh_url}")
+                            current_branch = proc.line('git', 'rev-parse', '--abbrev-ref', 'HEAD', log=None)
+                            proc.run('git', 'branch', '--set-upstream-to', f'{gist_remote}/main', current_branch, log=None)
+                            err(f"Set {current_branch} to track {gist_remote}/main")
+                        except Exception as e:
+                            err(f"Could not set up branch tracking: {e}")
+
+                        # Commit and push to the gist
+                        try:
+                            # Check if there are uncommitted changes
+                            proc.check('git', 'diff', '--quiet', 'DESCRIPTION.md', log=None)
                         except Exception:
-                            # Add new remote
-                            proc.run('git', 'remote', 'add', gist_remote, gist_ssh_url, log=None)
-                            err(f"Added remote '{gist_remote}': {gist_ssh_url}")
-
-                    # Fetch from the gist remote first
-                    try:
-                        proc.run('git', 'fetch', gist_remote, log=None)
-                    except Exception as e:
-                        # Fetch might fail if gist is empty, which is OK for new gists
-                        err(f"Note: Could not fetch from gist (may be empty): {e}")
-
-                    # Set up branch tracking
-                    try:
-                        current_branch = proc.line('git', 'rev-parse', '--abbrev-ref', 'HEAD', log=None)
-                        proc.run('git', 'branch', '--set-upstream-to', f'{gist_remote}/main', current_branch, log=None)
-                        err(f"Set {current_branch} to track {gist_remote}/main")
-                    except Exception as e:
-                        err(f"Could not set up branch tracking: {e}")
-
-                    # Commit and push to the gist
-                    try:
-                        # Check if there are uncommitted changes
-                        proc.check('git', 'diff', '--quiet', 'DESCRIPTION.md', log=None)
-                    except Exception:
-                        # There are changes, commit them
-                        proc.run('git', 'add', 'DESCRIPTION.md', log=None)
-                        proc.run('git', 'commit', '-m', f'Sync PR {owner}/{repo}#{pr_number} to gist', log=None)
-
-                        # Push to the gist remote
+                            # There are changes, commit them
+                            proc.run('git', 'add', 'DESCRIPTION.md', log=None)
+                            proc.run('git', 'commit', '-m', f'Sync PR {owner}/{repo}#{pr_number} to gist', log=None)
+
+                            # Push to the gist remote
+                            try:
+                                proc.run('git', 'push', gist_remote, 'main', '--force', log=None)
+                                err(f"Pushed to gist remote '{gist_remote}'")
+                            except Exception as e:
+                                err(f"Error: Could not push to gist remote '{gist_remote}': {e}")
+                                raise
+
+                        # Get the revision SHA for the newly created gist
                         try:
-                            proc.run('git', 'push', gist_remote, 'main', '--force', log=None)
-                            err(f"Pushed to gist remote '{gist_remote}'")
+                            gist_info = (client.get(f'/gists/{gist_id}').get('history') or [{}])[0].get('version')
+                            revision = gist_info
+                            gist_url = f"https://gist.github.com/{gist_id}/{revision}"
                         except Exception as e:
-                            err(f"Error: Could not push to gist remote '{gist_remote}': {e}")
+                            err(f"Error: Could not get gist revision: {e}")
                             raise
 
-                    # Get the revision SHA for the newly created gist
-                    try:
-                        gist_info = proc.line('gh', 'api', f'gists/{gist_id}', '--jq', '.history[0].version', log=None)
-                        revision = gist_info
-                        gist_url = f"https://gist.github.com/{gist_id}/{revision}"
-                    except Exception as e:
-                        err(f"Error: Could not get gist revision: {e}")
-                        raise
-
-                    err(f"Created gist: {gist_url}")
-            except Exception as e:
-                err(f"Error creating gist: {e}")
-                return None
+                        err(f"Created gist: {gist_url}")
+                except Exception as e:
+                    err(f"Error creating gist: {e}")
+                    return None
 
-    if return_url:
-        return gist_url
+        if return_url:
+            return gist_url
 
 
 def register(cli):
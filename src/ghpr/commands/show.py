@@ -3,25 +3,28 @@
 from utz import proc, err
 from utz.cli import flag
 
-from ..config import get_pr_info_from_path
+from ..config import get_pr_info_from_path, load_pr_config
 from ..gist import find_gist_remote
 from ..patterns import GIST_ID_PATTERN
 
 
 def show(gist: bool) -> None:
     """Show PR and/or gist URLs for current directory."""
+    # Read all pr.* git config once
+    pr_config = load_pr_config()
+
     # Get PR info
-    owner, repo, pr_number = get_pr_info_from_path()
+    owner, repo, pr_number = get_pr_info_from_path(pr_config=pr_config)
 
     if not all([owner, repo, pr_number]):
         # Try from git config
-        owner = proc.line('git', 'config', 'pr.owner', err_ok=True, log=None) or ''
-        repo = proc.line('git', 'config', 'pr.repo', err_ok=True, log=None) or ''
-        pr_number = proc.line('git', 'config', 'pr.number', err_ok=True, log=None) or ''
+        owner = pr_config.get('owner', '')
+        repo = pr_config.get('repo', '')
+        pr_number = pr_config.get('number', '')
 
     if gist:
         # Only show gist URL
-        gist_id = proc.line('git', 'config', 'pr.gist', err_ok=True, log=None)
+        gist_id = pr_config.get('gist')
         if not gist_id:
             # Try to find from remote
             gist_remote = find_gist_remote()
@@ -46,7 +49,7 @@ def show(gist: bool) -> None:
             print(f"PR: {pr_url}")
 
             # Check for gist
-            gist_id = proc.line('git', 'config', 'pr.gist', err_ok=True, log=None)
+            gist_id = pr_config.get('gist')
             if gist_id:
                 gist_url = f"https://gist.github.com/{gist_id}"
                 print(f"Gist: {gist_url}")
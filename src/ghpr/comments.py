@@ -1,16 +1,30 @@
 """Comment file read/write operations."""
 
+from io import StringIO
+from os import scandir
 from pathlib import Path
 
+from .fs import read_text, write_chunks
 
-def write_comment_file(comment_id: str, author: str, created_at: str, updated_at: str | None, body: str) -> Path:
+
+def write_comment_file(
+    comment_id: str,
+    author: str,
+    created_at: str,
+    updated_at: str | None,
+    body: str,
+    directory: Path | None = None,
+) -> Path:
     """Write a comment to a z{comment_id}-{author}.md file.
 
+    Args:
+        directory: Directory to write into (default: cwd)
+
     Returns:
         Path to the created file
     """
     filename = f'z{comment_id}-{author}.md'
-    filepath = Path(filename)
+    filepath = Path(directory) / filename if directory is not None else Path(filename)
 
     content_lines = [
         f'<!-- author: {author} -->',
@@ -22,12 +36,9 @@ def write_comment_file(comment_id: str, author: str, created_at: str, updated_at
 
     content_lines.append('')  # Blank line after metadata
 
-    # Write metadata lines
-    with open(filepath, 'w') as f:
-        f.write('\n'.join(content_lines))
-        f.write('\n')
-        # Write body exactly as-is, preserving all whitespace including trailing newlines
-        f.write(body)
+    # Write metadata lines, then the body exactly as-is (preserving all
+    # whitespace, including trailing newlines), in one `writev`
+    write_chunks(filepath, ['\n'.join(content_lines), '\n', body])
 
     return filepath
 
@@ -38,8 +49,8 @@ def read_comment_file(filepath: Path) -> tuple[str | None, str | None, str | Non
     Returns:
         Tuple of (author, created_at, updated_at, body)
     """
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
+    # (`StringIO.readlines` splits on '\n' only, unlike `str.splitlines`)
+    lines = StringIO(read_text(filepath)).readlines()
 
     author = None
     created_at = None
@@ -76,3 +87,15 @@ def get_comment_id_from_filename(filename: str) -> str | None:
         # Handle legacy format: z{id}.md
         return middle
     return None
+
+
+def list_comment_files(directory: str | Path = '.') -> list[str]:
+    """Names of the comment files (`z<digit>*.md`, as `glob('z[0-9]*.md')` matches) in `directory`, sorted.
+
+    One `scandir` pass, filtered on names, without `glob`'s pattern compile or per-entry stats.
+    """
+    with scandir(directory) as entries:
+        return sorted(
+            entry.name for entry in entries
+            if entry.name.startswith('z') and entry.name[1:2].isdigit() and entry.name.endswith('.md')
+        )
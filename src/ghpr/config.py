@@ -1,24 +1,84 @@
 """Git config helpers for storing and retrieving PR/Issue metadata."""
 
+import shlex
+import shutil
+from functools import lru_cache
 from pathlib import Path
 from os import chdir
 
 from utz import proc, err
 
+from .gitcfg import remote_urls
 from .patterns import GITHUB_URL_PATTERN, PR_DIR_PATTERN, GH_DIR_PATTERN, PR_INLINE_LINK_PATTERN
 
 
-def get_pr_info_from_path(path: Path | None = None) -> tuple[str | None, str | None, str | None]:
-    """Extract PR info from directory structure or git config."""
+def load_pr_config() -> dict[str, str]:
+    """Read all `pr.*` git config keys with one `git config --get-regexp` call.
+
+    Returns:
+        Dict keyed by the part after `pr.` (e.g. 'owner', 'number', 'gist-remote');
+        missing keys are absent (use `.get`)
+    """
+    lines = proc.lines('git', 'config', '--get-regexp', r'^pr\.', err_ok=True, log=None) or []
+    pr_config = {}
+    for line in lines:
+        key, _, value = line.partition(' ')
+        pr_config[key[len('pr.'):]] = value
+    return pr_config
+
+
+@lru_cache(maxsize=None)
+def _sh() -> str | None:
+    """Path to a POSIX `sh`, if there is one (e.g. not on Windows without Git Bash)."""
+    return shutil.which('sh')
+
+
+def chained(*cmds: tuple[str, ...]) -> list[tuple[str, ...]]:
+    """The processes to spawn to run `cmds` in order, stopping at the first failure.
+
+    With `sh` available, several commands are `&&`-chained into one `sh -c`:
+    one subprocess from Python instead of one per command, though `sh` still
+    execs each of them. Otherwise they're returned as-is, to run in turn.
+    """
+    if len(cmds) > 1 and _sh():
+        return [(_sh(), '-c', ' && '.join(shlex.join(cmd) for cmd in cmds))]
+    return list(cmds)
+
+
+def set_pr_config(cwd: str | Path | None = None, **pairs: str | int) -> None:
+    """Set several `pr.*` git config keys, in the repo at `cwd` (default: the current one).
+
+    `git config` only writes one key per invocation, so there's still one
+    `git` per key; `chained` just batches them behind one `sh` spawn.
+    Keyword underscores map to dashes (`gist_remote='g'` sets `pr.gist-remote`).
+    """
+    for cmd in chained(*(
+        ('git', 'config', f'pr.{key.replace("_", "-")}', str(value))
+        for key, value in pairs.items()
+    )):
+        proc.run(*cmd, log=None, cwd=cwd)
+
+
+def get_pr_info_from_path(
+    path: Path | None = None,
+    pr_config: dict[str, str] | None = None,
+) -> tuple[str | None, str | None, str | None]:
+    """Extract PR info from directory structure or git config.
+
+    Args:
+        pr_config: Already-loaded `load_pr_config()` result, to avoid re-reading it
+    """
     if path is None:
         path = Path.cwd()
     else:
         path = Path(path)
 
     # First, check if we have PR info in git config (highest priority)
-    owner = proc.line('git', 'config', 'pr.owner', err_ok=True, log=None)
-    repo = proc.line('git', 'config', 'pr.repo', err_ok=True, log=None)
-    pr_number = proc.line('git', 'config', 'pr.number', err_ok=True, log=None)
+    if pr_config is None:
+        pr_config = load_pr_config()
+    owner = pr_config.get('owner')
+    repo = pr_config.get('repo')
+    pr_number = pr_config.get('number')
     if owner and repo and pr_number:
         return owner, repo, pr_number
 
@@ -63,29 +123,16 @@ def get_pr_info_from_path(path: Path | None = None) -> tuple[str | None, str | N
     # Get repo info from parent directory
     chdir(repo_path)
 
-    # Try to get owner/repo from git remote
-    try:
-        # Get the default remote
-        remotes = proc.lines('git', 'remote', err_ok=True, log=None) or []
-
-        for remote in ['origin', 'upstream'] + remotes:
-            if not remote:
-                continue
-            try:
-                url = proc.line('git', 'remote', 'get-url', remote, err_ok=True, log=None) or ''
-                # Match GitHub URLs
-                match = GITHUB_URL_PATTERN.search(url)
-                if match:
-                    owner = match.group(1)
-                    repo = match.group(2)
-                    return owner, repo, pr_number
-            except Exception as e:
-                # Log but continue checking other remotes
-                err(f"Warning: Could not get URL for remote {remote}: {e}")
-                continue
-    except Exception as e:
-        err(f"Error while checking git remotes: {e}")
-        raise
+    # Try to get owner/repo from git remotes (origin, then upstream, then any),
+    # all read in one pass
+    remotes = remote_urls()
+    for remote in ['origin', 'upstream', *remotes]:
+        # Match GitHub URLs
+        match = GITHUB_URL_PATTERN.search(remotes.get(remote, ''))
+        if match:
+            owner = match.group(1)
+            repo = match.group(2)
+            return owner, repo, pr_number
 
     err("Error: Could not determine repository from git remotes")
     return None, None, pr_number
@@ -7,12 +7,18 @@ from pathlib import Path
 
 from utz import proc, err
 
+from .fs import write_chunks
+from .gitpipe import GitCatFile
 from .patterns import (
     PR_FILENAME_PATTERN,
     PR_LINK_REF_PATTERN,
     PR_INLINE_LINK_PATTERN,
     H1_TITLE_PATTERN,
+    LEADING_BLANK_LINES_PATTERN,
     LINK_DEF_PATTERN,
+    MARKDOWN_IMAGE_PATTERN,
+    TITLE_REF_PREFIX_PATTERN,
+    USER_ATTACHMENT_SRC_PATTERN,
 )
 
 
@@ -44,9 +50,16 @@ def find_description_file(path: Path = None) -> Path | None:
     return None
 
 
-def read_description_from_git(ref: str = 'HEAD', path: Path = None) -> tuple[str | None, Path | None]:
+def read_description_from_git(
+    ref: str = 'HEAD',
+    path: Path = None,
+    blobs: GitCatFile | None = None,
+) -> tuple[str | None, Path | None]:
     """Read description file from git at specified ref.
 
+    Args:
+        blobs: Already-open `GitCatFile` to read through, instead of spawning `git show`
+
     Returns:
         Tuple of (content, filepath) or (None, None) if not found
     """
@@ -55,7 +68,10 @@ def read_description_from_git(ref: str = 'HEAD', path: Path = None) -> tuple[str
         return None, None
 
     try:
-        content = proc.text('git', 'show', f'{ref}:{desc_file.name}', err_ok=True)
+        if blobs:
+            content = blobs.read(f'{ref}:{desc_file.name}')
+        else:
+            content = proc.text('git', 'show', f'{ref}:{desc_file.name}', err_ok=True)
         if content:
             # Normalize line endings
             content = content.replace('\r\n', '\n')
@@ -74,8 +90,13 @@ def write_description_with_link_ref(
     title: str,
     body: str,
     url: str
-) -> None:
-    """Write a description file with link-reference style header, properly managing the links footer."""
+) -> bool:
+    """Write a description file with link-reference style header, properly managing the links footer.
+
+    Returns:
+        Whether the file changed; it isn't rewritten (or its mtime bumped) when
+        it already has exactly this content
+    """
     pr_ref = f'{owner}/{repo}#{pr_number}'
     link_def = f'[{pr_ref}]: {url}'
 
@@ -92,30 +113,41 @@ def write_description_with_link_ref(
     pr_link_pattern = re.compile(r'^\[' + re.escape(pr_ref) + r']:', re.MULTILINE)
     link_exists = pr_link_pattern.search(body) if body else False
 
-    # Write the file - preserve exact body content
-    with open(file_path, 'w') as f:
-        # Write header
-        f.write(f'# [{pr_ref}] {title}\n')
-
-        # Write body exactly as GitHub gave it to us
-        if body:
-            f.write('\n')
-            f.write(body)
-
-        # Ensure the link def exists (add it if not)
-        if not link_exists:
-            # Add blank line if body doesn't end with one
-            if body and not body.endswith('\n'):
-                f.write('\n')
-            # Add blank line before footer section
-            if not body or not body.endswith('\n\n'):
-                f.write('\n')
-            f.write(f'{link_def}\n')
-        else:
-            # Link exists in body; ensure file ends with newline
-            # (GitHub strips trailing newlines from PR descriptions)
-            if not body.endswith('\n'):
-                f.write('\n')
+    # Assemble the file - preserve exact body content - and write it in one `writev`
+    # Header
+    chunks = [f'# [{pr_ref}] {title}\n']
+
+    # Body exactly as GitHub gave it to us
+    if body:
+        chunks += ['\n', body]
+
+    # Ensure the link def exists (add it if not)
+    if not link_exists:
+        # Add blank line if body doesn't end with one
+        if body and not body.endswith('\n'):
+            chunks.append('\n')
+        # Add blank line before footer section
+        if not body or not body.endswith('\n\n'):
+            chunks.append('\n')
+        chunks.append(f'{link_def}\n')
+    else:
+        # Link exists in body; ensure file ends with newline
+        # (GitHub strips trailing newlines from PR descriptions)
+        if not body.endswith('\n'):
+            chunks.append('\n')
+
+    try:
+        if Path(file_path).read_bytes() == ''.join(chunks).encode():
+            return False
+    except FileNotFoundError:
+        pass
+    write_chunks(file_path, chunks)
+    return True
+
+
+def body_after_title(rest: str) -> str:
+    """Return the body following a title line: leading blank lines and trailing whitespace removed."""
+    return LEADING_BLANK_LINES_PATTERN.sub('', rest, count=1).rstrip()
 
 
 def read_description_file(path: Path = None, expect_plain: bool = False) -> tuple[str | None, str | None]:
@@ -134,24 +166,15 @@ def read_description_file(path: Path = None, expect_plain: bool = False) -> tupl
         return None, None
 
     with open(desc_file, 'r') as f:
-        content = f.read()
-        lines = content.split('\n')
-
-    if not lines:
-        return None, None
-
-    first_line = lines[0].strip()
+        first_line = f.readline().strip()
+        rest = f.read()
 
     if expect_plain:
         # Pre-creation: expect plain "# Title" format only
         match = H1_TITLE_PATTERN.match(first_line)
         if match:
             title = match.group(1).strip()
-            body_lines = lines[1:]
-            while body_lines and not body_lines[0].strip():
-                body_lines = body_lines[1:]
-            body = '\n'.join(body_lines).rstrip()
-            return title, body
+            return title, body_after_title(rest)
 
         # If we find a link-reference format when expecting plain, that's an error
         if PR_LINK_REF_PATTERN.match(first_line) or PR_INLINE_LINK_PATTERN.match(first_line):
@@ -167,11 +190,11 @@ def read_description_file(path: Path = None, expect_plain: bool = False) -> tupl
         # This is link-reference style, get the title
         title = match.group(2).strip()
         # Strip any placeholder prefix like [owner/repo#XXXX] or [owner/repo#NUMBER]
-        title = re.sub(r'^\[?[^/\]]+/[^#\]]+#(XXXX|XX|[Nn][Uu][Mm][Bb][Ee][Rr]|\d+)]?\s*', '', title)
+        title = TITLE_REF_PREFIX_PATTERN.sub('', title)
         # Find where the body starts (skip first line and blank lines)
         body_lines = []
         in_body = False
-        for line in lines[1:]:
+        for line in rest.split('\n'):
             if in_body or line.strip():
                 # Skip link definitions at the end
                 if not LINK_DEF_PATTERN.match(line):
@@ -188,21 +211,13 @@ def read_description_file(path: Path = None, expect_plain: bool = False) -> tupl
     if match:
         title = match.group(4).strip()
         # Rest is the body (skip the first line and any immediately following blank lines)
-        body_lines = lines[1:]
-        while body_lines and not body_lines[0].strip():
-            body_lines = body_lines[1:]
-        body = '\n'.join(body_lines).rstrip()
-        return title, body
+        return title, body_after_title(rest)
 
     # Fallback: first line might just be # Title
     match = H1_TITLE_PATTERN.match(first_line)
     if match:
         title = match.group(1).strip()
-        body_lines = lines[1:]
-        while body_lines and not body_lines[0].strip():
-            body_lines = body_lines[1:]
-        body = '\n'.join(body_lines).rstrip()
-        return title, body
+        return title, body_after_title(rest)
 
     return None, None
 
@@ -255,7 +270,7 @@ def upload_image_to_github(
         result = proc.text(*cmd, log=None)
 
         # Extract the uploaded image URL from the rendered HTML
-        match = re.search(r'src="(https://github\.com/user-attachments/assets/[^"]+)"', result)
+        match = USER_ATTACHMENT_SRC_PATTERN.search(result)
         if match:
             url = match.group(1)
             err(f"Uploaded {image_path} -> {url}")
@@ -273,8 +288,7 @@ def process_images_in_description(body: str, owner: str, repo: str, dry_run: boo
 
     if dry_run:
         # Just find and report what would be uploaded
-        pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
-        matches = re.findall(pattern, body)
+        matches = MARKDOWN_IMAGE_PATTERN.findall(body)
         for alt_text, path in matches:
             if not path.startswith('http'):
                 err(f"[DRY-RUN] Would upload image: {path}")
@@ -298,7 +312,6 @@ def process_images_in_description(body: str, owner: str, repo: str, dry_run: boo
             return match.group(0)
 
     # Replace markdown image references
-    pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
-    updated_body = re.sub(pattern, replace_image, body)
+    updated_body = MARKDOWN_IMAGE_PATTERN.sub(replace_image, body)
 
     return updated_body
@@ -0,0 +1,94 @@
+"""Filesystem helpers."""
+
+import ctypes
+import errno
+import os
+import sys
+from pathlib import Path
+
+AT_FDCWD = -100
+RENAME_NOREPLACE = 1
+
+
+def _load_renameat2():
+    """Return glibc's `renameat2`, or None (non-Linux, or libc without it)."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_renameat2 = _load_renameat2()
+
+
+def rename_noreplace(src: str | Path, dst: str | Path) -> None:
+    """Rename `src` to `dst`, raising FileExistsError if `dst` exists.
+
+    On Linux this is a single atomic `renameat2(RENAME_NOREPLACE)`; elsewhere
+    (or on filesystems that don't support the flag) it falls back to an
+    existence check followed by `os.rename`.
+    """
+    if _renameat2:
+        if _renameat2(AT_FDCWD, os.fsencode(src), AT_FDCWD, os.fsencode(dst), RENAME_NOREPLACE) == 0:
+            return
+        code = ctypes.get_errno()
+        if code not in (errno.EINVAL, errno.ENOSYS):
+            raise OSError(code, os.strerror(code), str(src), None, str(dst))
+    if os.path.lexists(dst):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(src), None, str(dst))
+    os.rename(src, dst)
+
+
+def write_chunks(path: str | Path, chunks: list[str]) -> None:
+    """Write `chunks` (UTF-8) to `path`, truncating it, with one `writev` where available.
+
+    Saves assembling the file in one string, or issuing a `write` per chunk.
+    """
+    bufs = [chunk.encode() for chunk in chunks if chunk]
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        if not hasattr(os, 'writev'):
+            for buf in bufs:
+                os.write(fd, buf)
+            return
+        while bufs:
+            n = os.writev(fd, bufs)
+            # Short write: drop fully-written buffers, trim a partially-written one
+            while bufs and n >= len(bufs[0]):
+                n -= len(bufs.pop(0))
+            if n:
+                bufs[0] = bufs[0][n:]
+    finally:
+        os.close(fd)
+
+
+# Skip the atime update (an inode write) on reads, where the kernel supports it
+O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+
+def read_text(path: str | Path) -> str:
+    """Read `path` as UTF-8 text (universal newlines, like `open(path).read()`).
+
+    Opens with `O_NOATIME` where available (falling back without it for files
+    we don't own, where the kernel refuses the flag), and reads with raw
+    `os.read`s sized from one `fstat`, skipping the buffered-IO layers.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | O_NOATIME)
+    except PermissionError:
+        if not O_NOATIME:
+            raise
+        fd = os.open(path, os.O_RDONLY)
+    try:
+        bufs = []
+        size = os.fstat(fd).st_size
+        while buf := os.read(fd, max(size, 1 << 16)):
+            bufs.append(buf)
+    finally:
+        os.close(fd)
+    return b''.join(bufs).decode().replace('\r\n', '\n').replace('\r', '\n')
@@ -0,0 +1,207 @@
+"""Minimal GitHub REST client that reuses one HTTPS connection across requests.
+
+Each `gh` invocation pays Go-runtime startup, config loading and a fresh TLS
+handshake; for back-to-back queries it's cheaper to fetch a token once and
+keep a single keep-alive connection to api.github.com open.
+"""
+
+from functools import cached_property
+from http.client import HTTPException, HTTPSConnection
+from json import dumps as json_dumps
+from os import environ
+from shutil import copyfileobj
+from typing import BinaryIO
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from utz import proc
+
+try:
+    # Optional (`pip install ghpr-py[fast]`): several times faster on large
+    # payloads, e.g. long comment lists
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+API_HOST = 'api.github.com'
+# Hosts the token is sent to; redirect targets (e.g. the asset CDN) get no `Authorization`
+AUTH_HOSTS = {API_HOST, 'github.com'}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+class GhApiError(Exception):
+    """Non-2xx response from the GitHub API."""
+
+    def __init__(self, status: int, reason: str, path: str):
+        super().__init__(f"GitHub API {status} {reason}: {path}")
+        self.status = status
+
+
+def gh_token() -> str:
+    """Token from `$GH_TOKEN`/`$GITHUB_TOKEN`, else `gh auth token`."""
+    return environ.get('GH_TOKEN') or environ.get('GITHUB_TOKEN') or proc.line('gh', 'auth', 'token', log=None)
+
+
+class GhClient:
+    """GitHub REST client over a persistent HTTPS connection; use as a context manager.
+
+        with GhClient() as client:
+            prs = client.get(f'/repos/{owner}/{repo}/pulls', params={'head': f'{owner}:{head}'})
+    """
+
+    def __init__(self, token: str | None = None, host: str = API_HOST):
+        self.host = host
+        self._token = token
+        self._conn: HTTPSConnection | None = None
+        # path → (ETag, parsed body), for conditional requests
+        self._etags: dict[str, tuple[str, object]] = {}
+        # netloc → connection, for `download`s of absolute URLs
+        self._download_conns: dict[str, HTTPSConnection] = {}
+
+    @cached_property
+    def token(self) -> str:
+        # Resolved on first request, so an unused client costs no `gh auth token`
+        return self._token or gh_token()
+
+    @cached_property
+    def headers(self) -> dict[str, str]:
+        return {
+            'Accept': 'application/vnd.github+json',
+            'Authorization': f'token {self.token}',
+            'User-Agent': 'ghpr',
+        }
+
+    def __enter__(self) -> 'GhClient':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+        for conn in self._download_conns.values():
+            conn.close()
+        self._download_conns.clear()
+
+    def _request(
+        self,
+        path: str,
+        headers: dict,
+        method: str = 'GET',
+        body: bytes | None = None,
+    ) -> tuple[int, str, str | None, bytes]:
+        if not self._conn:
+            self._conn = HTTPSConnection(self.host, timeout=30)
+        self._conn.request(method, path, body=body, headers=headers)
+        resp = self._conn.getresponse()
+        return resp.status, resp.reason, resp.getheader('ETag'), resp.read()
+
+    def get(
+        self,
+        path: str,
+        params: dict | None = None,
+        conditional: bool = False,
+        cached: tuple[str, object] | None = None,
+    ):
+        """GET `path` (relative to the API root) and return the parsed JSON body.
+
+        With `conditional`, repeat requests for the same path send
+        `If-None-Match`; a 304 returns the previous body (and doesn't count
+        against the rate limit), which makes polling cheap. `cached` seeds the
+        (ETag, body) pair from an earlier process; `etag(path)` reads it back.
+        """
+        if params:
+            path = f'{path}?{urlencode(params)}'
+        headers = self.headers
+        if conditional and cached and path not in self._etags:
+            self._etags[path] = cached
+        cached = self._etags.get(path) if conditional else None
+        if cached:
+            headers = {**headers, 'If-None-Match': cached[0]}
+        try:
+            status, reason, etag, body = self._request(path, headers)
+        except (HTTPException, ConnectionError):
+            # Server closed the idle keep-alive connection; reconnect once
+            self.close()
+            status, reason, etag, body = self._request(path, headers)
+        if status == 304 and cached:
+            return cached[1]
+        if not 200 <= status < 300:
+            raise GhApiError(status, reason, path)
+        data = json_loads(body) if body else None
+        if conditional and etag:
+            self._etags[path] = (etag, data)
+        return data
+
+    def request(self, method: str, path: str, data: dict | None = None):
+        """Send a `method` (e.g. 'PATCH', 'POST') request with JSON body `data`; return the parsed response.
+
+        Like `get`, a dropped keep-alive connection is retried once, except for
+        (non-idempotent) POSTs, which might already have been applied.
+        """
+        body = json_dumps(data).encode() if data is not None else None
+        headers = {**self.headers, 'Content-Type': 'application/json'}
+        try:
+            status, reason, _, resp_body = self._request(path, headers, method, body)
+        except (HTTPException, ConnectionError):
+            self.close()
+            if method == 'POST':
+                raise
+            status, reason, _, resp_body = self._request(path, headers, method, body)
+        if not 200 <= status < 300:
+            raise GhApiError(status, reason, path)
+        return json_loads(resp_body) if resp_body else None
+
+    def _download_request(
+        self,
+        netloc: str,
+        path: str,
+        headers: dict,
+        out: BinaryIO | None,
+    ) -> tuple[int, str, str | None, bytes]:
+        conn = self._download_conns.get(netloc)
+        if not conn:
+            conn = self._download_conns[netloc] = HTTPSConnection(netloc, timeout=30)
+        conn.request('GET', path, headers=headers)
+        resp = conn.getresponse()
+        if out is not None and 200 <= resp.status < 300:
+            # Stream the body through in chunks, rather than buffering it whole
+            copyfileobj(resp, out)
+            return resp.status, resp.reason, None, b''
+        return resp.status, resp.reason, resp.getheader('Location'), resp.read()
+
+    def download(self, url: str, out: BinaryIO | None = None, max_redirects: int = 5) -> bytes | None:
+        """GET an absolute `https://` URL (e.g. a user-attachment) and return the raw body.
+
+        With `out` (a binary file), the body is streamed into it instead, and
+        None is returned. Redirects are followed; connections are kept open per
+        host, so a batch of downloads (which all redirect to the same CDN)
+        reuses them.
+        """
+        for _ in range(max_redirects + 1):
+            parts = urlsplit(url)
+            headers = {'User-Agent': self.headers['User-Agent']}
+            if parts.hostname in AUTH_HOSTS:
+                headers['Authorization'] = self.headers['Authorization']
+            path = f'{parts.path}?{parts.query}' if parts.query else parts.path
+            try:
+                status, reason, location, body = self._download_request(parts.netloc, path, headers, out)
+            except (HTTPException, ConnectionError):
+                # Idle keep-alive connection was closed; reconnect once
+                self._download_conns.pop(parts.netloc).close()
+                if out is not None:
+                    out.seek(0)
+                    out.truncate()
+                status, reason, location, body = self._download_request(parts.netloc, path, headers, out)
+            if status in REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+            if not 200 <= status < 300:
+                raise GhApiError(status, reason, url)
+            return None if out is not None else body
+        raise GhApiError(status, 'Too many redirects', url)
+
+    def etag(self, path: str) -> tuple[str, object] | None:
+        """(ETag, body) from the last conditional `get` of `path` (including params), if any."""
+        return self._etags.get(path)
@@ -1,6 +1,5 @@
 """Gist operations for creating and syncing GitHub gists."""
 
-import re
 from pathlib import Path
 
 from utz import proc, err
@@ -8,6 +7,7 @@ from utz import proc, err
 from .patterns import (
     GIST_FOOTER_VISIBLE_PATTERN,
     GIST_FOOTER_HIDDEN_PATTERN,
+    GIST_FOOTER_LEGACY_ATTRIBUTION_PATTERN,
     GIST_URL_WITH_USER_PATTERN,
 )
 
@@ -138,7 +138,7 @@ def extract_gist_footer(body: str | None) -> tuple[str | None, str | None]:
     # Check if last line is a hidden gist footer (handle both old and new formats)
     if lines and lines[-1].strip().startswith('<!-- Synced with '):
         # Try new format with attribution (with or without revision)
-        match = re.match(r'<!-- Synced with (https://gist\.github\.com/[a-f0-9]+(?:/[a-f0-9]+)?) via \[github-pr\.py\].*-->', lines[-1].strip())
+        match = GIST_FOOTER_LEGACY_ATTRIBUTION_PATTERN.match(lines[-1].strip())
         if not match:
             # Try old format without attribution (with or without revision)
             match = GIST_FOOTER_HIDDEN_PATTERN.match(lines[-1].strip())
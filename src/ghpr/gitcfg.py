@@ -0,0 +1,98 @@
+"""Read a repo's `.git/config` directly, without spawning `git`."""
+
+from configparser import ConfigParser, Error as ConfigParserError
+from pathlib import Path
+
+from utz import proc
+
+from .gist import DEFAULT_GIST_REMOTE
+from .patterns import GIST_ID_PATTERN, GIT_REMOTE_FETCH_LINE_PATTERN, GIT_REMOTE_SECTION_PATTERN
+
+
+def find_git_dir(repo_path: Path) -> Path | None:
+    """Return `repo_path`'s git dir, following `gitdir:` files (worktrees, submodules)."""
+    dot_git = repo_path / '.git'
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        line = dot_git.read_text().strip()
+        if line.startswith('gitdir:'):
+            return (repo_path / line[len('gitdir:'):].strip()).resolve()
+    return None
+
+
+def read_config(repo_path: str | Path = '.') -> ConfigParser | None:
+    """Parse `<repo_path>/.git/config`; None if it's missing or unparseable.
+
+    Only the repo-local config file is read (no global/system config or
+    `[include]`s), which covers the `pr.*` and `remote.*` keys ghpr writes.
+    """
+    git_dir = find_git_dir(Path(repo_path))
+    if not git_dir:
+        return None
+    try:
+        text = (git_dir / 'config').read_text()
+    except OSError:
+        return None
+    cfg = ConfigParser(strict=False, interpolation=None)
+    try:
+        # git indents keys with tabs, which ConfigParser would read as continuation lines
+        cfg.read_string('\n'.join(line.strip() for line in text.splitlines()))
+    except ConfigParserError:
+        return None
+    return cfg
+
+
+def config_remotes(cfg: ConfigParser) -> dict[str, str]:
+    """Map remote name → URL, in config order."""
+    remotes = {}
+    for section in cfg.sections():
+        match = GIT_REMOTE_SECTION_PATTERN.match(section)
+        if match and cfg.has_option(section, 'url'):
+            remotes[match.group(1)] = cfg.get(section, 'url')
+    return remotes
+
+
+def remote_urls(repo_path: str | Path = '.') -> dict[str, str]:
+    """Map remote name → URL, in config order.
+
+    Read from `.git/config` when `repo_path` is a repo root; otherwise (e.g. a
+    subdirectory) parsed from a single `git remote -v`.
+    """
+    cfg = read_config(repo_path)
+    if cfg:
+        return config_remotes(cfg)
+    remotes = {}
+    for line in proc.lines('git', 'remote', '-v', err_ok=True, log=None, cwd=str(repo_path)) or []:
+        match = GIT_REMOTE_FETCH_LINE_PATTERN.match(line)
+        if match:
+            remotes.setdefault(match.group(1), match.group(2))
+    return remotes
+
+
+def find_gist_remote_fast(cfg: ConfigParser) -> tuple[str | None, str | None]:
+    """Find the gist remote and its gist ID from parsed config.
+
+    Same priority as `gist.find_gist_remote`: `pr.gist-remote`, then the only
+    gist remote, then `DEFAULT_GIST_REMOTE` (if a gist remote), then the first
+    gist remote, then `DEFAULT_GIST_REMOTE` if it exists at all.
+
+    Returns:
+        (remote name, gist ID); either may be None
+    """
+    remotes = config_remotes(cfg)
+    gist_remotes = [name for name, url in remotes.items() if 'gist.github.com' in url]
+
+    name = cfg.get('pr', 'gist-remote', fallback=None)
+    if not name:
+        if len(gist_remotes) == 1:
+            name = gist_remotes[0]
+        elif DEFAULT_GIST_REMOTE in gist_remotes:
+            name = DEFAULT_GIST_REMOTE
+        elif gist_remotes:
+            name = gist_remotes[0]
+        elif DEFAULT_GIST_REMOTE in remotes:
+            name = DEFAULT_GIST_REMOTE
+
+    gist_match = GIST_ID_PATTERN.search(remotes.get(name, '')) if name else None
+    return name, gist_match.group(1) if gist_match else None
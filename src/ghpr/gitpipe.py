@@ -0,0 +1,55 @@
+"""Persistent `git cat-file --batch` process, for reading several blobs with one spawn."""
+
+from subprocess import DEVNULL, PIPE, Popen
+
+
+class GitCatFile:
+    """Read `<rev>:<path>` blobs over one long-running `git cat-file --batch`; use as a context manager.
+
+        with GitCatFile() as blobs:
+            desc = blobs.read('HEAD:DESCRIPTION.md')
+    """
+
+    def __init__(self, cwd: str | None = None):
+        self.cwd = cwd
+        self._proc: Popen | None = None
+
+    def __enter__(self) -> 'GitCatFile':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._proc:
+            self._proc.stdin.close()
+            self._proc.stdout.close()
+            self._proc.wait()
+            self._proc = None
+
+    def read_bytes(self, obj: str) -> bytes | None:
+        """Return the contents of blob `obj` (e.g. `HEAD:foo.md`), or None if it's missing or not a blob."""
+        if not self._proc:
+            # Started lazily, so callers that never read don't pay for a spawn
+            self._proc = Popen(
+                ['git', 'cat-file', '--batch'],
+                stdin=PIPE, stdout=PIPE, stderr=DEVNULL, cwd=self.cwd,
+            )
+        self._proc.stdin.write(obj.encode() + b'\n')
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline()
+        if not header:
+            raise RuntimeError(f"git cat-file exited while reading {obj}")
+        # "<sha> <type> <size>", or "<obj> missing" / "<obj> ambiguous"
+        parts = header.split()
+        if len(parts) != 3:
+            return None
+        _, obj_type, size = parts
+        content = self._proc.stdout.read(int(size))
+        self._proc.stdout.read(1)  # Trailing newline
+        return content if obj_type == b'blob' else None
+
+    def read(self, obj: str) -> str | None:
+        """Like `read_bytes`, decoded as UTF-8."""
+        content = self.read_bytes(obj)
+        return None if content is None else content.decode('utf-8', errors='replace')
@@ -10,18 +10,30 @@ PR_FILENAME_PATTERN = re.compile(r'^([^#]+)#(\d+)\.md$')  # repo#123.md
 PR_DIR_PATTERN = re.compile(r'^(?:pr|issue|gh)(\d+)$')  # pr123, issue123, or gh123 (legacy + new)
 GH_DIR_PATTERN = re.compile(r'^gh$')  # gh directory
 LINK_DEF_PATTERN = re.compile(r'^\[([^]]+)]:\s*https?://')  # [ref]: url (matches at line start)
+LEADING_BLANK_LINES_PATTERN = re.compile(r'^(?:[^\S\n]*\n)*')  # Blank (whitespace-only) lines at the start of a string
 GIST_ID_PATTERN = re.compile(r'gist\.github\.com[:/]([a-f0-9]{20,32})')  # GitHub gist IDs are typically 20-32 hex chars
 GIST_URL_PATTERN = re.compile(r'https://gist\.github\.com/[a-f0-9]+(?:/[a-f0-9]+)?')  # Full gist URL
 GIST_URL_WITH_USER_PATTERN = re.compile(r'gist\.github\.com/(?:[^/]+/)?([a-f0-9]+)(?:/([a-f0-9]+))?')  # Gist URL with optional user
 GIST_FOOTER_VISIBLE_PATTERN = re.compile(r'\[gist\]\((https://gist\.github\.com/[a-f0-9]+(?:/[a-f0-9]+)?)\)')  # [gist](url) in markdown
 GIST_FOOTER_HIDDEN_PATTERN = re.compile(r'<!-- Synced with (https://gist\.github\.com/[a-f0-9]+(?:/[a-f0-9]+)?)')  # HTML comment footer
+GIST_FOOTER_LEGACY_ATTRIBUTION_PATTERN = re.compile(r'<!-- Synced with (https://gist\.github\.com/[a-f0-9]+(?:/[a-f0-9]+)?) via \[github-pr\.py\].*-->')  # Hidden footer, old github-pr.py attribution
 GITHUB_URL_PATTERN = re.compile(r'github\.com[:/]([^/]+)/([^/\s]+?)(?:\.git)?$')  # GitHub URL pattern
 GITHUB_PR_URL_PATTERN = re.compile(r'https://github\.com/([^/]+)/([^/]+)/pull/(\d+)')  # Full PR URL
 GITHUB_ISSUE_URL_PATTERN = re.compile(r'https://github\.com/([^/]+)/([^/]+)/issues/(\d+)')  # Full Issue URL
 GITHUB_ITEM_URL_PATTERN = re.compile(r'https://github\.com/([^/]+)/([^/]+)/(pull|issues)/(\d+)')  # Full PR or Issue URL
+GITHUB_REPO_URL_PATTERN = re.compile(r'github\.com[:/]([^/]+)/([^/\.]+)')  # git@github.com:owner/repo.git or https://github.com/owner/repo
+PR_URL_NUMBER_PATTERN = re.compile(r'/pull/(\d+)')  # PR number in a URL
+ISSUE_URL_NUMBER_PATTERN = re.compile(r'/issues/(\d+)')  # Issue number in a URL
 PR_SPEC_PATTERN = re.compile(r'([^/]+)/([^#]+)#(\d+)')  # owner/repo#number format
 H1_TITLE_PATTERN = re.compile(r'^#\s+(.+)$')  # # Title
 PR_LINK_IN_H1_PATTERN = re.compile(r'^#\s*\[[^]]+]')  # Check if H1 has [...]
+TITLE_REF_PREFIX_PATTERN = re.compile(r'^\[?[^/\]]+/[^#\]]+#(XXXX|XX|[Nn][Uu][Mm][Bb][Ee][Rr]|\d+)]?\s*')  # [owner/repo#123] or placeholder prefix on a title
+MARKDOWN_IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')  # ![alt](path)
+USER_ATTACHMENT_SRC_PATTERN = re.compile(r'src="(https://github\.com/user-attachments/assets/[^"]+)"')  # src="..." in rendered markdown
+USER_ATTACHMENT_REF_PATTERN = re.compile(r'^\[([^\]]+)\]:\s+(https://github\.com/user-attachments/assets/[a-f0-9-]+)\s*$', re.MULTILINE)  # [name]: user-attachments URL
+GIT_REMOTE_SECTION_PATTERN = re.compile(r'^remote "(.+)"$')  # [remote "name"] section in .git/config
+GIT_REMOTE_FETCH_LINE_PATTERN = re.compile(r'^(\S+)\s+(\S+)\s+\(fetch\)$')  # `git remote -v` fetch line: name, url
+COMMENT_FILENAME_PATTERN = re.compile(r'^z(\d+)(?:-.*)?\.md$')  # z{id}-{author}.md or legacy z{id}.md: comment id
 
 
 def extract_title_from_first_line(first_line: str) -> str:
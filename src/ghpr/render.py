@@ -1,12 +1,11 @@
 """Rendering utilities for diffs and comments."""
 
-import difflib
-from glob import glob
 from pathlib import Path
 from utz import proc, err
 
 from .api import get_item_comments
-from .comments import read_comment_file, get_comment_id_from_filename
+from .comments import read_comment_file, get_comment_id_from_filename, list_comment_files
+from .gitpipe import GitCatFile
 
 
 def link(url: str | None, use_color: bool = True) -> str:
@@ -26,9 +25,17 @@ def render_comment_diff(
     use_color: bool = True,
     dry_run: bool = False,
     current_user: str | None = None,
+    blobs: GitCatFile | None = None,
+    remote_comments: list[dict] | None = None,
 ) -> tuple[int, int]:
     """Render comment differences between local and remote.
 
+    Args:
+        blobs: Already-open `GitCatFile` to read draft comments through;
+            otherwise one is opened for this call
+        remote_comments: The item's comments, if the caller already fetched
+            them; otherwise fetched here
+
     Returns:
         (drafts_count, changes_count): Number of draft comments and changed comments
     """
@@ -50,9 +57,15 @@ def render_comment_diff(
     drafts_count = 0
     if draft_files:
         err(f"\n{BOLD}=== Draft comments to post ==={RESET}")
+        # All drafts are read through one `git cat-file --batch`, not a `git show` each
+        own_blobs = blobs is None
+        if own_blobs:
+            blobs = GitCatFile()
         for draft_file in draft_files:
             try:
-                draft_content = proc.text('git', 'show', f'HEAD:{draft_file}', log=False)
+                draft_content = blobs.read(f'HEAD:{draft_file}')
+                if draft_content is None:
+                    raise FileNotFoundError(f'HEAD:{draft_file}')
                 if not draft_content.strip():
                     continue
 
@@ -68,13 +81,16 @@ def render_comment_diff(
                     err(f"{GREEN}{preview}{RESET}")
             except Exception as e:
                 err(f"Warning: Could not read {draft_file}: {e}")
+        if own_blobs:
+            blobs.close()
 
     # Get remote comments
-    remote_comments = get_item_comments(owner, repo, number, item_type)
+    if remote_comments is None:
+        remote_comments = get_item_comments(owner, repo, number, item_type)
     remote_comments_by_id = {str(c['id']): c for c in remote_comments}
 
     # Find all local comment files
-    comment_files = sorted(glob('z[0-9]*.md'))
+    comment_files = list_comment_files()
 
     changes_count = 0
     others_with_diffs = []
@@ -147,6 +163,13 @@ def render_unified_diff(
         use_color: Whether to use ANSI color codes
         log: Function to use for output (default: err for stderr)
     """
+    # Identical contents render nothing; skip the (pure-Python, O(N·M)) diff entirely
+    if remote_content == local_content:
+        return
+
+    # Imported here, so commands that never render a diff don't pay for it
+    import difflib
+
     if log is None:
         log = err
 
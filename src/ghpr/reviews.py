@@ -278,6 +278,7 @@ def pull(owner: str, repo: str, number: str, dry_run: bool = False) -> tuple[int
 
     new_comments = 0
     updated_comments = 0
+    to_add = []  # Staged together after the loop, in one `git add`
 
     for g in grouped:
         head_id = str(g['head']['id'])
@@ -294,19 +295,22 @@ def pull(owner: str, repo: str, number: str, dry_run: bool = False) -> tuple[int
                     err(f"[DRY-RUN] Would add review comment {comment['id']} by {author}")
                 else:
                     target.write_text(new_text)
-                    proc.run('git', 'add', str(target), log=None)
+                    to_add.append(str(target))
                 new_comments += 1
             elif target.read_text() != new_text:
                 if dry_run:
                     err(f"[DRY-RUN] Would update review comment {comment['id']}")
                 else:
                     target.write_text(new_text)
-                    proc.run('git', 'add', str(target), log=None)
+                    to_add.append(str(target))
                 updated_comments += 1
 
         if not dry_run:
             write_baseline(head_id, g['meta']['resolved'])
 
+    if to_add:
+        proc.run('git', 'add', '--', *to_add, log=None)
+
     n_threads = len(grouped)
     if new_comments or updated_comments:
         err(f"Review threads: {n_threads} thread(s), "
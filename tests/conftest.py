@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+
+import subprocess
+
+import pytest
+
+
+@pytest.fixture
+def git():
+    """Run a `git` command (in `cwd`, if given) and assert success."""
+    def run(*args, cwd=None):
+        subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True)
+    return run
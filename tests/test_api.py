@@ -0,0 +1,91 @@
+"""Tests for GitHub API helpers."""
+
+from unittest.mock import patch
+
+from ghpr import api
+
+
+def _page(typename, nodes, end_cursor=None):
+    return {'data': {'repository': {'issueOrPullRequest': {
+        '__typename': typename,
+        'title': 'T',
+        'body': 'line 1\r\nline 2',
+        'number': 7,
+        'url': 'https://github.com/o/r/pull/7',
+        'comments': {
+            'pageInfo': {'hasNextPage': end_cursor is not None, 'endCursor': end_cursor},
+            'nodes': nodes,
+        },
+    }}}}
+
+
+def _node(id, login='alice', body='hi'):
+    return {
+        'databaseId': id,
+        'url': f'https://github.com/o/r/pull/7#issuecomment-{id}',
+        'author': {'login': login} if login else None,
+        'createdAt': '2025-01-01T00:00:00Z',
+        'updatedAt': '2025-01-02T00:00:00Z',
+        'body': body,
+    }
+
+
+def test_get_item_bundle_pages_comments():
+    pages = [
+        _page('PullRequest', [_node(1, body='a\r\nb')], end_cursor='c1'),
+        _page('PullRequest', [_node(2, login=None)]),
+    ]
+    with patch.object(api.proc, 'json', side_effect=pages) as mock_json:
+        data, item_type, comments = api.get_item_bundle('o', 'r', '7')
+
+    assert item_type == 'pr'
+    assert data == {'title': 'T', 'body': 'line 1\nline 2', 'number': 7, 'url': 'https://github.com/o/r/pull/7'}
+    assert comments == [
+        {'id': 1, 'html_url': 'https://github.com/o/r/pull/7#issuecomment-1', 'user': {'login': 'alice'}, 'created_at': '2025-01-01T00:00:00Z',
+         'updated_at': '2025-01-02T00:00:00Z', 'body': 'a\nb'},
+        {'id': 2, 'html_url': 'https://github.com/o/r/pull/7#issuecomment-2', 'user': {'login': 'ghost'}, 'created_at': '2025-01-01T00:00:00Z',
+         'updated_at': '2025-01-02T00:00:00Z', 'body': 'hi'},
+    ]
+    # Second request resumes after the first page's cursor
+    assert 'after=c1' not in mock_json.call_args_list[0].args
+    assert 'after=c1' in mock_json.call_args_list[1].args
+
+
+def test_get_item_bundle_issue_and_errors():
+    with patch.object(api.proc, 'json', return_value=_page('Issue', [])):
+        _, item_type, comments = api.get_item_bundle('o', 'r', '7')
+    assert (item_type, comments) == ('issue', [])
+
+    with patch.object(api.proc, 'json', side_effect=RuntimeError('boom')), patch.object(api, 'err'):
+        assert api.get_item_bundle('o', 'r', '7') == (None, None, [])
+
+
+def test_get_push_context_includes_viewer():
+    page = _page('PullRequest', [_node(1)])
+    page['data']['viewer'] = {'login': 'bob'}
+    with patch.object(api.proc, 'json', return_value=page) as mock_json:
+        data, item_type, comments, viewer = api.get_push_context('o', 'r', '7')
+    mock_json.assert_called_once()
+    assert (data['title'], item_type, [c['id'] for c in comments], viewer) == ('T', 'pr', [1], 'bob')
+
+
+def test_get_item_comments_persists_only_new_etags():
+    path = '/repos/o/r/issues/7/comments?per_page=100'
+    body = [{'id': 1, 'body': 'hi'}]
+
+    def fetch(stored, fetched):
+        with patch.object(api, 'load_etag', return_value=stored), \
+             patch.object(api, 'save_etag') as mock_save, \
+             patch.object(api, 'GhClient') as mock_client:
+            client = mock_client.return_value.__enter__.return_value
+            client.get.return_value = body
+            client.etag.return_value = fetched
+            assert api.get_item_comments('o', 'r', '7', 'issue') == body
+        client.get.assert_called_once_with(path, conditional=True, cached=stored)
+        return mock_save
+
+    # 304: the stored ETag and body come back unchanged, so nothing is rewritten
+    fetch(('"a"', body), ('"a"', body)).assert_not_called()
+    # 200 with a new ETag (or no previous one) is persisted
+    fetch(('"a"', []), ('"b"', body)).assert_called_once_with(path, '"b"', body)
+    fetch(None, ('"a"', body)).assert_called_once_with(path, '"a"', body)
@@ -0,0 +1,73 @@
+"""Tests for `gh repo view` caching."""
+
+import pytest
+from unittest.mock import patch
+
+from ghpr import cache
+from ghpr.cache import gh_repo_view
+
+
+REPO_DATA = {'owner': {'login': 'o'}, 'name': 'r', 'defaultBranchRef': {'name': 'main'}}
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.delenv('GHPR_CACHE_TTL', raising=False)
+    gh_repo_view.cache_clear()
+    yield
+    gh_repo_view.cache_clear()
+
+
+def test_memoized_and_persisted(tmp_path):
+    with patch.object(cache.proc, 'json', return_value=REPO_DATA) as mock_json:
+        assert gh_repo_view('/some/repo') == REPO_DATA
+        assert gh_repo_view('/some/repo') == REPO_DATA
+        mock_json.assert_called_once()
+        assert mock_json.call_args.kwargs['cwd'] == '/some/repo'
+
+    # A fresh process (empty in-memory cache) is served from disk
+    gh_repo_view.cache_clear()
+    with patch.object(cache.proc, 'json') as mock_json:
+        assert gh_repo_view('/some/repo') == REPO_DATA
+        mock_json.assert_not_called()
+
+
+def test_zero_ttl_disables_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('GHPR_CACHE_TTL', '0')
+    with patch.object(cache.proc, 'json', return_value=REPO_DATA) as mock_json:
+        gh_repo_view('/some/repo')
+        gh_repo_view.cache_clear()
+        gh_repo_view('/some/repo')
+        assert mock_json.call_count == 2
+    assert not (tmp_path / 'cache' / 'ghpr').exists()
+
+
+def test_failures_are_not_cached():
+    with patch.object(cache.proc, 'json', side_effect=Exception('no repo')):
+        with pytest.raises(Exception):
+            gh_repo_view('/some/repo')
+    with patch.object(cache.proc, 'json', return_value=REPO_DATA):
+        assert gh_repo_view('/some/repo') == REPO_DATA
+
+
+def test_etag_round_trip(tmp_path, monkeypatch):
+    (tmp_path / '.git').mkdir()
+    monkeypatch.chdir(tmp_path)
+    assert cache.load_etag('/repos/o/r/issues/1/comments') is None
+    cache.save_etag('/repos/o/r/issues/1/comments', '"abc"', [{'id': 1}])
+    assert cache.load_etag('/repos/o/r/issues/1/comments') == ('"abc"', [{'id': 1}])
+
+    # Kept in the clone's git dir, readable only by its owner
+    [etag_file] = (tmp_path / '.git' / 'ghpr' / 'etags').iterdir()
+    assert etag_file.stat().st_mode & 0o777 == 0o600
+
+    monkeypatch.setenv('GHPR_CACHE_TTL', '0')
+    assert cache.load_etag('/repos/o/r/issues/1/comments') is None
+
+
+def test_etags_not_persisted_outside_a_clone(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache.save_etag('/repos/o/r/issues/1/comments', '"abc"', [{'id': 1}])
+    assert cache.load_etag('/repos/o/r/issues/1/comments') is None
+    assert list(tmp_path.iterdir()) == []
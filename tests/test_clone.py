@@ -55,3 +55,127 @@ class TestCloneDirectoryNaming:
         cwd = str(Path.cwd().resolve())
         rel_path = os.path.relpath(target, cwd)
         assert rel_path == '../300'
+
+
+def _item_data(number, body='Body\n', kind='issues'):
+    return {
+        'title': 'Title',
+        'body': body,
+        'number': number,
+        'url': f'https://github.com/owner/repo/{kind}/{number}',
+    }
+
+
+@pytest.mark.usefixtures('git_identity')
+class TestCloneWithoutChdir:
+    """`clone` runs its git ops via `git -C <target>` and leaves cwd alone."""
+
+    @pytest.fixture
+    def git_identity(self, monkeypatch):
+        """Commit identity for the clone's fresh repo (CI runners have no global git config)."""
+        for var in ('GIT_AUTHOR_EMAIL', 'GIT_COMMITTER_EMAIL'):
+            monkeypatch.setenv(var, 't@example.com')
+        for var in ('GIT_AUTHOR_NAME', 'GIT_COMMITTER_NAME'):
+            monkeypatch.setenv(var, 'T')
+
+    def test_clone_no_gist_writes_and_commits_in_target(self, tmp_path):
+        import subprocess
+        from unittest.mock import patch
+
+        from ghpr.commands import clone as clone_mod
+
+        os.chdir(tmp_path)
+
+        item_data = _item_data(7)
+        comments = [
+            {'id': 101, 'user': {'login': 'alice'}, 'created_at': 't1', 'updated_at': 't1', 'body': 'first'},
+            {'id': 102, 'user': {'login': 'bob'}, 'created_at': 't2', 'updated_at': 't3', 'body': 'second'},
+        ]
+        with patch.object(clone_mod, 'get_item_bundle', return_value=(item_data, 'issue', comments)):
+            clone_mod.clone('out', no_gist=True, no_comments=False, spec='owner/repo#7')
+
+        assert Path.cwd() == tmp_path
+        target = tmp_path / 'out'
+        assert (target / 'repo#7.md').exists()
+        assert (target / 'z101-alice.md').exists()
+        assert (target / 'z102-bob.md').exists()
+
+        tracked = subprocess.run(
+            ['git', 'ls-files'], cwd=target, check=True, capture_output=True, text=True,
+        ).stdout.split()
+        assert sorted(tracked) == ['repo#7.md', 'z101-alice.md', 'z102-bob.md']
+        pr_config = subprocess.run(
+            ['git', 'config', '--get-regexp', r'^pr\.'], cwd=target, check=True, capture_output=True, text=True,
+        ).stdout.splitlines()
+        assert pr_config == [
+            'pr.owner owner',
+            'pr.repo repo',
+            'pr.number 7',
+            'pr.url https://github.com/owner/repo/issues/7',
+            'pr.type issue',
+        ]
+
+    def test_clone_fetches_metadata_and_comments_in_one_request(self, tmp_path):
+        from unittest.mock import patch
+
+        from ghpr.commands import clone as clone_mod
+
+        os.chdir(tmp_path)
+
+        item_data = _item_data(8)
+        with patch.object(clone_mod, 'get_item_bundle', return_value=(item_data, 'issue', [])) as mock_bundle, \
+             patch.object(clone_mod, 'get_item_metadata') as mock_metadata:
+            clone_mod.clone('out', no_gist=True, no_comments=False, spec='owner/repo#8')
+
+        mock_bundle.assert_called_once_with('owner', 'repo', '8')
+        mock_metadata.assert_not_called()
+        assert (tmp_path / 'out' / 'repo#8.md').exists()
+
+    def test_clone_relative_dir_background_push_during_review_pull(self, tmp_path):
+        """Background gist pushes target the clone even while the main thread is `cd`'d into it."""
+        import subprocess
+        from threading import Event
+        from unittest.mock import patch
+
+        from ghpr import reviews
+        from ghpr.commands import clone as clone_mod
+        from ghpr.gist import add_gist_footer
+
+        os.chdir(tmp_path)
+
+        body = add_gist_footer('Body', 'https://gist.github.com/0123456789abcdef0123', visible=False)
+        item_data = _item_data(9, body=body, kind='pull')
+        comments = [{'id': 101, 'user': {'login': 'alice'}, 'created_at': 't1', 'updated_at': 't1', 'body': 'hi'}]
+
+        in_review_pull = Event()
+        comments_pushed = Event()
+        push_targets = []
+        real_run = clone_mod._run
+
+        def fake_run(*args, **kwargs):
+            if 'push' not in args:
+                return real_run(*args, **kwargs)
+            if args[-1] == '--force' and '--set-upstream' not in args:
+                # Background push: run it while the main thread is inside `reviews.pull`
+                in_review_pull.wait(timeout=5)
+                push_targets.append(Path(args[2]).is_dir() and (Path(args[2]) / '.git').is_dir())
+                comments_pushed.set()
+
+        def fake_review_pull(owner, repo, number):
+            in_review_pull.set()
+            comments_pushed.wait(timeout=5)
+            Path('z-200-00-bob.md').write_text('review\n')
+            subprocess.run(['git', 'add', 'z-200-00-bob.md'], check=True)
+            return 1, 1, 0
+
+        with patch.object(clone_mod, 'get_item_bundle', return_value=(item_data, 'pr', comments)), \
+             patch.object(clone_mod, '_run', side_effect=fake_run), \
+             patch.object(reviews, 'pull', side_effect=fake_review_pull):
+            clone_mod.clone('out', no_gist=False, no_comments=False, spec='owner/repo#9')
+
+        assert Path.cwd() == tmp_path
+        assert push_targets == [True, True]
+        tracked = subprocess.run(
+            ['git', 'ls-files'], cwd=tmp_path / 'out', check=True, capture_output=True, text=True,
+        ).stdout.split()
+        assert sorted(tracked) == ['repo#9.md', 'z-200-00-bob.md', 'z101-alice.md']
@@ -104,6 +104,12 @@ More content.
         assert updated_at == "2025-10-15T04:38:13Z"
         assert body == "Comment body here.\nMore content.\n"
 
+    def test_list_comment_files(self, tmp_path):
+        """Comment files are listed like `glob('z[0-9]*.md')`, sorted."""
+        for name in ['z2-bob.md', 'z10.md', 'z-100-00-alice.md', 'za.md', 'z3.txt', 'new.md', 'DESCRIPTION.md']:
+            (tmp_path / name).write_text('')
+        assert comments.list_comment_files(tmp_path) == ['z10.md', 'z2-bob.md']
+
     def test_write_comment_file(self, tmp_path):
         """Test writing comment file with metadata."""
         import os
@@ -0,0 +1,71 @@
+"""Tests for git config helpers."""
+
+import os
+
+from ghpr.config import get_pr_info_from_path, load_pr_config, set_pr_config
+
+
+def test_load_pr_config_reads_all_pr_keys(tmp_path, git):
+    git('init', '-q', cwd=tmp_path)
+    git('config', 'pr.owner', 'o', cwd=tmp_path)
+    git('config', 'pr.number', '7', cwd=tmp_path)
+    git('config', 'pr.gist-remote', 'g', cwd=tmp_path)
+    git('config', 'pr.url', 'https://github.com/o/r/pull/7', cwd=tmp_path)
+    git('config', 'user.name', 'Not PR', cwd=tmp_path)
+    os.chdir(tmp_path)
+    assert load_pr_config() == {
+        'owner': 'o',
+        'number': '7',
+        'gist-remote': 'g',
+        'url': 'https://github.com/o/r/pull/7',
+    }
+
+
+def test_load_pr_config_outside_repo(tmp_path):
+    os.chdir(tmp_path)
+    assert load_pr_config() == {}
+
+
+def test_get_pr_info_from_path_uses_given_config(tmp_path):
+    pr_config = {'owner': 'o', 'repo': 'r', 'number': '3'}
+    assert get_pr_info_from_path(tmp_path, pr_config=pr_config) == ('o', 'r', '3')
+
+
+def test_get_pr_info_from_gh_dir_prefers_origin(tmp_path, git):
+    git('init', '-q', cwd=tmp_path)
+    git('remote', 'add', 'fork', 'git@github.com:me/fork.git', cwd=tmp_path)
+    git('remote', 'add', 'origin', 'https://github.com/o/r.git', cwd=tmp_path)
+    pr_dir = tmp_path / 'gh' / '12'
+    pr_dir.mkdir(parents=True)
+    assert get_pr_info_from_path(pr_dir, pr_config={}) == ('o', 'r', '12')
+
+
+def test_set_pr_config_batches_keys(tmp_path, git):
+    git('init', '-q', cwd=tmp_path)
+    os.chdir(tmp_path)
+    set_pr_config(number=7, url="https://github.com/o/r/pull/7?x='y'", gist_remote='g')
+    assert load_pr_config() == {
+        'number': '7',
+        'url': "https://github.com/o/r/pull/7?x='y'",
+        'gist-remote': 'g',
+    }
+
+
+def test_set_pr_config_without_sh(tmp_path, monkeypatch, git):
+    from ghpr import config
+
+    git('init', '-q', cwd=tmp_path)
+    os.chdir(tmp_path)
+    monkeypatch.setattr(config, '_sh', lambda: None)
+    set_pr_config(number=7, gist_remote='g')
+    assert load_pr_config() == {'number': '7', 'gist-remote': 'g'}
+
+
+def test_set_pr_config_in_other_repo(tmp_path, git):
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+    git('init', '-q', cwd=repo)
+    os.chdir(tmp_path)
+    set_pr_config(cwd=repo, number=7, type='pr')
+    os.chdir(repo)
+    assert load_pr_config() == {'number': '7', 'type': 'pr'}
@@ -14,12 +14,19 @@ from ghpr.commands.create import (
     create_new_issue,
     _resolve_draft_path,
     _ensure_nested_git_repo,
+    _find_git_root,
+    _parse_github_url,
+    _resolve_parent_repo,
+    _detect_base_and_head,
+    get_owner_repo,
 )
 
 
-def _run(*args, cwd=None):
-    """Run a command and assert success."""
-    subprocess.run(args, cwd=cwd, check=True, capture_output=True)
+@pytest.fixture
+def mock_set_pr_config():
+    """Patch `set_pr_config` for tests that mock out `proc` (no real `.git/config` to write)."""
+    with patch('ghpr.commands.create.set_pr_config') as mock:
+        yield mock
 
 
 def _toplevel(cwd) -> str | None:
@@ -53,13 +60,121 @@ class TestResolveDraftPath:
         assert _resolve_draft_path('/abs/path') == Path('/abs/path')
 
 
+class TestParseGithubUrl:
+    """`_parse_github_url` handles SSH and HTTPS remotes."""
+
+    @pytest.mark.parametrize('url', [
+        'git@github.com:owner/repo.git',
+        'https://github.com/owner/repo',
+        'https://github.com/owner/repo.git',
+    ])
+    def test_github_urls(self, url):
+        assert _parse_github_url(url) == ('owner', 'repo')
+
+    def test_non_github_url(self):
+        assert _parse_github_url('git@gitlab.com:owner/repo.git') == (None, None)
+
+
+class TestGetOwnerRepoFromRemotes:
+    """`get_owner_repo` falls back to the cwd repo's remotes, preferring origin."""
+
+    def test_prefers_origin(self, tmp_path, git):
+        repo = tmp_path / 'repo'
+        repo.mkdir()
+        git('init', '-q', cwd=repo)
+        git('remote', 'add', 'upstream', 'git@github.com:up/stream.git', cwd=repo)
+        git('remote', 'add', 'origin', 'https://github.com/me/fork', cwd=repo)
+        os.chdir(repo)
+        assert get_owner_repo() == ('me', 'fork')
+
+    def test_any_github_remote(self, tmp_path, git):
+        repo = tmp_path / 'repo'
+        repo.mkdir()
+        git('init', '-q', cwd=repo)
+        git('remote', 'add', 'g', 'git@gist.github.com:abcdef0123456789abcd.git', cwd=repo)
+        git('remote', 'add', 'upstream', 'git@github.com:up/stream.git', cwd=repo)
+        os.chdir(repo)
+        assert get_owner_repo() == ('up', 'stream')
+
+    def test_cached_per_cwd(self, tmp_path):
+        os.chdir(tmp_path)
+        with patch('ghpr.commands.create.load_pr_config', return_value={'owner': 'o', 'repo': 'r'}) as mock_load:
+            assert get_owner_repo() == ('o', 'r')
+            assert get_owner_repo() == ('o', 'r')
+        mock_load.assert_called_once()
+
+
+class TestFindGitRoot:
+    """`_find_git_root` returns the nearest ancestor with a `.git` dir or file."""
+
+    def test_walks_up_to_git_dir(self, tmp_path):
+        (tmp_path / '.git').mkdir()
+        nested = tmp_path / 'gh' / 'drafts' / 'foo'
+        nested.mkdir(parents=True)
+        assert _find_git_root(str(nested)) == tmp_path
+
+    def test_git_file_counts(self, tmp_path):
+        worktree = tmp_path / 'wt'
+        worktree.mkdir()
+        (worktree / '.git').write_text('gitdir: /elsewhere\n')
+        assert _find_git_root(str(worktree)) == worktree
+
+
+class TestResolveParentRepo:
+    """`_resolve_parent_repo` walks up to the nearest GitHub-backed repo, once."""
+
+    def test_walks_up_and_caches(self, tmp_path):
+        (tmp_path / '.git').mkdir()
+        draft = tmp_path / 'gh' / 'drafts' / 'foo'
+        draft.mkdir(parents=True)
+        repo_data = {'owner': {'login': 'o'}, 'name': 'r'}
+        with patch('ghpr.commands.create.gh_repo_view', return_value=repo_data) as mock_view:
+            assert _resolve_parent_repo(str(draft)) == (tmp_path, 'o', 'r')
+            assert _resolve_parent_repo(str(draft)) == (tmp_path, 'o', 'r')
+        mock_view.assert_called_once_with(str(tmp_path))
+
+    def test_skips_repos_gh_cannot_resolve(self, tmp_path):
+        inner = tmp_path / 'inner'
+        (inner / '.git').mkdir(parents=True)
+        (tmp_path / '.git').mkdir()
+        repo_data = {'owner': {'login': 'o'}, 'name': 'r'}
+
+        def view(path):
+            if path == str(inner):
+                raise Exception('no GitHub remote')
+            return repo_data
+
+        with patch('ghpr.commands.create.gh_repo_view', side_effect=view):
+            assert _resolve_parent_repo(str(inner)) == (tmp_path, 'o', 'r')
+
+
+class TestDetectBaseAndHead:
+    """`_detect_base_and_head` only looks up what's asked for."""
+
+    def test_base_and_head_from_parent(self, tmp_path):
+        (tmp_path / '.git').mkdir()
+        repo_data = {'owner': {'login': 'o'}, 'name': 'r', 'defaultBranchRef': {'name': 'dev'}}
+        with patch('ghpr.commands.create.gh_repo_view', return_value=repo_data), \
+             patch('ghpr.commands.create.resolve_remote_ref', return_value=('feature', 'origin/feature')), \
+             patch('ghpr.commands.create.err'):
+            assert _detect_base_and_head(str(tmp_path), need_base=True, need_head=True) == ('dev', 'feature')
+
+    def test_head_only_skips_repo_view(self, tmp_path):
+        (tmp_path / '.git').mkdir()
+        with patch('ghpr.commands.create.gh_repo_view') as mock_view, \
+             patch('ghpr.commands.create.resolve_remote_ref', return_value=('local', None)), \
+             patch('ghpr.commands.create.err'):
+            assert _detect_base_and_head(str(tmp_path), need_base=False, need_head=True) == (None, 'local')
+        mock_view.assert_not_called()
+
+
 class TestEnsureNestedGitRepo:
     """Tests for _ensure_nested_git_repo auto-init behavior."""
 
-    def test_inits_nested_repo_when_parent_owns_cwd(self, tmp_path):
+    def test_inits_nested_repo_when_parent_owns_cwd(self, tmp_path, git):
         """When the parent git repo owns cwd, init a nested repo here."""
         # Parent repo with gh/ ignored
-        _run('git', 'init', '-q', cwd=tmp_path)
+        git('init', '-q', cwd=tmp_path)
         (tmp_path / '.gitignore').write_text('gh/\n')
         draft_dir = tmp_path / 'gh' / 'drafts' / 'foo'
         draft_dir.mkdir(parents=True)
@@ -84,14 +199,14 @@ class TestEnsureNestedGitRepo:
         ).stdout.strip()
         assert cfg == '42'
 
-    def test_noop_when_cwd_is_already_nested_toplevel(self, tmp_path):
+    def test_noop_when_cwd_is_already_nested_toplevel(self, tmp_path, git):
         """If cwd is already its own toplevel, don't reinit."""
-        _run('git', 'init', '-q', cwd=tmp_path)
+        git('init', '-q', cwd=tmp_path)
         nested = tmp_path / 'nested'
         nested.mkdir()
-        _run('git', 'init', '-q', cwd=nested)
+        git('init', '-q', cwd=nested)
         # Mark this repo with a sentinel so we can detect a re-init
-        _run('git', 'config', 'sentinel.value', 'preserved', cwd=nested)
+        git('config', 'sentinel.value', 'preserved', cwd=nested)
 
         old_cwd = os.getcwd()
         try:
@@ -138,11 +253,11 @@ class TestCreateWithGitignoredGh:
     isn't tracked in the parent repo (it's gitignored).
     """
 
-    def test_create_issue_succeeds_with_gh_gitignored(self, tmp_path, monkeypatch):
+    def test_create_issue_succeeds_with_gh_gitignored(self, tmp_path, monkeypatch, git):
         # Parent repo with gh/ ignored
-        _run('git', 'init', '-q', cwd=tmp_path)
-        _run('git', 'config', 'user.email', 't@example.com', cwd=tmp_path)
-        _run('git', 'config', 'user.name', 'T', cwd=tmp_path)
+        git('init', '-q', cwd=tmp_path)
+        git('config', 'user.email', 't@example.com', cwd=tmp_path)
+        git('config', 'user.name', 'T', cwd=tmp_path)
         (tmp_path / '.gitignore').write_text('gh/\n')
 
         # User has a manually-created draft (no `ghpr init`)
@@ -184,14 +299,14 @@ class TestCreateWithGitignoredGh:
         ).stdout
         assert 'repo#42.md' in log
 
-    def test_create_issue_succeeds_with_existing_nested_repo(self, tmp_path, monkeypatch):
+    def test_create_issue_succeeds_with_existing_nested_repo(self, tmp_path, monkeypatch, git):
         """Regression: existing nested git repo (from `ghpr init`) still works.
 
         Verifies the `git rm --ignore-unmatch` change didn't break the
         case where DESCRIPTION.md was already tracked in the nested repo.
         """
         # Parent repo with gh/ ignored
-        _run('git', 'init', '-q', cwd=tmp_path)
+        git('init', '-q', cwd=tmp_path)
         (tmp_path / '.gitignore').write_text('gh/\n')
 
         # Draft with its OWN nested git repo and a committed DESCRIPTION.md
@@ -199,11 +314,11 @@ class TestCreateWithGitignoredGh:
         draft_dir = tmp_path / 'gh' / 'drafts' / 'test-issue'
         draft_dir.mkdir(parents=True)
         (draft_dir / 'DESCRIPTION.md').write_text('# Test Issue\n\nBody\n')
-        _run('git', 'init', '-q', cwd=draft_dir)
-        _run('git', 'config', 'user.email', 't@example.com', cwd=draft_dir)
-        _run('git', 'config', 'user.name', 'T', cwd=draft_dir)
-        _run('git', 'add', 'DESCRIPTION.md', cwd=draft_dir)
-        _run('git', 'commit', '-q', '-m', 'init', cwd=draft_dir)
+        git('init', '-q', cwd=draft_dir)
+        git('config', 'user.email', 't@example.com', cwd=draft_dir)
+        git('config', 'user.name', 'T', cwd=draft_dir)
+        git('add', 'DESCRIPTION.md', cwd=draft_dir)
+        git('commit', '-q', '-m', 'init', cwd=draft_dir)
 
         monkeypatch.chdir(draft_dir)
 
@@ -235,6 +350,7 @@ class TestCreateWithGitignoredGh:
         assert any('repo#7.md' in line for line in diff), diff
 
 
+@pytest.mark.usefixtures('mock_set_pr_config')
 class TestInitSlugMode:
     """Test init with slug-based path argument for parallel drafts."""
 
@@ -281,7 +397,7 @@ class TestInitSlugMode:
 class TestInit:
     """Test init command."""
 
-    def test_init_with_explicit_repo(self, tmp_path):
+    def test_init_with_explicit_repo(self, tmp_path, mock_set_pr_config):
         """Test init with -r owner/repo flag."""
         runner = CliRunner()
 
@@ -298,13 +414,8 @@ class TestInit:
                 ]
                 assert 'git' in git_commands
 
-                # Find specific git config calls
-                git_config_calls = [
-                    call[0] for call in mock_proc.run.call_args_list
-                    if len(call[0]) > 2 and call[0][0] == 'git' and call[0][1] == 'config'
-                ]
-                assert ('git', 'config', 'pr.owner', 'test-owner') in git_config_calls
-                assert ('git', 'config', 'pr.repo', 'test-repo') in git_config_calls
+                # owner/repo are written in one batched config call
+                mock_set_pr_config.assert_called_once_with(owner='test-owner', repo='test-repo')
 
                 # Check gh/new/ directory and DESCRIPTION.md were created
                 assert Path('gh/new').is_dir()
@@ -322,6 +433,7 @@ class TestInit:
             assert result.exit_code != 0
 
 
+@pytest.mark.usefixtures('mock_set_pr_config')
 class TestCreateIssue:
     """Test issue creation with mocked gh calls."""
 
@@ -344,7 +456,7 @@ class TestCreateIssue:
             gh_calls = [call for call in mock_proc.text.call_args_list if 'gh' in str(call)]
             assert len(gh_calls) == 0
 
-    def test_create_issue_success(self, tmp_path):
+    def test_create_issue_success(self, tmp_path, mock_set_pr_config):
         """Test successful issue creation."""
         os.chdir(tmp_path)
         Path('DESCRIPTION.md').write_text('# Test Issue\n\nTest body content\n')
@@ -370,13 +482,10 @@ class TestCreateIssue:
             expected_args = ('gh', 'issue', 'create', '-R', 'test-owner/test-repo', '--title', 'Test Issue', '--body', 'Test body content')
             assert call_args == expected_args
 
-            # Verify git config was set with exact calls
-            config_calls = [
-                call[0] for call in mock_proc.run.call_args_list
-                if len(call[0]) > 1 and call[0][0] == 'git' and call[0][1] == 'config'
-            ]
-            assert ('git', 'config', 'pr.number', '42') in config_calls
-            assert ('git', 'config', 'pr.type', 'issue') in config_calls
+            # Verify git config was set in one batched call
+            mock_set_pr_config.assert_any_call(
+                number='42', type='issue', url='https://github.com/test-owner/test-repo/issues/42',
+            )
 
             # Verify file was written with link reference
             mock_write.assert_called_once()
@@ -385,6 +494,10 @@ class TestCreateIssue:
             assert write_args[2] == 'test-repo'
             assert write_args[3] == '42'
 
+            # DESCRIPTION.md was read once; finalize reused the parsed title/body
+            mock_read_desc.assert_called_once()
+            assert write_args[4:6] == ('Test Issue', 'Test body content')
+
     def test_create_issue_with_explicit_repo(self, tmp_path):
         """Test issue creation with -r flag."""
         os.chdir(tmp_path)
@@ -409,6 +522,7 @@ class TestCreateIssue:
             mock_get_repo.assert_called_once_with('other-owner/other-repo')
 
 
+@pytest.mark.usefixtures('mock_set_pr_config')
 class TestCreatePR:
     """Test PR creation with mocked gh calls.
 
@@ -425,6 +539,7 @@ class TestCreatePR:
         Path('.git').mkdir()
 
         with patch('ghpr.commands.create.proc') as mock_proc, \
+             patch('ghpr.commands.create.load_pr_config') as mock_load_config, \
              patch('ghpr.commands.create.read_description_file') as mock_read_desc, \
              patch('ghpr.commands.create.write_description_with_link_ref') as mock_write, \
              patch('ghpr.commands.push.push'), \
@@ -432,14 +547,7 @@ class TestCreatePR:
              patch('os.rename'):
 
             # Setup mocks for successful flow
-            def line_side_effect(*args, **kwargs):
-                if 'pr.owner' in args:
-                    return 'test-owner'
-                elif 'pr.repo' in args:
-                    return 'test-repo'
-                return ''
-
-            mock_proc.line.side_effect = line_side_effect
+            mock_load_config.return_value = {'owner': 'test-owner', 'repo': 'test-repo'}
             mock_proc.text.return_value = 'https://github.com/test-owner/test-repo/pull/42'
             mock_proc.lines.return_value = []
             mock_read_desc.return_value = ('Test PR', 'Test body')
@@ -474,20 +582,14 @@ class TestCreatePR:
         Path('.git').mkdir()
 
         with patch('ghpr.commands.create.proc') as mock_proc, \
+             patch('ghpr.commands.create.load_pr_config') as mock_load_config, \
              patch('ghpr.commands.create.read_description_file') as mock_read_desc, \
              patch('ghpr.commands.create.write_description_with_link_ref'), \
              patch('ghpr.commands.push.push'), \
              patch('ghpr.commands.create.err'), \
              patch('os.rename'):
 
-            def line_side_effect(*args, **kwargs):
-                if 'pr.owner' in args:
-                    return 'test-owner'
-                elif 'pr.repo' in args:
-                    return 'test-repo'
-                return ''
-
-            mock_proc.line.side_effect = line_side_effect
+            mock_load_config.return_value = {'owner': 'test-owner', 'repo': 'test-repo'}
             mock_proc.text.return_value = 'https://github.com/test-owner/test-repo/pull/99'
             mock_proc.lines.return_value = []
             mock_read_desc.return_value = ('Draft PR', 'Draft body')
@@ -513,3 +615,102 @@ class TestCreatePR:
                 '--draft'
             )
             assert call_args == expected_args
+
+    @pytest.mark.parametrize('gh_output, expect_lookup', [
+        ('https://github.com/test-owner/test-repo/pull/77', False),
+        ('Opening https://github.com/test-owner/test-repo/compare/main...feature in your browser.', True),
+    ])
+    def test_web_editor_uses_printed_pr_url(self, tmp_path, gh_output, expect_lookup):
+        """Web mode skips the PR lookup when `gh` already printed the PR URL."""
+        os.chdir(tmp_path)
+        Path('DESCRIPTION.md').write_text('# Web PR\n\nBody\n')
+        Path('.git').mkdir()
+
+        with patch('ghpr.commands.create.proc') as mock_proc, \
+             patch('ghpr.commands.create.load_pr_config') as mock_load_config, \
+             patch('ghpr.commands.create._find_pr_for_head') as mock_find, \
+             patch('ghpr.commands.create._finalize_created_item') as mock_finalize, \
+             patch('ghpr.commands.create.err'), \
+             patch('builtins.input', return_value=''):
+
+            mock_load_config.return_value = {'owner': 'test-owner', 'repo': 'test-repo'}
+            mock_proc.text.return_value = gh_output
+            mock_find.return_value = ('78', 'https://github.com/test-owner/test-repo/pull/78')
+
+            create_new_pr(head='feature', base='main', draft=False, repo_arg=None, yes=0, dry_run=False)
+
+            assert mock_find.called == expect_lookup
+            number = '78' if expect_lookup else '77'
+            assert mock_finalize.call_args[0][:3] == ('test-owner', 'test-repo', number)
+
+    def test_explicit_args_skip_config_and_detection(self, tmp_path):
+        """With -r, --base and --head all given, no git config or branch detection runs."""
+        os.chdir(tmp_path)
+        Path('DESCRIPTION.md').write_text('# Test PR\n\nBody\n')
+
+        with patch('ghpr.commands.create.proc') as mock_proc, \
+             patch('ghpr.commands.create.load_pr_config') as mock_load_config, \
+             patch('ghpr.commands.create.resolve_remote_ref') as mock_resolve, \
+             patch('ghpr.commands.create.err'):
+
+            create_new_pr(head='feature', base='main', draft=False, repo_arg='o/r', yes=2, dry_run=True)
+
+            mock_load_config.assert_not_called()
+            mock_resolve.assert_not_called()
+            assert not mock_proc.mock_calls
+
+
+class TestWaitForWebPr:
+    """`_wait_for_web_pr` polls for the new PR, with Enter as a manual override."""
+
+    def _patches(self, ready):
+        from ghpr.commands import create as create_mod
+        stdin = MagicMock()
+        stdin.isatty.return_value = True
+        return (
+            patch.object(create_mod.sys, 'stdin', stdin),
+            patch.object(create_mod.select, 'select', side_effect=lambda r, w, x, t: (r if next(ready) else [], [], [])),
+            patch.object(create_mod, 'GhClient'),
+        )
+
+    def test_returns_pr_once_it_appears(self):
+        from ghpr.commands.create import _wait_for_web_pr
+        stdin_p, select_p, client_p = self._patches(iter([False, False]))
+        with stdin_p, select_p, client_p as mock_client_cls:
+            client = mock_client_cls.return_value
+            client.get.side_effect = [[], [{'number': 12, 'html_url': 'https://github.com/o/r/pull/12'}]]
+            assert _wait_for_web_pr('o', 'r', 'feature') == ('12', 'https://github.com/o/r/pull/12')
+        assert client.get.call_args.kwargs['params']['head'] == 'o:feature'
+        assert client.get.call_args.kwargs['conditional'] is True
+
+    def test_enter_stops_waiting(self):
+        from ghpr.commands.create import _wait_for_web_pr
+        stdin_p, select_p, client_p = self._patches(iter([True]))
+        with stdin_p, select_p, client_p as mock_client_cls:
+            assert _wait_for_web_pr('o', 'r', 'feature') is None
+            mock_client_cls.return_value.get.assert_not_called()
+
+    def test_transient_api_error_keeps_polling(self):
+        from ghpr.commands.create import _wait_for_web_pr
+        from ghpr.ghclient import GhApiError
+        stdin_p, select_p, client_p = self._patches(iter([False, False]))
+        with stdin_p, select_p, client_p as mock_client_cls:
+            client = mock_client_cls.return_value
+            client.get.side_effect = [GhApiError(502, 'Bad Gateway', '/pulls'), [{'number': 3, 'html_url': 'u'}]]
+            assert _wait_for_web_pr('o', 'r', 'feature') == ('3', 'u')
+
+    def test_no_token_waits_for_enter(self, monkeypatch):
+        """Without a token, wait for Enter instead of retrying `gh auth token` on every poll."""
+        from ghpr.commands import create as create_mod
+        monkeypatch.delenv('GH_TOKEN', raising=False)
+        monkeypatch.delenv('GITHUB_TOKEN', raising=False)
+        stdin = MagicMock()
+        stdin.isatty.return_value = True
+        with patch.object(create_mod.sys, 'stdin', stdin), \
+             patch.object(create_mod.select, 'select') as mock_select, \
+             patch('ghpr.ghclient.proc.line', side_effect=subprocess.CalledProcessError(1, 'gh')) as mock_line, \
+             patch('builtins.input', return_value='') as mock_input:
+            assert create_mod._wait_for_web_pr('o', 'r', 'feature') is None
+        mock_line.assert_called_once()
+        mock_input.assert_called_once()
+        mock_select.assert_not_called()
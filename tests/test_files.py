@@ -1,5 +1,6 @@
 """Tests for description file operations."""
 
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -10,6 +11,7 @@ from ghpr.files import (
     find_description_file,
     write_description_with_link_ref,
     read_description_file,
+    body_after_title,
 )
 
 
@@ -125,6 +127,20 @@ class TestWriteDescriptionWithLinkRef:
             )
             assert content == expected
 
+    def test_rewrite_unchanged_is_skipped(self):
+        """Writing identical content reports no change and leaves the file alone."""
+        with TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / 'myrepo#123.md'
+            args = dict(
+                owner='owner', repo='myrepo', pr_number='123', title='Test PR',
+                body='This is the body.', url='https://github.com/owner/myrepo/pull/123',
+            )
+            assert write_description_with_link_ref(filepath, **args) is True
+            os.utime(filepath, ns=(0, 0))
+            assert write_description_with_link_ref(filepath, **args) is False
+            assert filepath.stat().st_mtime_ns == 0
+            assert write_description_with_link_ref(filepath, **{**args, 'title': 'New title'}) is True
+
     def test_write_empty_body(self):
         """Test writing description with empty body."""
         with TemporaryDirectory() as tmpdir:
@@ -230,6 +246,20 @@ class TestWriteDescriptionWithLinkRef:
             assert content.count(link_def) == 1
 
 
+class TestBodyAfterTitle:
+    """Test stripping leading blank lines / trailing whitespace from the body."""
+
+    @pytest.mark.parametrize('rest, expected', [
+        ('\nBody\n', 'Body'),
+        ('\n  \n\t\nBody\n\nMore\n\n', 'Body\n\nMore'),
+        ('  indented first line\n', '  indented first line'),
+        ('', ''),
+        ('\n\n  ', ''),
+    ])
+    def test_body_after_title(self, rest, expected):
+        assert body_after_title(rest) == expected
+
+
 class TestReadDescriptionFile:
     """Test reading and parsing description files."""
 
@@ -0,0 +1,70 @@
+"""Tests for filesystem helpers."""
+
+import pytest
+
+from ghpr import fs
+from ghpr.fs import rename_noreplace
+
+
+@pytest.fixture(params=['native', 'fallback'])
+def impl(request, monkeypatch):
+    if request.param == 'fallback':
+        monkeypatch.setattr(fs, '_renameat2', None)
+    return request.param
+
+
+def test_renames_directory(tmp_path, impl):
+    src = tmp_path / 'new'
+    src.mkdir()
+    (src / 'f').write_text('x')
+    rename_noreplace(src, tmp_path / '42')
+    assert not src.exists()
+    assert (tmp_path / '42' / 'f').read_text() == 'x'
+
+
+def test_refuses_existing_destination(tmp_path, impl):
+    src = tmp_path / 'new'
+    src.mkdir()
+    (tmp_path / '42').mkdir()
+    with pytest.raises(FileExistsError):
+        rename_noreplace(src, tmp_path / '42')
+    assert src.exists()
+
+
+def test_write_chunks_truncates(tmp_path):
+    path = tmp_path / 'f.md'
+    path.write_text('old content that is longer\n')
+    fs.write_chunks(path, ['# Title\n', '', '\n', 'béta\n'])
+    assert path.read_text() == '# Title\n\nbéta\n'
+
+
+def test_write_chunks_short_writev(tmp_path, monkeypatch):
+    real_writev = fs.os.writev
+    # Write at most 3 bytes per call, to exercise resuming mid-buffer
+    monkeypatch.setattr(fs.os, 'writev', lambda fd, bufs: real_writev(fd, [b''.join(bufs)[:3]]))
+    path = tmp_path / 'f.md'
+    fs.write_chunks(path, ['abcd', 'ef', 'ghijk'])
+    assert path.read_text() == 'abcdefghijk'
+
+
+def test_read_text_universal_newlines(tmp_path):
+    path = tmp_path / 'f.md'
+    path.write_bytes(b'a\r\nb\rc\n\xc3\xa9')
+    assert fs.read_text(path) == 'a\nb\nc\né'
+    with open(path) as f:
+        assert fs.read_text(path) == f.read()
+
+
+def test_read_text_without_noatime_permission(tmp_path, monkeypatch):
+    path = tmp_path / 'f.md'
+    path.write_text('body\n')
+    real_open = fs.os.open
+
+    def fake_open(p, flags, *args):
+        if flags & fs.O_NOATIME:
+            raise PermissionError(1, 'Operation not permitted')
+        return real_open(p, flags, *args)
+
+    monkeypatch.setattr(fs, 'O_NOATIME', 0o1000000)
+    monkeypatch.setattr(fs.os, 'open', fake_open)
+    assert fs.read_text(path) == 'body\n'
@@ -0,0 +1,144 @@
+"""Tests for the persistent-connection GitHub REST client."""
+
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ghpr import ghclient
+from ghpr.ghclient import GhApiError, GhClient
+
+
+def _response(status, body, reason='OK', etag=None):
+    resp = MagicMock(status=status, reason=reason)
+    resp.getheader.return_value = etag
+    resp.read.return_value = json.dumps(body).encode() if body is not None else b''
+    return resp
+
+
+def test_reuses_one_connection():
+    with patch.object(ghclient, 'HTTPSConnection') as mock_conn_cls:
+        conn = mock_conn_cls.return_value
+        conn.getresponse.side_effect = [_response(200, [{'number': 1}]), _response(200, {'name': 'r'})]
+        with GhClient(token='t') as client:
+            assert client.get('/repos/o/r/pulls', params={'head': 'o:b', 'state': 'open'}) == [{'number': 1}]
+            assert client.get('/repos/o/r') == {'name': 'r'}
+
+    mock_conn_cls.assert_called_once_with('api.github.com', timeout=30)
+    paths = [c.args[1] for c in conn.request.call_args_list]
+    assert paths == ['/repos/o/r/pulls?head=o%3Ab&state=open', '/repos/o/r']
+    assert conn.request.call_args.kwargs['headers']['Authorization'] == 'token t'
+    conn.close.assert_called_once()
+
+
+def test_error_status_raises():
+    with patch.object(ghclient, 'HTTPSConnection') as mock_conn_cls:
+        mock_conn_cls.return_value.getresponse.return_value = _response(404, {}, reason='Not Found')
+        with GhClient(token='t') as client, pytest.raises(GhApiError) as exc:
+            client.get('/repos/o/missing')
+    assert exc.value.status == 404
+
+
+def test_conditional_requests_reuse_body_on_304():
+    with patch.object(ghclient, 'HTTPSConnection') as mock_conn_cls:
+        conn = mock_conn_cls.return_value
+        conn.getresponse.side_effect = [
+            _response(200, [], etag='"v1"'),
+            _response(304, None, reason='Not Modified'),
+            _response(200, [{'number': 5}], etag='"v2"'),
+        ]
+        with GhClient(token='t') as client:
+            assert client.get('/repos/o/r/pulls', conditional=True) == []
+            assert client.get('/repos/o/r/pulls', conditional=True) == []
+            assert client.get('/repos/o/r/pulls', conditional=True) == [{'number': 5}]
+
+    sent = [c.kwargs['headers'].get('If-None-Match') for c in conn.request.call_args_list]
+    assert sent == [None, '"v1"', '"v1"']
+
+
+def test_conditional_request_seeded_from_earlier_run():
+    with patch.object(ghclient, 'HTTPSConnection') as mock_conn_cls:
+        conn = mock_conn_cls.return_value
+        conn.getresponse.return_value = _response(304, None, reason='Not Modified')
+        with GhClient(token='t') as client:
+            assert client.get('/repos/o/r/pulls', conditional=True, cached=('"v1"', [{'number': 5}])) == [{'number': 5}]
+            assert client.etag('/repos/o/r/pulls') == ('"v1"', [{'number': 5}])
+
+    assert conn.request.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+
+
+def test_download_follows_redirect_without_leaking_token():
+    conns = {}
+
+    def make_conn(netloc, timeout):
+        conns[netloc] = conn = MagicMock()
+        if netloc == 'github.com':
+            redirect = MagicMock(status=302, reason='Found')
+            redirect.getheader.return_value = 'https://cdn.example.com/a1?sig=x'
+            conn.getresponse.side_effect = [redirect, redirect]
+        else:
+            conn.getresponse.side_effect = [
+                MagicMock(status=200, **{'read.return_value': b'\x89PNG1'}),
+                MagicMock(status=200, **{'read.return_value': b'\x89PNG2'}),
+            ]
+        return conn
+
+    with patch.object(ghclient, 'HTTPSConnection', side_effect=make_conn):
+        with GhClient(token='t') as client:
+            assert client.download('https://github.com/user-attachments/assets/a1') == b'\x89PNG1'
+            assert client.download('https://github.com/user-attachments/assets/a2') == b'\x89PNG2'
+
+    # One connection per host, reused across downloads
+    assert set(conns) == {'github.com', 'cdn.example.com'}
+    gh_headers = conns['github.com'].request.call_args.kwargs['headers']
+    cdn_call = conns['cdn.example.com'].request.call_args
+    assert gh_headers['Authorization'] == 'token t'
+    assert cdn_call.args[1] == '/a1?sig=x'
+    assert 'Authorization' not in cdn_call.kwargs['headers']
+    for conn in conns.values():
+        conn.close.assert_called_once()
+
+
+def test_download_streams_into_file():
+    class Response(io.BytesIO):
+        status, reason = 200, 'OK'
+
+        def getheader(self, name):
+            return None
+
+    out = io.BytesIO()
+    with patch.object(ghclient, 'HTTPSConnection') as mock_conn_cls:
+        mock_conn_cls.return_value.getresponse.return_value = Response(b'\x89PNG' + b'x' * 100_000)
+        with GhClient(token='t') as client:
+            assert client.download('https://github.com/user-attachments/assets/a1', out=out) is None
+    assert out.getvalue() == b'\x89PNG' + b'x' * 100_000
+
+
+def test_request_sends_json_body():
+    with patch.object(ghclient, 'HTTPSConnection') as mock_conn_cls:
+        conn = mock_conn_cls.return_value
+        conn.getresponse.return_value = _response(200, {'id': 9})
+        with GhClient(token='t') as client:
+            assert client.request('PATCH', '/repos/o/r/issues/comments/9', {'body': 'hi'}) == {'id': 9}
+
+    method, path = conn.request.call_args.args
+    assert (method, path) == ('PATCH', '/repos/o/r/issues/comments/9')
+    assert json.loads(conn.request.call_args.kwargs['body']) == {'body': 'hi'}
+    assert conn.request.call_args.kwargs['headers']['Content-Type'] == 'application/json'
+
+
+def test_post_not_retried_on_dropped_connection():
+    with patch.object(ghclient, 'HTTPSConnection') as mock_conn_cls:
+        conn = mock_conn_cls.return_value
+        conn.getresponse.side_effect = ConnectionResetError
+        with GhClient(token='t') as client, pytest.raises(ConnectionResetError):
+            client.request('POST', '/repos/o/r/issues/1/comments', {'body': 'hi'})
+    conn.request.assert_called_once()
+
+
+def test_token_resolved_lazily():
+    with patch.object(ghclient, 'gh_token', return_value='lazy') as mock_token:
+        client = GhClient()
+        mock_token.assert_not_called()
+        assert client.headers['Authorization'] == 'token lazy'
@@ -0,0 +1,51 @@
+"""Tests for reading `.git/config` without spawning git."""
+
+from ghpr.gitcfg import config_remotes, find_gist_remote_fast, read_config, remote_urls
+
+
+GIST_ID = 'abcdef0123456789abcdef0123456789'
+
+
+def test_read_config_missing_repo(tmp_path):
+    assert read_config(tmp_path) is None
+
+
+def test_remotes_and_pr_keys(tmp_path, git):
+    git('init', '-q', cwd=tmp_path)
+    git('remote', 'add', 'origin', 'git@github.com:o/r.git', cwd=tmp_path)
+    git('remote', 'add', 'g', f'git@gist.github.com:{GIST_ID}.git', cwd=tmp_path)
+    git('config', 'pr.number', '42', cwd=tmp_path)
+
+    cfg = read_config(tmp_path)
+    assert cfg.get('pr', 'number') == '42'
+    assert config_remotes(cfg) == {
+        'origin': 'git@github.com:o/r.git',
+        'g': f'git@gist.github.com:{GIST_ID}.git',
+    }
+    assert find_gist_remote_fast(cfg) == ('g', GIST_ID)
+
+
+def test_configured_gist_remote_wins(tmp_path, git):
+    git('init', '-q', cwd=tmp_path)
+    git('remote', 'add', 'g', f'git@gist.github.com:{GIST_ID}.git', cwd=tmp_path)
+    git('remote', 'add', 'mirror', 'https://gist.github.com/0123456789abcdef0123.git', cwd=tmp_path)
+    git('config', 'pr.gist-remote', 'mirror', cwd=tmp_path)
+
+    assert find_gist_remote_fast(read_config(tmp_path)) == ('mirror', '0123456789abcdef0123')
+
+
+def test_no_gist_remote(tmp_path, git):
+    git('init', '-q', cwd=tmp_path)
+    git('remote', 'add', 'origin', 'git@github.com:o/r.git', cwd=tmp_path)
+
+    assert find_gist_remote_fast(read_config(tmp_path)) == (None, None)
+
+
+def test_remote_urls_from_subdirectory(tmp_path, git):
+    git('init', '-q', cwd=tmp_path)
+    git('remote', 'add', 'origin', 'git@github.com:o/r.git', cwd=tmp_path)
+    subdir = tmp_path / 'sub'
+    subdir.mkdir()
+    # Not a repo root, so this goes through one `git remote -v`
+    assert remote_urls(subdir) == {'origin': 'git@github.com:o/r.git'}
+    assert remote_urls(tmp_path) == {'origin': 'git@github.com:o/r.git'}
@@ -0,0 +1,31 @@
+"""Tests for the persistent `git cat-file --batch` reader."""
+
+from ghpr.gitpipe import GitCatFile
+
+
+def test_reads_multiple_blobs_over_one_process(tmp_path, git):
+    git('init', '-q', cwd=tmp_path)
+    (tmp_path / 'a.md').write_text('alpha\n')
+    (tmp_path / 'b.md').write_text('béta\nline 2')
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'c.md').write_text('')
+    git('add', '.', cwd=tmp_path)
+    git('-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-qm', 'init', cwd=tmp_path)
+
+    with GitCatFile(cwd=str(tmp_path)) as blobs:
+        assert blobs.read('HEAD:a.md') == 'alpha\n'
+        pid = blobs._proc.pid
+        assert blobs.read('HEAD:b.md') == 'béta\nline 2'
+        assert blobs.read('HEAD:sub/c.md') == ''
+        assert blobs.read('HEAD:missing.md') is None
+        # Trees aren't blobs
+        assert blobs.read('HEAD:sub') is None
+        assert blobs.read('HEAD:a.md') == 'alpha\n'
+        assert blobs._proc.pid == pid
+    assert blobs._proc is None
+
+
+def test_no_spawn_without_reads():
+    with GitCatFile() as blobs:
+        pass
+    assert blobs._proc is None
@@ -59,6 +59,13 @@ class TestCloneOwnershipCheck:
 class TestGetCurrentGithubUser:
     """Test getting current GitHub user."""
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from ghpr.api import get_current_github_user
+        get_current_github_user.cache_clear()
+        yield
+        get_current_github_user.cache_clear()
+
     @patch('utz.git.gist.get_github_user')
     def test_get_current_user(self, mock_get_github_user):
         """Test getting current GitHub user."""
@@ -70,6 +77,17 @@ class TestGetCurrentGithubUser:
         assert user == 'ryan-williams'
         mock_get_github_user.assert_called_once()
 
+    @patch('utz.git.gist.get_github_user')
+    def test_get_current_user_memoized(self, mock_get_github_user):
+        """Repeat calls reuse the first lookup."""
+        mock_get_github_user.return_value = 'ryan-williams'
+
+        from ghpr.api import get_current_github_user
+        assert get_current_github_user() == 'ryan-williams'
+        assert get_current_github_user() == 'ryan-williams'
+
+        mock_get_github_user.assert_called_once()
+
     @patch('utz.git.gist.get_github_user')
     def test_get_current_user_none(self, mock_get_github_user):
         """Test when current user cannot be determined."""
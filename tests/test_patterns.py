@@ -2,7 +2,7 @@
 
 import pytest
 
-from ghpr.patterns import parse_pr_spec, extract_title_from_first_line
+from ghpr.patterns import COMMENT_FILENAME_PATTERN, parse_pr_spec, extract_title_from_first_line
 
 
 class TestParseProSpec:
@@ -85,3 +85,20 @@ class TestExtractTitleFromFirstLine:
         """Test extracting title with extra whitespace."""
         title = extract_title_from_first_line('  #   Whitespace   Title  ')
         assert title == 'Whitespace   Title'
+
+
+class TestCommentFilenamePattern:
+    """Test matching comment filenames to their IDs."""
+
+    @pytest.mark.parametrize('name,comment_id', [
+        ('z123.md', '123'),
+        ('z123-alice.md', '123'),
+        ('z123-some-bot.md', '123'),
+        ('z-100-00-alice.md', None),  # Review-thread file
+        ('zabc.md', None),
+        ('z123.md.bak', None),
+        ('new.md', None),
+    ])
+    def test_match(self, name, comment_id):
+        match = COMMENT_FILENAME_PATTERN.match(name)
+        assert (match.group(1) if match else None) == comment_id
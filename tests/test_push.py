@@ -0,0 +1,45 @@
+"""Tests for the push command."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ghpr.commands import push as push_mod
+
+
+def test_push_closes_client_and_blobs_on_exit():
+    """`create` and `pull` call `push` in-process, so early exits mustn't leak the socket or `git cat-file`."""
+    with patch.object(push_mod, 'load_pr_config', return_value={}), \
+         patch.object(push_mod, 'get_pr_info_from_path', return_value=('o', 'r', '7')), \
+         patch.object(push_mod, 'read_description_from_git', return_value=(None, None)), \
+         patch.object(push_mod, 'GhClient') as mock_client, \
+         patch.object(push_mod, 'GitCatFile') as mock_blobs, \
+         patch.object(push_mod, 'err'):
+        with pytest.raises(SystemExit):
+            push_mod.push(
+                gist=False, dry_run=False, footer=0, no_footer=False, open_browser=False, images=False,
+                gist_private=None, no_comments=True, force_others=False, item_type='pr',
+            )
+
+    mock_client.return_value.__exit__.assert_called_once()
+    mock_blobs.return_value.__exit__.assert_called_once()
+
+
+def test_sync_to_gist_closes_only_its_own_client():
+    with patch.object(push_mod, 'read_config', return_value=None), \
+         patch.object(push_mod, 'find_gist_remote', return_value='g'), \
+         patch.object(push_mod, 'GhClient') as mock_client, \
+         patch.object(push_mod, 'err'):
+        own = mock_client.return_value.__enter__.return_value
+        own.get.side_effect = RuntimeError('boom')
+        with pytest.raises(RuntimeError):
+            push_mod.sync_to_gist('o', 'r', '7', 'body', pr_config={})
+        mock_client.return_value.__exit__.assert_called_once()
+
+        # A caller's client is left open for its next requests
+        passed = MagicMock()
+        passed.get.side_effect = RuntimeError('boom')
+        with pytest.raises(RuntimeError):
+            push_mod.sync_to_gist('o', 'r', '7', 'body', pr_config={}, client=passed)
+        passed.close.assert_not_called()
+        passed.__exit__.assert_not_called()
@@ -107,3 +107,23 @@ class TestRenderUnifiedDiff:
 
         result = output.getvalue()
         assert 'Only trailing newline differs' in result
+
+    def test_identical_content_renders_nothing(self):
+        """Identical contents produce no output (and skip the diff)."""
+        output = io.StringIO()
+
+        def capture(msg):
+            output.write(msg + '\n')
+
+        with patch('difflib.unified_diff') as mock_diff:
+            render_unified_diff(
+                remote_content='Same content',
+                local_content='Same content',
+                fromfile='remote',
+                tofile='local',
+                use_color=False,
+                log=capture,
+            )
+
+        mock_diff.assert_not_called()
+        assert output.getvalue() == ''